@@ -0,0 +1,77 @@
+"""Time and peak memory of resolving a long chain with the iterative resolver and a recursive reference.
+
+The reference is the recursive implementation the iterative resolver replaced. Run with
+``python -m benchmarks.bench_deep_chain``.
+"""
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from inseminator.dependency import Dependency, StaticDependency
+from inseminator.exceptions import ResolverError
+from inseminator.plan import get_plan
+from inseminator.resolver import Dependable, DependencyResolver
+from inseminator.scoped_dict import ScopedDict
+
+from .graphs import make_chain
+
+LENGTHS = [100, 1000, 5000]
+REPEAT = 5
+
+
+class RecursiveResolver(DependencyResolver):
+    def _construct_plan(self, dependency: Dependable, parameters: Optional[Dict[str, Any]]) -> Dependency:
+        plan = get_plan(dependency)
+        args = self._forced_arguments(dependency, plan, parameters)
+
+        for parameter in plan.parameters:
+            if parameter.name in args:
+                continue
+
+            if parameter.has_default:
+                args[parameter.name] = parameter.default
+            else:
+                try:
+                    args[parameter.name] = self.resolve(parameter.hint).get_instance()
+                except ResolverError as e:
+                    raise ResolverError(f"{dependency} -> " + str(e))
+
+        self._check_missing(dependency, plan, args)
+
+        return StaticDependency(instance=dependency(**args))
+
+
+def measure(resolver_class: Callable[[ScopedDict[Any, Any]], DependencyResolver], root: type) -> Tuple[float, int]:
+    resolver = resolver_class(ScopedDict())
+    resolver.resolve(root)
+    best = min(_timed(resolver, root) for _ in range(REPEAT))
+
+    tracemalloc.start()
+    resolver.resolve(root)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def _timed(resolver: DependencyResolver, root: type) -> float:
+    start = time.perf_counter()
+    resolver.resolve(root)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    # the recursive reference needs a few frames per level
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), max(LENGTHS) * 5))
+
+    for length in LENGTHS:
+        root = make_chain(length)[-1]
+
+        for name, resolver_class in [("recursive", RecursiveResolver), ("iterative", DependencyResolver)]:
+            duration, peak = measure(resolver_class, root)
+            print(f"chain {length:>5}, {name}: {duration * 1e3:7.2f} ms, peak memory {peak / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
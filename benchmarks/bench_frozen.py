@@ -0,0 +1,36 @@
+"""``resolve`` time of a registered dependency in sub-containers and in a frozen container.
+
+Run with ``python -m benchmarks.bench_frozen``.
+"""
+import timeit
+
+from inseminator import Container
+
+DEPTHS = [0, 5, 20]
+NUMBER = 200_000
+
+
+class Service:
+    pass
+
+
+def measure(container: Container) -> float:
+    container.resolve(Service)
+    return min(timeit.repeat(lambda: container.resolve(Service), number=NUMBER, repeat=5)) / NUMBER
+
+
+def main() -> None:
+    for depth in DEPTHS:
+        container = Container()
+        container.register(Service, value=Service())
+
+        for _ in range(depth):
+            container = container.sub_container()
+
+        print(
+            f"depth {depth:>2}: {measure(container) * 1e9:4.0f} ns, frozen: {measure(container.freeze()) * 1e9:4.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
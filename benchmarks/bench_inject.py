@@ -0,0 +1,73 @@
+"""Call overhead of functions injected using ``Container.inject`` compared to calling the bare function.
+
+Run with ``python -m benchmarks.bench_inject``.
+"""
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from inseminator import Container, Depends
+from inseminator.metrics import Metrics
+
+NUMBER = 200_000
+THREADS = 8
+
+
+class Client:
+    pass
+
+
+class Service:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+class NullMetrics(Metrics):
+    def save_metric(self, name: str, time_spent: float) -> None:
+        pass
+
+
+def handler(value: int, service: Service = Depends(Service)) -> int:
+    return value
+
+
+def measure(fn: Callable[..., Any], **kwargs: Any) -> float:
+    fn(1, **kwargs)
+    return min(timeit.repeat(lambda: fn(1, **kwargs), number=NUMBER, repeat=5)) / NUMBER
+
+
+def measure_threads(fn: Callable[..., Any]) -> float:
+    fn(1)
+
+    def run() -> None:
+        for _ in range(NUMBER // THREADS):
+            fn(1)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+
+        def parallel() -> None:
+            for future in [executor.submit(run) for _ in range(THREADS)]:
+                future.result()
+
+        return min(timeit.repeat(parallel, number=1, repeat=5)) / NUMBER
+
+
+def main() -> None:
+    bare = measure(handler, service=Service(Client()))
+    injected = Container().inject(handler)
+    measured = Container(metrics=NullMetrics()).inject(handler)
+    scoped = Container().inject_scoped(handler)
+
+    print(f"bare function:          {bare * 1e9:>7.0f} ns per call")
+
+    for name, fn in [("inject", injected), ("inject with metrics", measured), ("inject_scoped", scoped)]:
+        overhead = measure(fn) - bare
+        print(f"{name + ':':<23} {overhead * 1e9:>7.0f} ns overhead per call")
+
+    overhead = measure(injected, service=Service(Client())) - bare
+    print(f"{'inject with kwargs:':<23} {overhead * 1e9:>7.0f} ns overhead per call")
+    print(f"inject, {THREADS} threads:      {measure_threads(injected) * 1e9:>7.0f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
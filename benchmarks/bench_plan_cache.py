@@ -0,0 +1,41 @@
+"""Resolve time with cold and warm plan cache.
+
+Run with ``python -m benchmarks.bench_plan_cache``.
+"""
+import time
+
+from inseminator import Container
+from inseminator.plan import invalidate_plans
+
+from .graphs import make_layered_graph
+
+# 400 classes, every root expands to a tree of 2 ** 7 leaves
+LAYERS = make_layered_graph(width=50, depth=8, fan_out=2)
+ROUNDS = 5
+
+
+def resolve_roots() -> float:
+    container = Container()
+    t1 = time.perf_counter()
+
+    for root in LAYERS[-1]:
+        container.resolve(root)
+
+    return time.perf_counter() - t1
+
+
+def main() -> None:
+    cold = []
+    warm = []
+
+    for _ in range(ROUNDS):
+        invalidate_plans()
+        cold.append(resolve_roots())
+        warm.append(resolve_roots())
+
+    print(f"cold plan cache: {min(cold) * 1000:.2f} ms")
+    print(f"warm plan cache: {min(warm) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Lookup time in ``ScopedDict`` chains of different depths.
+
+Run with ``python -m benchmarks.bench_scoped_dict``.
+"""
+import timeit
+
+from inseminator.scoped_dict import ScopedDict
+
+DEPTHS = [1, 10, 100]
+NUMBER = 100_000
+
+
+def measure(depth: int) -> float:
+    root: ScopedDict[str, int] = ScopedDict()
+    root["registered"] = 1
+    leaf = root
+
+    for _ in range(depth):
+        leaf = ScopedDict(leaf)
+
+    def lookup() -> None:
+        if "registered" in leaf:
+            leaf["registered"]
+
+        "missing" in leaf
+
+    return min(timeit.repeat(lookup, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main() -> None:
+    for depth in DEPTHS:
+        print(f"depth {depth:>3}: {measure(depth) * 1e9:.0f} ns per resolve-like lookup")
+
+
+if __name__ == "__main__":
+    main()
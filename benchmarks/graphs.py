@@ -0,0 +1,64 @@
+"""Synthetic dependency graphs shaped like ``tests/test_big_dependency_tree.py``."""
+from typing import Any, Dict, List
+
+
+def make_class(name: str, dependencies: List[type]) -> type:
+    """Create a class whose ``__init__`` is type-hinted with the given dependencies.
+
+    :param name: Name of the class.
+    :type name: str
+
+    :param dependencies: Classes requested by the constructor.
+    :type dependencies: List[type]
+
+    :return: The new class.
+    :rtype: type
+    """
+    namespace: Dict[str, Any] = {f"D{i}": dependency for i, dependency in enumerate(dependencies)}
+    arguments = "".join(f", d{i}: D{i}" for i in range(len(dependencies)))
+    exec(f"def __init__(self{arguments}) -> None:\n    pass\n", namespace)
+    return type(name, (), {"__init__": namespace["__init__"]})
+
+
+def make_layered_graph(width: int, depth: int, fan_out: int) -> List[List[type]]:
+    """Create ``width * depth`` classes organised in layers. Every class depends on ``fan_out`` classes of
+    the previous layer, the first layer has no dependencies.
+
+    :param width: Number of classes in a layer.
+    :type width: int
+
+    :param depth: Number of layers.
+    :type depth: int
+
+    :param fan_out: Number of dependencies of a class.
+    :type fan_out: int
+
+    :return: Layers of classes, the last layer contains the roots.
+    :rtype: List[List[type]]
+    """
+    layers: List[List[type]] = [[make_class(f"Leaf{i}", []) for i in range(width)]]
+
+    for level in range(1, depth):
+        previous = layers[-1]
+        layers.append(
+            [make_class(f"Node{level}_{i}", [previous[(i + j) % width] for j in range(fan_out)]) for i in range(width)]
+        )
+
+    return layers
+
+
+def make_chain(length: int) -> List[type]:
+    """Create a chain of classes where each class depends on the previous one.
+
+    :param length: Number of classes.
+    :type length: int
+
+    :return: The chain, the last class is the root.
+    :rtype: List[type]
+    """
+    chain = [make_class("Chain0", [])]
+
+    for i in range(1, length):
+        chain.append(make_class(f"Chain{i}", [chain[-1]]))
+
+    return chain
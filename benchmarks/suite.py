@@ -0,0 +1,341 @@
+"""Benchmark suite with stored baselines.
+
+Every benchmark returns time per operation in seconds. Results are compared with a JSON baseline and
+the run fails if any benchmark is slower than the baseline by more than the threshold.
+
+Run with ``python -m benchmarks.suite``::
+
+    python -m benchmarks.suite --save benchmarks/baseline.json  # store a new baseline
+    python -m benchmarks.suite --threshold 0.25  # compare with benchmarks/baseline.json
+    python -m benchmarks.suite -k inject  # run only benchmarks containing "inject"
+
+Baselines are comparable only when measured on the same machine and Python version, otherwise the comparison
+is skipped with a warning.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from inseminator import Container, Depends
+from inseminator.plan import invalidate_plans
+
+from .graphs import make_layered_graph
+
+#: Benchmark functions by name, filled by the `benchmark` decorator.
+BENCHMARKS: Dict[str, Callable[[], float]] = {}
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.2
+REPEAT = 5
+THREADS = 8
+
+LAYERS = make_layered_graph(width=10, depth=5, fan_out=2)
+ROOT = LAYERS[-1][0]
+
+
+def benchmark(fn: Callable[[], float]) -> Callable[[], float]:
+    BENCHMARKS[fn.__name__] = fn
+    return fn
+
+
+def per_call(fn: Callable[[], Any], number: int, setup: Optional[Callable[[], Any]] = None) -> float:
+    """Return the best time of a single call of the function out of `REPEAT` rounds.
+
+    :param fn: Measured function.
+    :type fn: Callable[[], Any]
+
+    :param number: Number of calls in a round.
+    :type number: int
+
+    :param setup: Function called before every round.
+    :type setup: Callable[[], Any] | None
+
+    :rtype: float
+    """
+    return min(timeit.repeat(fn, setup=setup or (lambda: None), number=number, repeat=REPEAT)) / number
+
+
+class Service:
+    pass
+
+
+def handler(value: int, root: Any = Depends(ROOT)) -> int:
+    return value
+
+
+@benchmark
+def resolve_cold() -> float:
+    return per_call(lambda: Container().resolve(ROOT), number=200)
+
+
+@benchmark
+def resolve_cold_plan_cache() -> float:
+    def resolve() -> None:
+        invalidate_plans()
+        Container().resolve(ROOT)
+
+    return per_call(resolve, number=50)
+
+
+@benchmark
+def resolve_warm() -> float:
+    container = Container()
+    container.resolve(ROOT)
+    return per_call(lambda: container.resolve(ROOT), number=100_000)
+
+
+@benchmark
+def register_value() -> float:
+    container = Container()
+    service = Service()
+    return per_call(lambda: container.register(Service, value=service), number=50_000)
+
+
+def _sub_container(depth: int) -> float:
+    container = Container()
+
+    for _ in range(depth):
+        container = container.sub_container()
+
+    return per_call(container.sub_container, number=20_000)
+
+
+@benchmark
+def sub_container_depth_1() -> float:
+    return _sub_container(1)
+
+
+@benchmark
+def sub_container_depth_10() -> float:
+    return _sub_container(10)
+
+
+@benchmark
+def sub_container_depth_50() -> float:
+    return _sub_container(50)
+
+
+class Request:
+    pass
+
+
+class RequestView:
+    def __init__(self, request: Request, root: ROOT) -> None:  # type: ignore[valid-type]
+        self.request = request
+
+
+@benchmark
+def overlay_create() -> float:
+    container = Container()
+    return per_call(lambda: container.overlay({Request: Request()}), number=100_000)
+
+
+@benchmark
+def sub_container_request() -> float:
+    container = Container()
+    container.resolve(ROOT)
+
+    def handle() -> None:
+        child = container.sub_container()
+        child.register(Request, value=Request())
+        child.resolve(RequestView)
+
+    return per_call(handle, number=2_000)
+
+
+@benchmark
+def overlay_request() -> float:
+    container = Container()
+    container.resolve(ROOT)
+    container.overlay({Request: Request()}).resolve(RequestView)
+    return per_call(lambda: container.overlay({Request: Request()}).resolve(RequestView), number=20_000)
+
+
+@benchmark
+def inject_call_overhead() -> float:
+    injected = Container().inject(handler)
+    injected(1)
+    root = Container().resolve(ROOT)
+    return per_call(lambda: injected(1), number=100_000) - per_call(lambda: handler(1, root), number=100_000)
+
+
+@benchmark
+def inject_scoped_call_overhead() -> float:
+    injected = Container().inject_scoped(handler)
+    injected(1)
+    root = Container().resolve(ROOT)
+    return per_call(lambda: injected(1), number=2_000) - per_call(lambda: handler(1, root), number=2_000)
+
+
+@benchmark
+def preload_injected() -> float:
+    containers: List[Container] = []
+
+    def setup() -> None:
+        container = Container()
+
+        for root in LAYERS[-1]:
+
+            def function(value: int, dependency: Any = Depends(root)) -> int:
+                return value
+
+            container.inject(function)
+
+        containers.append(container)
+
+    return per_call(lambda: containers.pop().preload_injected(), number=1, setup=setup)
+
+
+@benchmark
+def inject_thread_contention() -> float:
+    injected = Container().inject(handler)
+    injected(1)
+    calls = 20_000
+
+    def run() -> None:
+        for _ in range(calls):
+            injected(1)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+
+        def parallel() -> None:
+            for future in [executor.submit(run) for _ in range(THREADS)]:
+                future.result()
+
+        return per_call(parallel, number=1) / (calls * THREADS)
+
+
+def run(names: Sequence[str]) -> Dict[str, float]:
+    """Run benchmarks.
+
+    :param names: Names of the benchmarks.
+    :type names: Sequence[str]
+
+    :return: Time per operation by benchmark name.
+    :rtype: Dict[str, float]
+    """
+    return {name: BENCHMARKS[name]() for name in names}
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[Tuple[str, float, float]]:
+    """Find benchmarks slower than the baseline by more than the threshold.
+
+    Benchmarks missing in the baseline are ignored.
+
+    :param results: Measured times by benchmark name.
+    :type results: Dict[str, float]
+
+    :param baseline: Baseline times by benchmark name.
+    :type baseline: Dict[str, float]
+
+    :param threshold: Allowed relative slowdown, e.g. ``0.2`` for 20 %.
+    :type threshold: float
+
+    :return: Name, measured time and baseline time of every regression.
+    :rtype: List[Tuple[str, float, float]]
+    """
+    return [
+        (name, result, baseline[name])
+        for name, result in results.items()
+        if name in baseline and result > baseline[name] * (1 + threshold)
+    ]
+
+
+def environment() -> Dict[str, str]:
+    """Describe the Python version and the machine the benchmarks run on.
+
+    :rtype: Dict[str, str]
+    """
+    return {"python": platform.python_version(), "machine": platform.machine()}
+
+
+def load_baseline(path: Path) -> Tuple[Dict[str, str], Dict[str, float]]:
+    """Load baseline times stored by `save_baseline`.
+
+    :param path: The baseline file.
+    :type path: Path
+
+    :return: Environment the baseline was measured in (see `environment`) and baseline times by benchmark name.
+    :rtype: Tuple[Dict[str, str], Dict[str, float]]
+    """
+    with path.open() as f:
+        data = json.load(f)
+
+    measured_in = {key: str(data.get(key)) for key in environment()}
+    return measured_in, {name: float(value) for name, value in data["results"].items()}
+
+
+def save_baseline(path: Path, results: Dict[str, float]) -> None:
+    """Store measured times as a baseline.
+
+    :param path: The baseline file.
+    :type path: Path
+
+    :param results: Measured times by benchmark name.
+    :type results: Dict[str, float]
+
+    :rtype: None
+    """
+    data = {**environment(), "results": results}
+
+    with path.open("w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="keyword", default="", help="run only benchmarks containing the keyword")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline to compare with")
+    parser.add_argument("--save", type=Path, help="store the results as a new baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed relative slowdown (default: 0.2)"
+    )
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.keyword in name]
+    baseline: Dict[str, float] = {}
+
+    if args.save is None and args.baseline.exists():
+        measured_in, baseline = load_baseline(args.baseline)
+
+        if measured_in != (current := environment()):
+            stored = ", ".join(f"{key} {value}" for key, value in measured_in.items())
+            running = ", ".join(f"{key} {value}" for key, value in current.items())
+            print(
+                f"warning: baseline measured with {stored}, running with {running}, comparison skipped",
+                file=sys.stderr,
+            )
+            baseline = {}
+
+    results: Dict[str, float] = {}
+
+    for name in names:
+        results.update(run([name]))
+        line = f"{name:<30} {results[name] * 1e6:10.2f} us"
+
+        if name in baseline:
+            line += f" {(results[name] / baseline[name] - 1) * 100:+7.1f} %"
+
+        print(line)
+
+    if args.save is not None:
+        save_baseline(args.save, results)
+        return 0
+
+    if regressions := compare(results, baseline, args.threshold):
+        for name, result, expected in regressions:
+            print(f"regression: {name} {result * 1e6:.2f} us, baseline {expected * 1e6:.2f} us", file=sys.stderr)
+
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,12 @@
 from inseminator import Container, Depends
-from inseminator.integrations import celery_task
+from inseminator.integrations import celery_task, connect_worker_signals
 
 from .celery_factory import celery_factory
 from .domain import DomainLogic
 
 container = Container()
 celery = container.resolve(celery_factory)
+connect_worker_signals(container)
 
 
 @celery_task(celery, container)
@@ -1,4 +1,6 @@
 from .container import Container
 from .decorator import Depends
+from .dependency import Pooled, Scoped, Singleton, ThreadLocal, Transient
+from .lazy import Lazy
 
-__all__ = ["Container", "Depends", "celery_task"]
+__all__ = ["Container", "Depends", "Lazy", "Pooled", "Scoped", "Singleton", "ThreadLocal", "Transient", "celery_task"]
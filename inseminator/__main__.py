@@ -0,0 +1,68 @@
+import argparse
+import importlib
+import sys
+from typing import Any, List, Optional
+
+from .aot import compile_container
+from .container import Container
+from .exceptions import InseminatorError
+
+
+def _import_object(path: str) -> Any:
+    module_name, _, attribute = path.partition(":")
+
+    if not attribute:
+        raise InseminatorError(f"Expected path in format module:attribute, {path} found.")
+
+    value: Any = importlib.import_module(module_name)
+
+    for part in attribute.split("."):
+        value = getattr(value, part)
+
+    return value
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point, run ``python -m inseminator --help`` for the usage.
+
+    :param argv: Command line arguments.
+    :type argv: List[str] | None
+
+    :return: Exit code.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog="python -m inseminator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = subparsers.add_parser("compile", help="Compile a container into a Python module.")
+    compile_parser.add_argument("container", help="Path to the container in format module:attribute.")
+    compile_parser.add_argument("-o", "--output", help="Output file, the module is printed if not specified.")
+    compile_parser.add_argument(
+        "-r", "--root", action="append", default=[], help="Additional dependency to compile (module:attribute)."
+    )
+
+    args = parser.parse_args(argv)
+    sys.path.insert(0, "")
+
+    try:
+        container = _import_object(args.container)
+
+        if not isinstance(container, Container):
+            raise InseminatorError(f"{args.container} is not a Container.")
+
+        source = compile_container(container, [_import_object(root) for root in args.root], args.container)
+    except InseminatorError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w") as f:
+            f.write(source)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""Ahead-of-time compilation of containers.
+
+The compiler walks dependencies of functions injected by the container (and optionally additional roots)
+and writes a plain Python module with a factory for every dependency it can compile. Loading the module
+using `Container.load_compiled` makes the resolver call the factories directly, without any ``inspect``
+or ``typing`` introspection::
+
+    python -m inseminator compile myapp.wiring:container -o myapp/_wiring_compiled.py
+
+The generated module stores a fingerprint of every compiled signature. Fingerprints are computed from
+raw ``__annotations__`` and code objects only so verifying them is cheap, and a module whose signatures
+changed is refused with `StaleCompiledModuleError`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .compiler import Factory, render_factory
+from .exceptions import CompilerError, ResolverError, StaleCompiledModuleError
+from .plan import get_plan
+
+if TYPE_CHECKING:
+    from .container import Container
+
+#: Version of the generated module format.
+AOT_FORMAT = 1
+
+
+def _annotation_name(annotation: Any) -> str:
+    if isinstance(annotation, str):
+        return annotation
+
+    module = getattr(annotation, "__module__", None)
+    qualname = getattr(annotation, "__qualname__", None)
+
+    if module is not None and qualname is not None:
+        return f"{module}.{qualname}"
+
+    return repr(annotation)
+
+
+def fingerprint(dependency: Any) -> str:
+    """Compute fingerprint of the dependency's signature.
+
+    :param dependency: Class or function.
+    :type dependency: Any
+
+    :return: Hex digest of the signature.
+    :rtype: str
+    """
+    target = dependency.__init__ if inspect.isclass(dependency) else dependency
+    parts = [getattr(target, "__qualname__", repr(target))]
+
+    if (code := getattr(target, "__code__", None)) is not None:
+        parts.append(repr(code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]))
+        parts.append(repr(len(target.__defaults__ or ())))
+        parts.append(repr(sorted(target.__kwdefaults__ or ())))
+
+    for name, annotation in getattr(target, "__annotations__", {}).items():
+        parts.append(f"{name}:{_annotation_name(annotation)}")
+
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def import_path(obj: Any) -> Optional[Tuple[str, str]]:
+    """Find module and attribute path under which the object can be imported.
+
+    :param obj: Class, function or ``NewType``.
+    :type obj: Any
+
+    :return: Module name and dotted attribute path or ``None`` if the object is not importable.
+    :rtype: Tuple[str, str] | None
+    """
+    module_name = getattr(obj, "__module__", None)
+
+    if module_name is None or (module := sys.modules.get(module_name)) is None:
+        return None
+
+    qualname = getattr(obj, "__qualname__", None)
+
+    if qualname is not None and "<locals>" not in qualname:
+        value: Any = module
+
+        for part in qualname.split("."):
+            value = getattr(value, part, None)
+
+        if value is obj:
+            return module_name, qualname
+
+    for name, value in vars(module).items():
+        if value is obj:
+            return module_name, name
+
+    return None
+
+
+class _Node:
+    def __init__(self, dependency: Any, is_settings: bool, arguments: List[Tuple[str, Any]]) -> None:
+        self.dependency = dependency
+        self.is_settings = is_settings
+        self.arguments = arguments
+
+
+class AotCompiler:
+    """Generates source code of a module with factories for dependencies reachable from the roots."""
+
+    def __init__(self, container: Container) -> None:
+        """AotCompiler constructor.
+
+        :param container: Container whose registrations are used. Registered dependencies are not compiled,
+            the compiled module looks them up in the container at runtime.
+        :type container: Container
+        """
+        self._container = container
+        self._modules: Dict[str, str] = {}
+        self._nodes: Dict[Any, Optional[_Node]] = {}
+
+    def compile(self, roots: Iterable[Any], source: str = "") -> str:
+        """Compile the roots and their transitive dependencies.
+
+        :param roots: Classes or functions to be compiled.
+        :type roots: Iterable[Any]
+
+        :param source: Description of the compiled container, it is used in the module docstring.
+        :type source: str
+
+        :return: Source code of the compiled module.
+        :rtype: str
+        """
+        for root in roots:
+            self._visit(root)
+
+        nodes = [node for node in self._nodes.values() if node is not None]
+
+        if not nodes:
+            raise CompilerError("Nothing to compile, no importable dependency was found.")
+
+        builders = {node.dependency: f"_build_{i}" for i, node in enumerate(nodes)}
+        functions = []
+
+        for node in nodes:
+            target = self._expression(node.dependency)
+            arguments: List[Tuple[str, str, Optional[str]]] = [
+                (name, self._expression(hint), builders.get(hint)) for name, hint in node.arguments
+            ]
+            prefix = f'str({target}) + " -> "'
+            functions.append(render_factory(builders[node.dependency], target, prefix, arguments))
+
+        lines = [
+            '"""Dependency factories generated by ``python -m inseminator compile'
+            + (f" {source}" if source else "")
+            + "``.",
+            "",
+            "Do not edit. Regenerate the module whenever the wiring or signatures change.",
+            '"""',
+            "",
+        ]
+        lines.extend(f"import {module} as {alias}" for module, alias in self._modules.items())
+        lines.extend(
+            [
+                "",
+                "from inseminator.exceptions import ResolverError as _ResolverError",
+                "",
+                f"AOT_FORMAT = {AOT_FORMAT}",
+                "",
+            ]
+        )
+
+        for function in functions:
+            lines.extend(["", function])
+
+        lines.extend(["", "FACTORIES = {"])
+        lines.extend(f"    {self._expression(node.dependency)}: {builders[node.dependency]}," for node in nodes)
+        lines.extend(["}", "", "FINGERPRINTS = ["])
+        lines.extend(f'    ({self._expression(node.dependency)}, "{fingerprint(node.dependency)}"),' for node in nodes)
+        lines.extend(["]", "", "DEPENDENCIES = {"])
+
+        for node in nodes:
+            hints = "".join(f"{self._expression(hint)}, " for _, hint in node.arguments)
+            lines.append(f"    {self._expression(node.dependency)}: ({hints}),")
+
+        lines.append("}")
+
+        return "\n".join(lines) + "\n"
+
+    def _expression(self, obj: Any) -> str:
+        path = import_path(obj)
+
+        if path is None:
+            raise CompilerError(f"{obj} can't be imported.")
+
+        module, attribute = path
+        alias = self._modules.setdefault(module, f"_m{len(self._modules)}")
+        return f"{alias}.{attribute}"
+
+    def _visit(self, dependency: Any) -> Optional[_Node]:
+        if dependency in self._nodes:
+            return self._nodes[dependency]
+
+        # placeholder, dependencies on the path are compiled to a lookup in the container
+        self._nodes[dependency] = None
+
+        if dependency in self._container._container or import_path(dependency) is None:
+            return None
+
+        try:
+            plan = get_plan(dependency)
+        except (ResolverError, NameError):
+            return None
+
+        if plan.is_protocol or plan.lazy_target is not None or plan.number_of_parameters > len(plan.parameters):
+            return None
+
+        arguments = [(p.name, p.hint) for p in plan.parameters if not p.has_default]
+
+        for _, hint in arguments:
+            self._visit(hint)
+
+            if import_path(hint) is None:
+                return None
+
+        node = _Node(dependency, plan.is_settings, arguments)
+        self._nodes[dependency] = node
+        return node
+
+
+def compile_container(container: Container, roots: Iterable[Any] = (), source: str = "") -> str:
+    """Generate source code of a module with factories for all dependencies of injected functions
+    and of the additional roots.
+
+    :param container: The container.
+    :type container: Container
+
+    :param roots: Additional classes or functions to be compiled.
+    :type roots: Iterable[Any]
+
+    :param source: Description of the compiled container, it is used in the module docstring.
+    :type source: str
+
+    :return: Source code of the compiled module.
+    :rtype: str
+    """
+    injected = [d for resolver in container._decorator_resolvers for d in resolver.get_dependencies()]
+    return AotCompiler(container).compile([*injected, *roots], source)
+
+
+def load(module: ModuleType) -> Dict[Any, Factory]:
+    """Verify the compiled module and return its factories.
+
+    :param module: Module generated by `compile_container`.
+    :type module: ModuleType
+
+    :raises StaleCompiledModuleError: If any of compiled signatures changed.
+
+    :return: Mapping from dependencies to factories.
+    :rtype: Dict[Any, Factory]
+    """
+    if getattr(module, "AOT_FORMAT", None) != AOT_FORMAT:
+        raise CompilerError(f"{module.__name__} is not a compiled module of a supported format.")
+
+    stale = [dependency for dependency, expected in module.FINGERPRINTS if fingerprint(dependency) != expected]
+
+    if stale:
+        names = ", ".join(_annotation_name(dependency) for dependency in stale)
+        raise StaleCompiledModuleError(f"Signatures changed since {module.__name__} was generated: {names}.")
+
+    factories = dict(module.FACTORIES)
+
+    # modules generated by older versions don't list the dependencies, the resolver introspects them instead
+    for dependency, hints in getattr(module, "DEPENDENCIES", {}).items():
+        setattr(factories[dependency], "__dependencies__", hints)
+
+    return factories
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import weakref
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, MutableMapping, Optional, Sequence, Set, Tuple
+
+from .exceptions import ResolverError
+from .plan import get_plan, plan_cache
+
+if TYPE_CHECKING:
+    from .resolver import DependencyResolver
+
+#: Generated factory, it takes the resolver used to look up registered dependencies.
+Factory = Callable[["DependencyResolver"], Any]
+
+#: Generated factories don't call factories of dependencies nested deeper than this limit because calling them
+#: would get close to the recursion limit. Such dependencies are constructed by the resolver using an explicit
+#: stack instead, see `DependencyResolver.construct_interpreted`.
+MAX_COMPILED_DEPTH = 200
+
+
+def render_factory(name: str, target: str, prefix: str, arguments: Sequence[Tuple[str, str, Optional[str]]]) -> str:
+    """Render source code of a factory function.
+
+    The generated function takes the `DependencyResolver` as the only argument. For every argument it first
+    looks up the dependency in the container and if it is not registered it calls the builder, or
+    ``DependencyResolver.resolve`` if there is no builder. ``ResolverError`` raised by a builder is re-raised
+    with the ``prefix`` prepended, the same way the resolver reports the path to the failing dependency.
+
+    :param name: Name of the generated function.
+    :type name: str
+
+    :param target: Expression evaluating to the class or function to be called.
+    :type target: str
+
+    :param prefix: Expression evaluating to the error message prefix.
+    :type prefix: str
+
+    :param arguments: Triples of parameter name, expression evaluating to the dependency and expression
+        evaluating to its builder (or ``None``).
+    :type arguments: Sequence[Tuple[str, str, Optional[str]]]
+
+    :return: The source code.
+    :rtype: str
+    """
+    lines = [f"def {name}(_r):"]
+
+    if arguments:
+        lines.append("    _lookup = _r.lookup")
+        lines.append("    try:")
+
+        for i, (_, key, builder) in enumerate(arguments):
+            fallback = f"_r.resolve({key}).get_instance()" if builder is None else f"{builder}(_r)"
+            lines.append(f"        _d = _lookup({key})")
+            lines.append(f"        _a{i} = _d.get_instance() if _d is not None else {fallback}")
+
+        lines.append("    except _ResolverError as e:")
+        lines.append(f"        raise _ResolverError({prefix} + str(e))")
+
+    call_arguments = ", ".join(f"{parameter_name}=_a{i}" for i, (parameter_name, _, _) in enumerate(arguments))
+    lines.append(f"    return {target}({call_arguments})")
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+class FactoryCompiler:
+    """Generates specialised factory functions for dependencies.
+
+    A generated factory calls constructors directly, arguments are passed as keywords and parameters with
+    default values are omitted. The only work left for runtime is checking whether a dependency is already
+    registered in the container. Factories don't depend on a particular container so they are shared
+    process-wide. Dependencies the compiler can't handle (protocols, forced parameters, missing type hints,
+    cycles) are delegated back to `DependencyResolver.resolve`.
+    """
+
+    def __init__(self) -> None:
+        """FactoryCompiler constructor."""
+        self._factories: MutableMapping[Any, Optional[Factory]] = weakref.WeakKeyDictionary()
+        self._generation = plan_cache.generation
+
+    def get(self, dependency: Any) -> Optional[Factory]:
+        """Return a compiled factory for the dependency, generate it if needed.
+
+        :param dependency: Class or function.
+        :type dependency: Any
+
+        :return: The factory or ``None`` if the dependency can't be compiled.
+        :rtype: Factory | None
+        """
+        if self._generation != plan_cache.generation:
+            self.clear()
+
+        try:
+            return self._factories[dependency]
+        except KeyError:
+            pass
+        except TypeError:
+            return None
+
+        return self._compile(dependency, set(), 0)
+
+    def clear(self) -> None:
+        """Remove all generated factories.
+
+        :rtype: None
+        """
+        self._factories.clear()
+        self._generation = plan_cache.generation
+
+    def _compile(self, dependency: Any, in_progress: Set[Any], depth: int) -> Optional[Factory]:
+        try:
+            return self._factories[dependency]
+        except KeyError:
+            pass
+        except TypeError:
+            return None
+
+        if dependency in in_progress:
+            return None
+
+        in_progress.add(dependency)
+
+        try:
+            factory = self._generate(dependency, in_progress, depth)
+        except Exception:
+            factory = None
+        finally:
+            in_progress.discard(dependency)
+
+        self._factories[dependency] = factory
+        return factory
+
+    def _generate(self, dependency: Any, in_progress: Set[Any], depth: int) -> Optional[Factory]:
+        plan = get_plan(dependency)
+
+        if plan.is_protocol or plan.lazy_target is not None:
+            return None
+
+        namespace: Dict[str, Any] = {
+            "_target": dependency,
+            "_prefix": f"{dependency} -> ",
+            "_ResolverError": ResolverError,
+        }
+        arguments: List[Tuple[str, str, Optional[str]]] = []
+        # number of nested factory calls when the factory is called
+        height = 0
+
+        if not plan.is_settings:
+            if plan.number_of_parameters > len(plan.parameters):
+                # some parameters are not type-hinted, let the resolver report the error
+                return None
+
+            for i, parameter in enumerate(p for p in plan.parameters if not p.has_default):
+                namespace[f"_k{i}"] = parameter.hint
+                child = self._compile(parameter.hint, in_progress, depth + 1) if depth < MAX_COMPILED_DEPTH else None
+
+                if child is not None and getattr(child, "__height__") < MAX_COMPILED_DEPTH:
+                    namespace[f"_f{i}"] = child
+                    height = max(height, getattr(child, "__height__") + 1)
+                elif child is not None or depth >= MAX_COMPILED_DEPTH:
+                    # calling the factory of the child would nest too deep
+                    namespace[f"_f{i}"] = partial(_construct_interpreted, parameter.hint)
+                else:
+                    arguments.append((parameter.name, f"_k{i}", None))
+                    continue
+
+                arguments.append((parameter.name, f"_k{i}", f"_f{i}"))
+
+        source = render_factory("_factory", "_target", "_prefix", arguments)
+        name = getattr(dependency, "__qualname__", repr(dependency))
+        exec(compile(source, f"<inseminator factory {name}>", "exec"), namespace)
+
+        factory: Factory = namespace["_factory"]
+        factory.__qualname__ = f"compiled_factory[{name}]"
+        setattr(factory, "__source__", source)
+        setattr(factory, "__dependencies__", tuple(namespace[key] for _, key, _ in arguments))
+        setattr(factory, "__height__", height)
+        return factory
+
+
+def _construct_interpreted(dependency: Any, resolver: DependencyResolver) -> Any:
+    return resolver.construct_interpreted(dependency)
+
+
+#: Process-wide factory compiler shared by all compiled containers.
+factory_compiler = FactoryCompiler()
+
+
+def compile_factory(dependency: Any) -> Optional[Factory]:
+    """Return a generated factory for the dependency from the process-wide compiler.
+
+    :param dependency: Class or function.
+    :type dependency: Any
+
+    :return: The factory or ``None`` if the dependency can't be compiled.
+    :rtype: Factory | None
+    """
+    return factory_compiler.get(dependency)
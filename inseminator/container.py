@@ -1,12 +1,54 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union, cast
+import gc
+import inspect
+import time
+from concurrent.futures import Executor
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from functools import partial
+from types import ModuleType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from weakref import WeakSet
 
-from .decorator import DecoratorResolver
-from .dependency import Dependency, StaticDependency
-from .exceptions import ContainerRegisterError
-from .metrics import Metrics
-from .resolver import DependencyResolver
+from . import aot, fork
+from .compiler import Factory
+from .decorator import DecoratorResolver, function_name
+from .dependency import (
+    AsyncDependency,
+    Dependency,
+    Lifetime,
+    Pooled,
+    Provider,
+    Recipe,
+    Scoped,
+    Singleton,
+    StaticDependency,
+    ThreadLocal,
+    Transient,
+)
+from .exceptions import ContainerFrozenError, ContainerRegisterError, ResolverError
+from .graph import DependencyGraph
+from .metrics import Metrics, ResolutionListener
+from .parallel import ParallelBuilder
+from .preload import PreloadHandle, preload_parallel, start_preload
+from .resolver import DependencyResolver, OverlayResolver
+from .scope import Scope, activate_scope, deactivate_scope, get_current_scope
 from .scoped_dict import ScopedDict
 
 T = TypeVar("T")
@@ -14,6 +56,34 @@ T = TypeVar("T")
 #: Functions returning an instance implemeting T or a class that implements T
 Dependable = Union[Callable[..., Any], Any]
 
+_MISSING: Any = object()
+
+
+def _build(target: Any, parameters: Optional[Dict[str, Any]], construct: bool, resolver: DependencyResolver) -> Any:
+    if not parameters and (scope := get_current_scope()) is not None:
+        # reuse dependencies shared between scopes
+        if construct:
+            return resolver.construct_scoped(target, scope.shared)
+
+        return resolver.resolve_scoped(target, scope.shared)
+
+    if construct:
+        return resolver.construct(target, parameters).get_instance()
+
+    return resolver.resolve(target, parameters).get_instance()
+
+
+def _enter(recipe: Recipe, per_scope: bool, managed: List[ExitStack], resolver: DependencyResolver) -> Any:
+    manager = recipe(resolver)
+
+    if per_scope and (scope := get_current_scope()) is not None:
+        return scope.enter_context(manager)
+
+    # every instance gets its own stack, so `Container.invalidate` can run its teardown alone
+    stack = resolver.exit_stack.enter_context(ExitStack())
+    managed.append(stack)
+    return stack.enter_context(manager)
+
 
 class Container:
     """`Container` provides functionality to register and resolve class instances."""
@@ -22,6 +92,9 @@ class Container:
         self,
         parent_scoped_dict: Optional[ScopedDict[Dependable, Dependency]] = None,
         metrics: Optional[Metrics] = None,
+        compiled: bool = False,
+        factories: Optional[Dict[Dependable, Factory]] = None,
+        listener: Optional[ResolutionListener] = None,
     ) -> None:
         """Container constructor.
 
@@ -30,11 +103,42 @@ class Container:
 
         :param metrics: Metrics instance to be used in the DecoratorResolver.
         :type metrics: Metrics | None
+
+        :param compiled: If set to ``True``, dependencies are constructed using generated factories which call
+            constructors directly instead of interpreting type hints during every resolution.
+        :type compiled: bool
+
+        :param factories: Ahead-of-time compiled factories shared with the parent container.
+        :type factories: Dict[Dependable, Factory] | None
+
+        :param listener: Listener notified about every dependency constructed or taken from the container,
+            see `ResolutionListener`. Sub-containers inherit the listener.
+        :type listener: ResolutionListener | None
         """
         self._container: ScopedDict[Dependable, Dependency] = ScopedDict(parent_scoped_dict)
-        self._resolver = DependencyResolver(self._container)
+        self._compiled = compiled
+        self._factories: Dict[Dependable, Factory] = factories if factories is not None else {}
+        self._listener = listener
+        # recipes of eagerly constructed dependencies, constructed again on the first request after `invalidate`
+        # or fork
+        self._eager: Dict[Dependable, Recipe] = {}
+        self._resolver = DependencyResolver(
+            self._container, compiled=compiled, factories=self._factories, listener=listener, recipes=self._eager
+        )
         self._metrics = metrics
         self._decorator_resolvers: List[DecoratorResolver] = []
+        # dependencies constructed again after fork
+        self._fork_unsafe: Set[Dependable] = set()
+        # dependencies registered by `aresolve`, they may require async dependencies so `invalidate` removes
+        # them instead of constructing them again using a recipe
+        self._awaited: Set[Dependable] = set()
+        # dependencies shared between scopes opened using `scope`
+        self._shared: Dict[Any, Any] = {}
+        # exit stacks of instances constructed by generator and context-manager factories outside of any scope
+        self._managed: Dict[Dependable, List[ExitStack]] = {}
+        # sub-containers, created with the first one
+        self._children: Optional[WeakSet[Container]] = None
+        fork.track(self)
 
     def set_metrics(self, metrics: Metrics) -> None:
         """Set `Metrics` objects to be used to report metrics.
@@ -46,13 +150,33 @@ class Container:
         """
         self._metrics = metrics
 
+        for dependency, registered in self._container.items():
+            if isinstance(registered, Pooled):
+                registered.set_metrics(metrics, function_name(dependency))
+
+    def set_listener(self, listener: Optional[ResolutionListener]) -> None:
+        """Set `ResolutionListener` to be notified about resolved dependencies, ``None`` removes the listener.
+
+        Only sub-containers created afterwards inherit the listener.
+
+        :param listener: The listener.
+        :type listener: ResolutionListener | None
+
+        :rtype: None
+        """
+        self._listener = listener
+        self._resolver._listener = listener
+
     def register(
         self,
         dependency: Type[T],
         *,
         value: Optional[T] = None,
-        factory: Optional[Callable[..., T]] = None,
+        factory: Optional[Callable[..., Union[T, Awaitable[T], Iterator[T], ContextManager[T]]]] = None,
         parameters: Optional[Dict[str, Any]] = None,
+        lifetime: Optional[Lifetime] = None,
+        fork_safe: bool = True,
+        eager: bool = False,
     ) -> None:
         """Register value of factory function / class to be used when dependency of type T is needed.
 
@@ -95,6 +219,12 @@ class Container:
             container = Container()
             container.register(MyInterface, factory=create_implementation)
 
+        Without ``lifetime``, the dependency is constructed on the first request and shared, i.e. the same as
+        with the `Singleton` lifetime. Other lifetime providers decide when it is constructed: `Scoped` once per
+        sub-container or per call of a function injected using `inject_scoped` and `Transient` on every request.::
+
+            container = Container()
+            container.register(MyInterface, factory=MyImplementation, lifetime=Transient)
 
         :param dependency: Type to be registered.
         :type dependency: Type[T]
@@ -102,12 +232,27 @@ class Container:
         :param value: Instance of type T to be provided when Type[T] is required.
         :type value: T
 
-        :param factory: A function that returns instance of T or class that implements T.
-        :type factory: Callable[..., T] | Type[T]
+        :param factory: A function that returns instance of T or class that implements T. ``async def`` factories
+            are constructed on the first `aresolve`. Generator functions and functions decorated using
+            ``contextlib.contextmanager`` provide the yielded value, the code after ``yield`` runs when the container
+            is closed or, for `Scoped` and `Transient` lifetimes, at the end of the scope.
+        :type factory: Callable[..., T] | Callable[..., Awaitable[T]] | Callable[..., Iterator[T]] | Type[T]
 
         :param parameters: Mapping specifying parameters to be forcefully used when resolving T.
         :type parameters: Dict[str, Any]
 
+        :param lifetime: Provider class or configured provider deciding when the dependency is constructed.
+        :type lifetime: Type[Provider] | Provider | None
+
+        :param fork_safe: If set to ``False``, the dependency is constructed again in every child process after
+            ``fork`` (on the first request), e.g. because it holds a socket or a lock. Registered dependencies
+            and functions injected with the dependency are reset too.
+        :type fork_safe: bool
+
+        :param eager: If set to ``True``, the dependency is constructed immediately instead of on the first request,
+            e.g. to warm it up during the start of an application. It can't be combined with ``lifetime``.
+        :type eager: bool
+
         :rtype: None
         """
         resolved_dependency: Dependency
@@ -115,12 +260,73 @@ class Container:
         if value is not None and factory is not None:
             raise ContainerRegisterError("Can't decide whether to use factory or value for dependency instantiation")
 
-        if value is not None:
+        if lifetime is not None and value is not None:
+            raise ContainerRegisterError("Lifetime can't be specified for a value")
+
+        if lifetime is not None and eager:
+            raise ContainerRegisterError("Lifetime can't be specified for an eagerly constructed dependency")
+
+        if lifetime is not None and factory is not None and inspect.iscoroutinefunction(factory):
+            raise ContainerRegisterError("Lifetime can't be specified for an async factory")
+
+        if not fork_safe and value is not None:
+            raise ContainerRegisterError("A value can't be constructed again after fork, register a factory instead")
+
+        if not fork_safe and factory is not None and inspect.iscoroutinefunction(factory):
+            raise ContainerRegisterError("An async factory can't be constructed again after fork")
+
+        provider = lifetime() if isinstance(lifetime, type) else lifetime
+
+        if provider is None and value is None and not eager and not inspect.iscoroutinefunction(factory):
+            provider = Singleton()
+
+        target = factory if factory is not None else dependency
+        # the dependency itself must be constructed, resolving it would return this registration
+        recipe: Recipe = partial(_build, target, parameters, target is dependency)
+
+        if managed := factory is not None and inspect.isgeneratorfunction(inspect.unwrap(factory)):
+            if inspect.isgeneratorfunction(factory):
+                target = contextmanager(factory)
+                recipe = partial(_build, target, parameters, False)
+
+            per_scope = isinstance(provider, (Scoped, ThreadLocal, Transient))
+            recipe = partial(_enter, recipe, per_scope, self._managed.setdefault(dependency, []))
+
+        if target is not dependency:
+            self._resolver.record_dependent(target, dependency)
+
+        if provider is not None:
+            self._resolver.record_target(dependency, factory if factory is not None else dependency, parameters)
+            resolved_dependency = provider.bind(recipe, self._resolver)
+
+            if isinstance(resolved_dependency, Pooled):
+                resolved_dependency.set_metrics(self._metrics, function_name(dependency))
+        elif value is not None:
             resolved_dependency = StaticDependency(value)
-        elif factory is not None:
-            resolved_dependency = self._resolver.resolve(factory, parameters)
+        elif factory is not None and inspect.iscoroutinefunction(factory):
+            resolved_dependency = AsyncDependency(partial(self._aconstruct, factory, parameters))
+        else:
+            try:
+                if managed:
+                    resolved_dependency = StaticDependency(recipe(self._resolver))
+                else:
+                    resolved_dependency = self._resolver.resolve(target, parameters)
+            except RecursionError:
+                # report the cycle instead if there is one
+                self.graph(target, **(parameters or {})).check()
+                raise
+
+        if isinstance(resolved_dependency, StaticDependency) and value is None:
+            self._eager[dependency] = recipe
+        else:
+            self._eager.pop(dependency, None)
+
+        self._awaited.discard(dependency)
+
+        if not fork_safe:
+            self._fork_unsafe.add(dependency)
         else:
-            resolved_dependency = self._resolver.resolve(dependency, parameters)
+            self._fork_unsafe.discard(dependency)
 
         self._container[dependency] = resolved_dependency
 
@@ -134,10 +340,146 @@ class Container:
         :return: Instance of type T.
         :rtype: T
         """
-        if dependency not in self._container:
-            self.register(dependency, parameters=parameters)
+        if (registered := self._resolver.lookup(dependency)) is None:
+            if not parameters and (scope := get_current_scope()) is not None and self._resolver.is_scoped(dependency):
+                # registering it would leak instances of the scope
+                return cast(T, self._resolver.construct_scoped(dependency, scope.shared))
+
+            if not parameters and (instance := self._shared.get(dependency, _MISSING)) is not _MISSING:
+                # already constructed for injected functions, the registration shares the instance with them
+                registered = StaticDependency(instance)
+                self._container[dependency] = registered
+                self._eager[dependency] = partial(_build, dependency, None, True)
+                return cast(T, instance)
+
+            self.register(dependency, parameters=parameters, eager=True)
+            registered = self._container[dependency]
+        elif self._listener is not None:
+            self._resolver._observe_registered(dependency, registered, time.perf_counter())
+
+        return cast(T, registered.get_instance())
+
+    def graph(self, dependency: Dependable, **parameters: Dependable) -> DependencyGraph:
+        """Compute the dependency graph of the dependency without constructing anything.
+
+        Example checking the wiring during the start of an application::
+
+            graph = container.graph(Application)
+            graph.check()  # raises ResolverError if there is a cycle
+
+            for dependency in graph.topological_order():
+                print(dependency, graph.fan_in(dependency), graph.fan_out(dependency))
+
+        :param dependency: The root of the graph.
+        :type dependency: Dependable
+
+        :keyword parameters: Keyword arguments specifying parameters to be forcefully used when resolving
+            the dependency.
+
+        :raises ResolverError: If a protocol has no implementation or a type hint is missing.
+
+        :return: The dependency graph.
+        :rtype: DependencyGraph
+        """
+        return DependencyGraph(self._resolver, [dependency], parameters)
+
+    def resolve_parallel(self, dependency: Type[T], executor: Executor, **parameters: Dependable) -> T:
+        """Resolve the dependency, independent dependencies in its graph are constructed in parallel using
+        the executor. Every dependency in the graph is constructed only once.
+
+        :param dependency: Type to be registered.
+        :type dependency: Type[T]
+
+        :param executor: Executor running the constructors, e.g. ``ThreadPoolExecutor``.
+        :type executor: Executor
+
+        :keyword parameters: Keyword arguments specifying parameters to be forcefully used when resolving T.
+
+        :return: Instance of type T.
+        :rtype: T
+        """
+        if (registered := self._resolver.lookup(dependency)) is None:
+            instance = ParallelBuilder(self._resolver, executor).build([dependency], parameters)[dependency]
+            registered = StaticDependency(instance)
+            self._container[dependency] = registered
+            # `invalidate` constructs it again on the first request, like a dependency registered by `resolve`
+            self._eager[dependency] = partial(_build, dependency, parameters, True)
+        elif self._listener is not None:
+            self._resolver._observe_registered(dependency, registered, time.perf_counter())
+
+        return cast(T, registered.get_instance())
 
-        return cast(T, self._container[dependency].get_instance())
+    async def aresolve(self, dependency: Type[T], **parameters: Dependable) -> T:
+        """Asynchronous version of `resolve`. Dependencies registered with ``async def`` factories are awaited
+        and independent dependencies are resolved concurrently.
+
+        :param dependency: Type to be registered.
+        :type dependency: Type[T]
+
+        :keyword parameters: Keyword arguments specifying parameters to be forcefully used when resolving T.
+
+        :return: Instance of type T.
+        :rtype: T
+        """
+        if (registered := self._resolver.lookup(dependency)) is None:
+            registered = await self._resolver.aresolve(dependency, parameters)
+
+            if get_current_scope() is not None and self._resolver.is_scoped(dependency):
+                return cast(T, registered.get_instance())
+
+            self._container[dependency] = registered
+            self._awaited.add(dependency)
+        elif self._listener is not None or isinstance(registered, (AsyncDependency, Provider)):
+            # the resolver awaits async dependencies and reports the resolution
+            registered = await self._resolver.aresolve(dependency)
+
+        return cast(T, registered.get_instance())
+
+    async def _aconstruct(self, factory: Callable[..., Any], parameters: Optional[Dict[str, Any]]) -> Any:
+        return (await self._resolver.aresolve(factory, parameters)).get_instance()
+
+    @contextmanager
+    def scope(self) -> Iterator[Scope]:
+        """Activate a new scope for the current context. `Scoped` dependencies resolved within the ``with``
+        block, including functions injected using `inject_scoped` and tasks spawned from the block, are
+        constructed once per scope. Teardown of generator and context-manager factories constructed in the scope
+        runs when the block exits.
+
+        Example::
+
+            container.register(UnitOfWork, lifetime=Scoped)
+
+            with container.scope():
+                assert container.resolve(UnitOfWork) is container.resolve(UnitOfWork)
+
+        :return: The active scope.
+        :rtype: Iterator[Scope]
+        """
+        scope = Scope(self._shared)
+        token = activate_scope(scope)
+
+        try:
+            yield scope
+        finally:
+            try:
+                scope.close()
+            finally:
+                deactivate_scope(token)
+
+    @asynccontextmanager
+    async def ascope(self) -> AsyncIterator[Scope]:
+        """Asynchronous version of `scope`, e.g. for a request handled by an asyncio service::
+
+            async def handle(request: Request) -> Response:
+                async with container.ascope():
+                    service = await container.aresolve(Service)
+                    return await service.handle(request)
+
+        :return: The active scope.
+        :rtype: AsyncIterator[Scope]
+        """
+        with self.scope() as scope:
+            yield scope
 
     def sub_container(self) -> Container:
         """Creates a new child container. The inner container is passed as a `parent_scoped_dict` constructor parameter.
@@ -145,7 +487,17 @@ class Container:
         :return: New container.
         :rtype: Container
         """
-        return Container(parent_scoped_dict=self._container)
+        container = Container(
+            parent_scoped_dict=self._container,
+            compiled=self._compiled,
+            factories=self._factories,
+            listener=self._listener,
+        )
+        if self._children is None:
+            self._children = WeakSet()
+
+        self._children.add(container)
+        return container
 
     def inject(self, fn: Callable[..., T]) -> Callable[..., T]:
         """Lazily injects parameters into a function. Injected objects **are cached**.
@@ -156,7 +508,7 @@ class Container:
         :return: Functions that have injected parameters when invoked.
         :rtype: Callable[..., T]
         """
-        decorator_resolver = DecoratorResolver(resolver=self._resolver, metrics=self._metrics)
+        decorator_resolver = DecoratorResolver(resolver=self._resolver, metrics=self._metrics, shared=self._shared)
         self._decorator_resolvers.append(decorator_resolver)
         return decorator_resolver.inject_function(fn)
 
@@ -164,30 +516,513 @@ class Container:
         """Lazily injects parameters into a function. Injected objects **are not cached** and are recreated
         during every invocation of the function.
 
+        Every invocation is a new scope. Dependencies registered as `Scoped` are constructed once per invocation
+        and `Transient` ones on every request. Other dependencies of the injected objects are constructed only
+        once and shared between invocations unless they depend on a scoped dependency themselves. They are
+        the same instances as the ones returned by `resolve` and injected into functions using `inject`.
+
         :param fn: Function to be injected.
         :type fn: Callable[..., T]
 
         :return: Functions that have injected parameters when invoked.
         :rtype: Callable[..., T]
         """
-        decorator_resolver = DecoratorResolver(resolver=self._resolver, metrics=self._metrics, cache_enabled=False)
+        decorator_resolver = DecoratorResolver(
+            resolver=self._resolver, metrics=self._metrics, cache_enabled=False, shared=self._shared
+        )
         self._decorator_resolvers.append(decorator_resolver)
         return decorator_resolver.inject_function(fn)
 
+    def load_compiled(self, module: ModuleType) -> None:
+        """Use factories from a module generated by ``python -m inseminator compile``.
+
+        Dependencies compiled in the module are constructed without any introspection. The container
+        and all its sub-containers share the factories.
+
+        :param module: The compiled module.
+        :type module: ModuleType
+
+        :raises StaleCompiledModuleError: If any compiled signature changed since the module was generated.
+
+        :rtype: None
+        """
+        self._factories.update(aot.load(module))
+
+    def overlay(self, overrides: Optional[Dict[Dependable, Any]] = None) -> OverlayContainer:
+        """Create a lightweight child container storing only the overridden values, e.g. for every request.
+
+        Unlike `sub_container`, the overlay doesn't allocate its own registry and resolver. Dependencies
+        which don't depend on any of the overrides are resolved by this container, so they are constructed
+        only once and shared by all overlays.
+
+        Example::
+
+            @app.route("/")
+            def index(request: Request) -> Response:
+                return container.overlay({Request: request}).resolve(IndexView).render()
+
+        :param overrides: Values of overridden dependencies.
+        :type overrides: Dict[Dependable, Any] | None
+
+        :return: The overlay container.
+        :rtype: OverlayContainer
+        """
+        return OverlayContainer(self, overrides)
+
+    def freeze(self) -> FrozenContainer:
+        """Create an immutable snapshot of the container for production use.
+
+        Registrations of the container and all its parents are copied into a single table. The frozen
+        container resolves only registered dependencies, it never registers anything itself and
+        `register` raises `ContainerFrozenError`. Already constructed instances are copied into the snapshot,
+        other providers are copied and construct their own instances. Later changes of this container,
+        including `invalidate`, don't affect the snapshot.
+
+        Example::
+
+            container = build_container()
+            frozen = container.freeze()
+            frozen.resolve(MyInterface)  # a single dictionary lookup
+
+        :return: The frozen container.
+        :rtype: FrozenContainer
+        """
+        return FrozenContainer(
+            self._container.flatten(),
+            metrics=self._metrics,
+            compiled=self._compiled,
+            factories=self._factories,
+            listener=self._listener,
+        )
+
+    def close(self) -> None:
+        """Run the teardown of dependencies created by generator and context-manager factories in reverse order
+        of their construction, then clear the container (see `clear`).
+
+        Example::
+
+            def create_connection(config: Config) -> Iterator[Connection]:
+                connection = Connection(config.url)
+                yield connection
+                connection.close()
+
+            container.register(Connection, factory=create_connection)
+            ...
+            container.close()  # closes the connection
+
+        :rtype: None
+        """
+        try:
+            self._resolver.exit_stack.close()
+        finally:
+            self.clear()
+
     def clear(self) -> None:
         """Clear all cached objects. Also clear all resolved objects for injected functions.
 
         :rtype: None
         """
         self._container.clear()
+        self._shared.clear()
+        self._eager.clear()
+        self._awaited.clear()
+        self._managed.clear()
+        self._resolver.clear_dependents()
 
         for decorator_resolve in self._decorator_resolvers:
             decorator_resolve.clear_cache()
 
-    def preload_injected(self) -> None:
+    def invalidate(self, dependency: Dependable) -> None:
+        """Forget constructed instances of the dependency and of all dependencies constructed using it, directly
+        or transitively, e.g. after a credential was rotated. Other constructed dependencies are kept.
+
+        Registered values are kept, other registrations of this container and of its sub-containers are
+        constructed again on the first request. Teardown of the forgotten instances created by generator and
+        context-manager factories runs immediately. Injected functions requesting any of the invalidated
+        dependencies resolve them again on the next call.
+
+        Example::
+
+            container.register(Credentials, value=rotated_credentials)
+            container.invalidate(Credentials)  # clients using the credentials are constructed again
+
+        :param dependency: The invalidated dependency.
+        :type dependency: Dependable
+
+        :rtype: None
+        """
+        self._invalidate_all({dependency}, teardown=True)
+
+    def _invalidate_all(
+        self, dependencies: Set[Dependable], teardown: bool
+    ) -> List[Tuple[Dependable, Dependency, Dependency]]:
+        # the dependency, the previous and the new registration
+        reset: List[Tuple[Dependable, Dependency, Dependency]] = []
+        # sub-containers are invalidated too, their registrations may be constructed using the dependencies
+        containers: List[Tuple[Container, Set[Dependable]]] = [(self, dependencies)]
+
+        while containers:
+            container, invalidated = containers.pop()
+            reset.extend(container._invalidate(invalidated, teardown))
+            containers.extend((child, set(invalidated)) for child in container._children or ())
+
+        return reset
+
+    def _invalidate(
+        self, invalidated: Set[Dependable], teardown: bool
+    ) -> List[Tuple[Dependable, Dependency, Dependency]]:
+        reset: List[Tuple[Dependable, Dependency, Dependency]] = []
+
+        for dependency in list(invalidated):
+            invalidated.update(self._resolver.dependents(dependency))
+
+        for invalid in invalidated:
+            self._shared.pop(invalid, None)
+
+            # only registrations of this container, not of its parents
+            if (registered := dict.get(self._container, invalid)) is None:
+                continue
+
+            if isinstance(registered, Provider):
+                if teardown:
+                    registered.reset()
+                else:
+                    registered.detach()
+
+                reset.append((invalid, registered, registered))
+            elif (recipe := self._eager.get(invalid)) is not None:
+                self._container[invalid] = Singleton().bind(recipe, self._resolver)
+                reset.append((invalid, registered, self._container[invalid]))
+            elif invalid in self._awaited:
+                self._awaited.discard(invalid)
+                del self._container[invalid]
+
+            # teardown of the forgotten instances
+            while teardown and (stacks := self._managed.get(invalid)):
+                stacks.pop().close()
+
+        for decorator_resolve in self._decorator_resolvers:
+            if any(requested in invalidated for requested in decorator_resolve.get_dependencies()):
+                decorator_resolve.clear_cache(teardown)
+
+        return reset
+
+    def preload_injected(self, executor: Optional[Executor] = None, gc_freeze: bool = False) -> None:
         """Resolve all objects for injected functions.
 
+        :param executor: If specified, the dependency graph of all injected functions is computed first
+            and independent dependencies are constructed in parallel using the executor.
+        :type executor: Executor | None
+
+        :param gc_freeze: If set to ``True``, all objects are moved to the permanent generation of the garbage
+            collector using ``gc.freeze()`` afterwards. Worker processes forked from a pre-fork server then
+            don't write to memory pages of the preloaded objects during garbage collection.
+        :type gc_freeze: bool
+
+        :rtype: None
+        """
+        if executor is not None:
+            preload_parallel(self._resolver, self._decorator_resolvers, executor)
+        else:
+            for decorator_resolve in self._decorator_resolvers:
+                decorator_resolve.preload()
+
+        if gc_freeze:
+            gc.freeze()
+
+    def preload_injected_background(self, executor: Optional[Executor] = None) -> PreloadHandle:
+        """Resolve all objects for injected functions in a background thread, the method doesn't block.
+
+        :param executor: If specified, independent dependencies of all injected functions are constructed
+            in parallel using the executor.
+        :type executor: Executor | None
+
+        :return: Handle reporting the progress and errors of the preload.
+        :rtype: PreloadHandle
+        """
+        return start_preload(self._resolver, self._decorator_resolvers, executor)
+
+    def _reset_after_fork(self) -> List[Tuple[Dependable, Dependency, Dependency]]:
+        # locks held by other threads of the parent process at the time of fork would never be released
+        self._resolver.reset_lock()
+
+        for registered in dict.values(self._container):
+            if isinstance(registered, Provider):
+                registered.reset_lock()
+
+        if not self._fork_unsafe:
+            return []
+
+        # registered dependencies constructed using the reset ones are reset too, the parent process still uses
+        # the instances so their teardown doesn't run
+        return self._invalidate_all(set(self._fork_unsafe), teardown=False)
+
+    def _reset_injected_after_fork(self, reset: List[Tuple[Dependable, Dependency, Dependency]]) -> None:
+        for decorator_resolve in self._decorator_resolvers:
+            decorator_resolve.reset_lock()
+
+            if not reset:
+                continue
+
+            try:
+                graph = DependencyGraph(self._resolver, decorator_resolve.get_dependencies())
+            except ResolverError:
+                decorator_resolve.clear_cache(teardown=False)
+                continue
+
+            if any(dependency in graph for dependency, _, _ in reset):
+                decorator_resolve.clear_cache(teardown=False)
+
+
+class FrozenContainer(Container):
+    """Immutable container created by `Container.freeze`.
+
+    Registered instances are stored in a flat table, so `resolve` costs a single dictionary lookup without
+    taking any lock. Dependencies which are not registered are not resolved, except the ones constructed
+    for injected functions. `Scoped` dependencies are constructed once for the frozen container.
+    """
+
+    def __init__(
+        self,
+        registrations: Dict[Dependable, Dependency],
+        metrics: Optional[Metrics] = None,
+        compiled: bool = False,
+        factories: Optional[Dict[Dependable, Factory]] = None,
+        listener: Optional[ResolutionListener] = None,
+    ) -> None:
+        """FrozenContainer constructor.
+
+        :param registrations: Registered dependencies.
+        :type registrations: Dict[Dependable, Dependency]
+
+        :param metrics: Metrics instance to be used in the DecoratorResolver.
+        :type metrics: Metrics | None
+
+        :param compiled: If set to ``True``, dependencies of injected functions are constructed using generated
+            factories.
+        :type compiled: bool
+
+        :param factories: Ahead-of-time compiled factories.
+        :type factories: Dict[Dependable, Factory] | None
+
+        :param listener: Listener notified about resolved dependencies.
+        :type listener: ResolutionListener | None
+        """
+        super().__init__(metrics=metrics, compiled=compiled, factories=factories, listener=listener)
+        self._instances: Dict[Dependable, Any] = {}
+        self._providers: Dict[Dependable, Dependency] = {}
+        # registrations of the source containers the entries were copied from
+        self._sources = dict(registrations)
+
+        for dependency, registered in registrations.items():
+            if isinstance(registered, StaticDependency):
+                self._instances[dependency] = registered.get_instance()
+            elif (
+                isinstance(registered, Singleton) and not isinstance(registered, Scoped) and registered.is_constructed()
+            ):
+                self._instances[dependency] = registered.get_instance()
+                registered = StaticDependency(self._instances[dependency])
+            elif isinstance(registered, Provider):
+                registered = self._copy(dependency, registered)
+                self._providers[dependency] = registered
+            else:
+                self._providers[dependency] = registered
+
+            self._container[dependency] = registered
+
+    def register(
+        self,
+        dependency: Type[T],
+        *,
+        value: Optional[T] = None,
+        factory: Optional[Callable[..., Union[T, Awaitable[T], Iterator[T], ContextManager[T]]]] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        lifetime: Optional[Lifetime] = None,
+        fork_safe: bool = True,
+        eager: bool = False,
+    ) -> None:
+        """Frozen container can't be modified.
+
+        :raises ContainerFrozenError: Always.
+        """
+        raise ContainerFrozenError(f"Can't register {dependency}, the container is frozen.")
+
+    def resolve(self, dependency: Type[T], **parameters: Dependable) -> T:
+        """Return the registered dependency.
+
+        :param dependency: Registered type.
+        :type dependency: Type[T]
+
+        :keyword parameters: Not supported, the frozen container doesn't construct anything.
+
+        :raises ResolverError: If the dependency is not registered or parameters are specified.
+
+        :return: Instance of type T.
+        :rtype: T
+        """
+        if parameters:
+            raise ResolverError(f"Parameters can't be forced when resolving {dependency} in a frozen container.")
+
+        if self._listener is not None:
+            return cast(T, self._resolve_registered(dependency).get_instance())
+
+        try:
+            return cast(T, self._instances[dependency])
+        except KeyError:
+            return cast(T, self._resolve_registered(dependency).get_instance())
+
+    def resolve_parallel(self, dependency: Type[T], executor: Executor, **parameters: Dependable) -> T:
+        """Same as `resolve`, registered dependencies are already constructed or provided by their lifetime.
+
+        :raises ResolverError: If the dependency is not registered or parameters are specified.
+        """
+        return self.resolve(dependency, **parameters)
+
+    async def aresolve(self, dependency: Type[T], **parameters: Dependable) -> T:
+        """Asynchronous version of `resolve`, dependencies registered with ``async def`` factories are awaited.
+
+        :raises ResolverError: If the dependency is not registered or parameters are specified.
+        """
+        if not parameters and isinstance(self._providers.get(dependency), (AsyncDependency, Provider)):
+            # the resolver awaits async dependencies and reports the resolution
+            return cast(T, (await self._resolver.aresolve(dependency)).get_instance())
+
+        return self.resolve(dependency, **parameters)
+
+    def invalidate(self, dependency: Dependable) -> None:
+        """Frozen container can't be modified.
+
+        :raises ContainerFrozenError: Always.
+        """
+        raise ContainerFrozenError(f"Can't invalidate {dependency}, the container is frozen.")
+
+    def load_compiled(self, module: ModuleType) -> None:
+        """Frozen container can't be modified.
+
+        :raises ContainerFrozenError: Always.
+        """
+        raise ContainerFrozenError("Can't load compiled factories, the container is frozen.")
+
+    def clear(self) -> None:
+        """Clear resolved objects for injected functions, registered dependencies are kept.
+
         :rtype: None
         """
+        self._shared.clear()
+
         for decorator_resolve in self._decorator_resolvers:
-            decorator_resolve.preload()
+            decorator_resolve.clear_cache()
+
+    def _reset_injected_after_fork(self, reset: List[Tuple[Dependable, Dependency, Dependency]]) -> None:
+        if reset:
+            # dependencies shared between scopes may be constructed using the reset ones
+            self._shared.clear()
+
+        for dependency, previous, registered in reset:
+            # the entry was copied from the reset registration
+            if self._sources.get(dependency) is previous:
+                self._instances.pop(dependency, None)
+                self._providers[dependency] = self._container[dependency] = registered
+                self._sources[dependency] = registered
+
+        super()._reset_injected_after_fork(reset)
+
+    def _copy(self, dependency: Dependable, provider: Provider) -> Provider:
+        # the copy constructs its own instances, so they are not affected by `invalidate` of the source container
+        if (recipe := provider._recipe) is None or (source := provider.resolver) is None:
+            return provider
+
+        if (target := source._targets.get(dependency)) is not None:
+            self._resolver.record_target(dependency, *target)
+
+        if isinstance(recipe, partial) and recipe.func is _enter:
+            # teardown of the copy's instances runs when the frozen container is closed
+            recipe = partial(_enter, recipe.args[0], recipe.args[1], self._managed.setdefault(dependency, []))
+
+        return provider.bind(recipe, self._resolver)
+
+    def _resolve_registered(self, dependency: Dependable) -> Dependency:
+        registered = self._providers.get(dependency)
+
+        if registered is None and (static := self._instances.get(dependency, _MISSING)) is not _MISSING:
+            registered = StaticDependency(static)
+
+        if registered is None:
+            raise ResolverError(f"{dependency} is not registered in the frozen container.")
+
+        if self._listener is not None:
+            self._resolver._observe_registered(dependency, registered, time.perf_counter())
+
+        return registered
+
+
+class OverlayContainer:
+    """Child container created by `Container.overlay`, it stores only the overridden values.
+
+    A dependency which depends on any of the overrides, directly or through dependencies which are not
+    registered, is constructed using the overrides once per overlay. Other dependencies are resolved by
+    the parent container.
+    """
+
+    __slots__ = ("_parent", "_overrides", "_resolver", "_instances")
+
+    def __init__(self, parent: Container, overrides: Optional[Dict[Dependable, Any]] = None) -> None:
+        """OverlayContainer constructor.
+
+        :param parent: The parent container.
+        :type parent: Container
+
+        :param overrides: Values of overridden dependencies.
+        :type overrides: Dict[Dependable, Any] | None
+        """
+        self._parent = parent
+        self._overrides: Dict[Dependable, Dependency] = (
+            {dependency: StaticDependency(value) for dependency, value in overrides.items()} if overrides else {}
+        )
+        self._resolver: Optional[OverlayResolver] = None
+        self._instances: Optional[Dict[Dependable, Any]] = None
+
+    def register(self, dependency: Type[T], value: T) -> None:
+        """Override the dependency by the value.
+
+        :param dependency: Type to be overridden.
+        :type dependency: Type[T]
+
+        :param value: The instance.
+        :type value: T
+
+        :rtype: None
+        """
+        self._overrides[dependency] = StaticDependency(value)
+        self._resolver = None
+        self._instances = None
+
+    def resolve(self, dependency: Type[T], **parameters: Dependable) -> T:
+        """
+        :param dependency: Type to be resolved.
+        :type dependency: Type[T]
+
+        :keyword parameters: Keyword arguments specifying parameters to be forcefully used when resolving T.
+
+        :return: Instance of type T.
+        :rtype: T
+        """
+        if (overridden := self._overrides.get(dependency)) is not None:
+            return cast(T, overridden.get_instance())
+
+        if self._resolver is None:
+            self._resolver = OverlayResolver(self._parent._resolver, self._overrides, self._parent.resolve)
+
+        if not parameters and not self._parent._resolver.depends_on(dependency, self._resolver.overridden):
+            return self._parent.resolve(dependency)
+
+        if parameters:
+            return cast(T, self._resolver.construct(dependency, parameters).get_instance())
+
+        if self._instances is None:
+            self._instances = {}
+
+        if (instance := self._instances.get(dependency, _MISSING)) is _MISSING:
+            instance = self._instances[dependency] = self._resolver.resolve(dependency).get_instance()
+
+        return cast(T, instance)
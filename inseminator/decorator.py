@@ -1,18 +1,27 @@
 import inspect
 import time
-from functools import wraps
-from threading import Lock
-from typing import Any, Callable, Dict, Mapping, Optional, Type, TypeVar, cast
+from functools import partial, wraps
+from threading import RLock
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, cast
 
+from .dependency import Dependency, Lifetime, Pooled, Provider, Transient
 from .metrics import Metrics
 from .resolver import DependencyResolver
+from .scope import Scope, activate_scope, deactivate_scope, get_current_scope
+
+# cached arguments, registered dependencies fetched on every call and pools checked out for every call
+_State = Tuple[Dict[str, Any], Dict[str, Dependency], Dict[str, Pooled]]
 
 
 class DecoratorResolver:
     """Class used internally to provide functionality for ``inject`` decorator."""
 
     def __init__(
-        self, resolver: DependencyResolver, metrics: Optional[Metrics] = None, cache_enabled: bool = True
+        self,
+        resolver: DependencyResolver,
+        metrics: Optional[Metrics] = None,
+        cache_enabled: bool = True,
+        shared: Optional[Dict[Any, Any]] = None,
     ) -> None:
         """DecoratorResolver constructor.
 
@@ -25,31 +34,166 @@ class DecoratorResolver:
         :param cache_enabled: If set to ``True``, objects are constructed only onced and then reused.
         :type cache_enabled: bool
 
+        :param shared: Cache of dependencies shared between scopes, e.g. the one of the container. It is not
+            cleared by `clear_cache`.
+        :type shared: Optional[Dict[Any, Any]]
+
         :rtype: None
         """
 
         self.__resolver = resolver
         self.__metrics = metrics
         self.__cache_enabled = cache_enabled
-        self.__cache: Dict[str, Any] = {}
-        self.__lock = Lock()
+        # ``None`` until the first call
+        self.__state: Optional[_State] = None
+        self.__lock = RLock()
         self.__parameters: Optional[Mapping[str, inspect.Parameter]] = None
+        self.__shared: Dict[Any, Any] = shared if shared is not None else {}
+        self.__name = ""
+        # providers of parameters with the lifetime set in ``Depends``
+        self.__providers: Dict[str, Provider] = {}
+
+    @property
+    def name(self) -> str:
+        """Module and qualified name of the injected function."""
+        return self.__name
+
+    @property
+    def lock(self) -> RLock:
+        """Lock guarding the cache. Calls of the injected function wait for it while the cache is empty."""
+        return self.__lock
+
+    @property
+    def preloaded(self) -> bool:
+        """``True`` if the dependencies are cached."""
+        return self.__state is not None
 
     def preload(self) -> None:
-        """Construct all dependencies and store it in the cache.
+        """Construct all dependencies and store it in the cache, unless they are already cached.
 
         :rtype: None
         """
 
-        self.__cache = self.construct_dependencies()
+        self.__warm_up()
+
+    def preload_from(self, instances: Mapping[Any, Any]) -> None:
+        """Store already constructed dependencies in the cache.
+
+        :param instances: Mapping from dependencies to constructed instances, it must contain all dependencies
+            returned by `get_cached_dependencies`.
+        :type instances: Mapping[Any, Any]
+
+        :rtype: None
+        """
+
+        with self.__lock:
+            if self.__state is None:
+                self.__state = (self.__cache_from(instances), *self.__find_per_call())
+
+    def __cache_from(self, instances: Mapping[Any, Any]) -> Dict[str, Any]:
+        cache: Dict[str, Any] = {}
+
+        for name, dependency in self.__dependency_parameters():
+            if self.__is_per_call(name, dependency):
+                continue
+
+            if (provider := self.__providers.get(name)) is not None:
+                cache[name] = provider.get_instance()
+            elif self.__resolver.lookup(dependency) is None:
+                # dependencies which are not registered are shared with other functions of the container
+                cache[name] = self.__shared.setdefault(dependency, instances[dependency])
+            else:
+                cache[name] = instances[dependency]
+
+        return cache
 
-    def clear_cache(self) -> None:
+    def clear_cache(self, teardown: bool = True) -> None:
         """Remove all cached dependencies.
 
+        :param teardown: If set to ``False``, teardown of instances constructed by providers of the function
+            doesn't run, e.g. in a child process after ``fork``.
+        :type teardown: bool
+
+        :rtype: None
+        """
+
+        self.__state = None
+
+        for provider in self.__providers.values():
+            if teardown:
+                provider.reset()
+            else:
+                provider.detach()
+
+    def reset_lock(self) -> None:
+        """Replace the lock guarding the cache and locks of providers of the function, e.g. in a child process
+        after ``fork``.
+
         :rtype: None
         """
 
-        self.__cache.clear()
+        self.__lock = RLock()
+
+        for provider in self.__providers.values():
+            provider.reset_lock()
+
+    def get_dependencies(self) -> List[Any]:
+        """Return dependencies requested by the injected function.
+
+        :rtype: List[Any]
+        """
+        return [dependency for _, dependency in self.__dependency_parameters()]
+
+    def get_cached_dependencies(self) -> List[Any]:
+        """Return dependencies requested by the injected function which are constructed once and cached,
+        the others are constructed or checked out on every call.
+
+        :rtype: List[Any]
+        """
+        return [
+            dependency
+            for name, dependency in self.__dependency_parameters()
+            if not self.__is_per_call(name, dependency)
+        ]
+
+    def __dependency_parameters(self) -> List[Tuple[str, Any]]:
+        if self.__parameters is None:
+            return []
+
+        return [
+            (name, parameter.default.parameter_dependency)
+            for name, parameter in self.__parameters.items()
+            if isinstance(parameter.default, ParameterDependence)
+        ]
+
+    def __find_per_call(self) -> Tuple[Dict[str, Dependency], Dict[str, Pooled]]:
+        # registered dependencies whose lifetime doesn't allow caching them
+        per_call: Dict[str, Dependency] = {}
+        pooled: Dict[str, Pooled] = {}
+
+        for name, dependency in self.__dependency_parameters():
+            if isinstance(registered := self.__lookup(name, dependency), Pooled):
+                registered.fill()
+                pooled[name] = registered
+            elif isinstance(registered, Provider) and not registered.cacheable:
+                per_call[name] = registered
+            elif registered is None and self.__resolver.is_scoped(dependency):
+                # caching it would share its scoped, thread-local or pooled dependencies between all calls
+                per_call[name] = Transient().bind(partial(_construct_per_call, dependency), self.__resolver)
+
+        return per_call, pooled
+
+    def __lookup(self, name: str, dependency: Any) -> Optional[Dependency]:
+        if (provider := self.__providers.get(name)) is not None:
+            return provider
+
+        return self.__resolver.lookup(dependency)
+
+    def __is_per_call(self, name: str, dependency: Any) -> bool:
+        if (registered := self.__lookup(name, dependency)) is None:
+            return self.__resolver.is_scoped(dependency)
+
+        return isinstance(registered, Provider) and not registered.cacheable
 
     def construct_dependencies(self) -> Dict[str, Any]:
         """Construct all dependencies.
@@ -71,14 +215,110 @@ class DecoratorResolver:
             ):
                 continue
 
-            dependency: Any = self.__resolver.resolve(default.parameter_dependency).get_instance()
-            injected_args[parameter_name] = dependency
+            if self.__is_per_call(parameter_name, default.parameter_dependency):
+                # constructed or checked out on every call
+                continue
+
+            dependency = default.parameter_dependency
+
+            if (provider := self.__providers.get(parameter_name)) is not None:
+                injected_args[parameter_name] = provider.get_instance()
+            elif self.__resolver.lookup(dependency) is None:
+                # dependencies which are not registered are shared with other functions of the container
+                injected_args[parameter_name] = self.__resolver.resolve_shared(dependency, self.__shared)
+            else:
+                injected_args[parameter_name] = self.__resolver.resolve(dependency).get_instance()
 
         return injected_args
 
+    def construct_scoped_dependencies(self) -> Dict[str, Any]:
+        """Construct all dependencies for a new scope. Dependencies which are not scoped are constructed
+        only once and shared between scopes, see `DependencyResolver.resolve_scoped`.
+
+        :rtype: Dict[str, Any]
+        """
+        return {
+            name: (
+                provider.get_instance()
+                if (provider := self.__providers.get(name)) is not None
+                else self.__resolver.resolve_scoped(dependency, self.__shared)
+            )
+            for name, dependency in self.__dependency_parameters()
+        }
+
+    def __warm_up(self) -> _State:
+        with self.__lock:
+            if (state := self.__state) is None:
+                state = self.__state = (self.construct_dependencies(), *self.__find_per_call())
+
+        return state
+
+    def __per_call_arguments(
+        self, injected_args: Dict[str, Any], per_call: Dict[str, Dependency]
+    ) -> Tuple[Dict[str, Any], Optional[Scope]]:
+        if get_current_scope() is not None:
+            return {**injected_args, **{n: d.get_instance() for n, d in per_call.items()}}, None
+
+        # outside of any scope the call gets its own one, instances created by generator and context-manager
+        # factories are torn down when the call returns
+        scope = Scope(self.__shared)
+        token = activate_scope(scope)
+
+        try:
+            return {**injected_args, **{n: d.get_instance() for n, d in per_call.items()}}, scope
+        except BaseException:
+            scope.close()
+            raise
+        finally:
+            deactivate_scope(token)
+
+    def __call(
+        self,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        injected_args: Dict[str, Any],
+        pooled: Dict[str, Pooled],
+        scope: Optional[Scope],
+    ) -> Any:
+        try:
+            if pooled:
+                return self.__call_pooled(fn, args, kwargs, injected_args, pooled)
+
+            return fn(*args, **{**injected_args, **kwargs})
+        finally:
+            if scope is not None:
+                scope.close()
+
+    @staticmethod
+    def __call_pooled(
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        injected_args: Dict[str, Any],
+        pooled: Dict[str, Pooled],
+    ) -> Any:
+        checked_out: List[Tuple[Pooled, Any]] = []
+
+        try:
+            injected_args = dict(injected_args)
+
+            for name, pool in pooled.items():
+                if name not in kwargs:
+                    injected_args[name] = instance = pool.acquire()
+                    checked_out.append((pool, instance))
+
+            return fn(*args, **{**injected_args, **kwargs})
+        finally:
+            for pool, instance in reversed(checked_out):
+                pool.release(instance)
+
     def inject_function(self, fn: Callable[..., Any]) -> Callable[..., Any]:
         """Convert the function into a new function that will received requested dependencies when invoked.
 
+        Once the dependencies are cached, the function is called without taking any lock. Time spent
+        injecting the dependencies is measured only if metrics are set.
+
         :param fn: The function.
         :type fn: Callable[..., Any]
 
@@ -87,29 +327,87 @@ class DecoratorResolver:
         """
 
         self.__parameters = inspect.signature(fn).parameters
+        self.__providers = {
+            name: provider.bind(partial(_construct, parameter.default.parameter_dependency), self.__resolver)
+            for name, parameter in self.__parameters.items()
+            if isinstance(parameter.default, ParameterDependence)
+            and (provider := parameter.default.provider) is not None
+        }
+        metrics = self.__metrics
+        self.__name = function_name(fn)
+        name = self.__name if getattr(metrics, "qualified_names", False) is True else fn.__name__
+
+        if not self.__cache_enabled:
+
+            @wraps(fn)
+            def scoped_wrapper(*args: Any, **kwargs: Any) -> Any:
+                t1 = time.perf_counter() if metrics is not None else 0.0
+                scope = Scope(self.__shared)
+                token = activate_scope(scope)
+
+                try:
+                    injected_args = self.construct_scoped_dependencies()
+
+                    if metrics is not None:
+                        metrics.save_metric(name, time.perf_counter() - t1)
+
+                    if kwargs:
+                        return fn(*args, **{**injected_args, **kwargs})
+
+                    return fn(*args, **injected_args)
+                finally:
+                    try:
+                        scope.close()
+                    finally:
+                        deactivate_scope(token)
+
+            return scoped_wrapper
+
+        if metrics is not None:
+
+            @wraps(fn)
+            def measured_wrapper(*args: Any, **kwargs: Any) -> Any:
+                t1 = time.perf_counter()
+
+                if (state := self.__state) is None:
+                    state = self.__warm_up()
+
+                injected_args, per_call, pooled = state
+                scope = None
+
+                if per_call:
+                    injected_args, scope = self.__per_call_arguments(injected_args, per_call)
+
+                metrics.save_metric(name, time.perf_counter() - t1)
+
+                if per_call or pooled:
+                    return self.__call(fn, args, kwargs, injected_args, pooled, scope)
+
+                if kwargs:
+                    return fn(*args, **{**injected_args, **kwargs})
+
+                return fn(*args, **injected_args)
+
+            return measured_wrapper
 
         @wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            t1 = time.perf_counter()
-            injected_args: Dict[str, Any] = {}
+            if (state := self.__state) is None:
+                state = self.__warm_up()
 
-            if self.__cache_enabled:
-                self.__lock.acquire()
+            injected_args, per_call, pooled = state
 
-                if not self.__cache:
-                    self.__cache = self.construct_dependencies()
+            if per_call:
+                injected_args, scope = self.__per_call_arguments(injected_args, per_call)
+                return self.__call(fn, args, kwargs, injected_args, pooled, scope)
 
-                self.__lock.release()
+            if pooled:
+                return self.__call_pooled(fn, args, kwargs, injected_args, pooled)
 
-                injected_args = self.__cache
-            else:
-                injected_args = self.construct_dependencies()
+            if kwargs:
+                return fn(*args, **{**injected_args, **kwargs})
 
-            if self.__metrics is not None:
-                dt = time.perf_counter() - t1
-                self.__metrics.save_metric(fn.__name__, dt)
-
-            return fn(*args, **{**injected_args, **kwargs})
+            return fn(*args, **injected_args)
 
         return wrapper
 
@@ -117,25 +415,64 @@ class DecoratorResolver:
 class ParameterDependence:
     """Helper class to represent dependency request."""
 
-    def __init__(self, parameter_dependency: Any) -> None:
+    def __init__(self, parameter_dependency: Any, lifetime: Optional[Lifetime] = None) -> None:
         """ParameterDependence constructor.
 
         :param parameter_dependency: The dependency type.
         :type parameter_dependency: Any
+
+        :param lifetime: Lifetime of the dependency overriding its registration.
+        :type lifetime: Type[Provider] | Provider | None
         """
         self.parameter_dependency = parameter_dependency
+        self.provider: Optional[Provider] = lifetime() if isinstance(lifetime, type) else lifetime
 
 
 T = TypeVar("T")
 
 
-def Depends(parameter_type: Type[T]) -> T:
+def Depends(parameter_type: Type[T], lifetime: Optional[Lifetime] = None) -> T:
     """Helper function to mark a function parameter as a dependency.
 
+    Example::
+
+        @container.inject
+        def handler(client: Client = Depends(Client, lifetime=ThreadLocal)) -> None:
+            ...
+
     :param parameter_type: The dependency
     :type parameter_type: Type[T]
 
+    :param lifetime: If set, the dependency is constructed for the injected function according to the
+        lifetime instead of being taken from the container. Registered dependencies are constructed the same
+        way as by their registration, e.g. using the registered factory.
+    :type lifetime: Type[Provider] | Provider | None
+
     :return: Value representing the dependency request.
     :rtype: T to satisfy type checker but it actually returns an instance of ``ParameterDependence``.
     """
-    return cast(T, ParameterDependence(parameter_type))
+    return cast(T, ParameterDependence(parameter_type, lifetime))
+
+
+def _construct(dependency: Any, resolver: DependencyResolver) -> Any:
+    return resolver.construct_registered(dependency)
+
+
+def _construct_per_call(dependency: Any, resolver: DependencyResolver) -> Any:
+    # calls get their own scope, see `DecoratorResolver.__per_call_arguments`
+    if (scope := get_current_scope()) is not None:
+        return resolver.construct_scoped(dependency, scope.shared)
+
+    return resolver.construct(dependency).get_instance()
+
+
+def function_name(fn: Callable[..., Any]) -> str:
+    """Return module and qualified name of the function, injected functions are unwrapped first.
+
+    :param fn: The function.
+    :type fn: Callable[..., Any]
+
+    :rtype: str
+    """
+    fn = inspect.unwrap(fn)
+    return f"{fn.__module__}.{fn.__qualname__}"
@@ -1,4 +1,22 @@
-from typing import Any, Protocol
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator, List, Optional, Protocol, Type, Union, cast
+
+from .exceptions import ResolverError
+from .metrics import Metrics
+from .scope import Scope, activate_scope, deactivate_scope, get_current_scope
+
+if TYPE_CHECKING:
+    from .resolver import DependencyResolver
+
+_MISSING: Any = object()
 
 
 class Dependency(Protocol):
@@ -27,3 +45,484 @@ class StaticDependency:
         :return: The constructed dependency.
         """
         return self.__instance
+
+
+class AsyncDependency:
+    """Implements the `Dependency` interface for dependencies constructed by ``async def`` factories.
+
+    The dependency must be constructed using `Container.aresolve` first, afterwards it can be used
+    also by the synchronous resolution.
+    """
+
+    def __init__(self, factory: Callable[[], Awaitable[Any]]) -> None:
+        """AsyncDependency constructor.
+
+        :param factory: Coroutine function constructing the dependency.
+        """
+        self.__factory = factory
+        self.__future: Optional[Awaitable[Any]] = None
+        self.__instance: Any = None
+        self.__constructed = False
+
+    async def aget_instance(self) -> Any:
+        """Construct the dependency if needed and return it. Concurrent callers share the construction.
+
+        :return: The constructed dependency.
+        """
+        if not self.__constructed:
+            if self.__future is None:
+                self.__future = asyncio.ensure_future(self.__factory())
+
+            try:
+                instance = await self.__future
+            except BaseException:
+                self.__future = None
+                raise
+
+            self.__instance = instance
+            self.__constructed = True
+
+        return self.__instance
+
+    def is_constructed(self) -> bool:
+        """Check whether the dependency was already constructed by `aget_instance`.
+
+        :rtype: bool
+        """
+        return self.__constructed
+
+    def get_instance(self) -> Any:
+        """Returns the dependency constructed by `aget_instance`.
+
+        :raises ResolverError: If the dependency was not constructed yet.
+
+        :return: The constructed dependency.
+        """
+        if not self.__constructed:
+            raise ResolverError("Dependency with an async factory must be resolved using aresolve first.")
+
+        return self.__instance
+
+
+#: Function constructing a dependency using the given resolver.
+Recipe = Callable[["DependencyResolver"], Any]
+
+
+class Provider:
+    """Base class for dependencies constructed lazily by a recipe according to their lifetime.
+
+    Providers are passed to `Container.register` either as classes (``lifetime=Singleton``)
+    or as configured instances. The container binds a copy of the provider to the registration's recipe.
+    """
+
+    #: If ``False``, functions injected using `Container.inject` fetch the dependency on every call
+    #: instead of caching it.
+    cacheable = True
+
+    def __init__(self) -> None:
+        """Provider constructor."""
+        self._recipe: Optional[Recipe] = None
+        self._resolver: Optional[DependencyResolver] = None
+
+    def bind(self, recipe: Recipe, resolver: DependencyResolver) -> Provider:
+        """Return a copy of the provider constructing dependencies using the recipe.
+
+        :param recipe: Function constructing the dependency.
+        :type recipe: Recipe
+
+        :param resolver: Resolver passed to the recipe.
+        :type resolver: DependencyResolver
+
+        :return: New provider.
+        :rtype: Provider
+        """
+        provider = copy.copy(self)
+        provider._recipe = recipe
+        provider._resolver = resolver
+        provider.reset()
+        return provider
+
+    @property
+    def resolver(self) -> Optional[DependencyResolver]:
+        """Resolver the provider is bound to."""
+        return self._resolver
+
+    def create(self) -> Any:
+        """Construct a new instance of the dependency.
+
+        :return: The constructed dependency.
+        """
+        if self._recipe is None or self._resolver is None:
+            raise ResolverError(f"{type(self).__name__} provider is not bound to any registration.")
+
+        return self._recipe(self._resolver)
+
+    def get_instance(self) -> Any:
+        """Returns the dependency according to the lifetime.
+
+        :return: The constructed dependency.
+        """
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Forget all constructed instances."""
+        pass
+
+    def detach(self) -> None:
+        """Forget all constructed instances without running their teardown, e.g. in a child process after
+        ``fork`` where the parent process still uses them."""
+        self.reset()
+
+    def reset_lock(self) -> None:
+        """Replace locks of the provider, e.g. in a child process after ``fork``, constructed instances are kept."""
+        pass
+
+    def is_constructed(self) -> bool:
+        """Check whether `get_instance` returns an already constructed instance.
+
+        :rtype: bool
+        """
+        return False
+
+
+class Singleton(Provider):
+    """The dependency is constructed once, on the first request, and then shared."""
+
+    def reset(self) -> None:
+        """Forget the constructed instance."""
+        self._lock = Lock()
+        self._instance: Any = _MISSING
+
+    def reset_lock(self) -> None:
+        """Replace the lock guarding the construction."""
+        self._lock = Lock()
+
+    def get_instance(self) -> Any:
+        """Returns the shared instance, construct it if needed.
+
+        :return: The constructed dependency.
+        """
+        instance = self._instance
+
+        if instance is _MISSING:
+            with self._lock:
+                instance = self._instance
+
+                if instance is _MISSING:
+                    instance = self._instance = self.create()
+
+        return instance
+
+    def is_constructed(self) -> bool:
+        """Check whether the shared instance is already constructed.
+
+        :rtype: bool
+        """
+        return self._instance is not _MISSING
+
+
+class Scoped(Singleton):
+    """The dependency is constructed once per scope. Every call of a function injected using
+    `Container.inject_scoped` and every `Container.scope` block is a new scope. Outside of these, every
+    sub-container is a new scope and the instance is constructed using the sub-container's registrations."""
+
+    def get_instance(self) -> Any:
+        """Returns the instance for the active scope, construct it if needed.
+
+        :return: The constructed dependency.
+        """
+        if (scope := get_current_scope()) is not None:
+            return scope.get_instance(self)
+
+        return super().get_instance()
+
+    def is_constructed(self) -> bool:
+        """Check whether the instance for the active scope is already constructed.
+
+        :rtype: bool
+        """
+        if (scope := get_current_scope()) is not None:
+            return self in scope
+
+        return super().is_constructed()
+
+    def for_scope(self, resolver: DependencyResolver) -> Scoped:
+        """Return a provider for the scope of the resolver.
+
+        :param resolver: Resolver of the scope.
+        :type resolver: DependencyResolver
+
+        :rtype: Scoped
+        """
+        if self._recipe is None:
+            raise ResolverError("Scoped provider is not bound to any registration.")
+
+        return cast(Scoped, self.bind(self._recipe, resolver))
+
+
+class Transient(Provider):
+    """The dependency is constructed on every request and never cached."""
+
+    cacheable = False
+
+    def get_instance(self) -> Any:
+        """Returns a new instance.
+
+        :return: The constructed dependency.
+        """
+        return self.create()
+
+
+class Pooled(Provider):
+    """Instances are kept in a bounded pool. Every call of a function injected using `Container.inject`
+    checks an instance out of the pool and returns it when the call finishes, so an instance is never used
+    by two calls at the same time. Within `Container.inject_scoped` calls, every request checks out an instance
+    which is returned when the scope is closed. Outside of these, a new instance is constructed on every request.
+
+    If metrics are set, time spent waiting for an instance is reported as ``<name>.wait`` and the fraction of
+    checked out instances as ``<name>.utilisation``.
+
+    Example::
+
+        container.register(Session, factory=create_session, lifetime=Pooled(max_size=8, min_idle=2))
+    """
+
+    cacheable = False
+
+    def __init__(self, max_size: int, min_idle: int = 0, timeout: Optional[float] = None) -> None:
+        """Pooled constructor.
+
+        :param max_size: Maximal number of constructed instances.
+        :type max_size: int
+
+        :param min_idle: Number of instances constructed in advance, on the first checkout or when injected
+            functions are preloaded.
+        :type min_idle: int
+
+        :param timeout: Maximal time in seconds to wait for an instance, wait forever if ``None``.
+        :type timeout: float | None
+        """
+        if max_size < 1 or not 0 <= min_idle <= max_size:
+            raise ValueError("Pool size must be positive and min_idle between 0 and max_size.")
+
+        super().__init__()
+        self.max_size = max_size
+        self.min_idle = min_idle
+        self.timeout = timeout
+        self._metrics: Optional[Metrics] = None
+        self._name = ""
+
+    def set_metrics(self, metrics: Optional[Metrics], name: str) -> None:
+        """Set metrics object for reporting wait time and utilisation of the pool.
+
+        :param metrics: Metrics object for reporting.
+        :type metrics: Metrics | None
+
+        :param name: Prefix of the metric names.
+        :type name: str
+
+        :rtype: None
+        """
+        self._metrics = metrics
+        self._name = name
+
+    def reset(self) -> None:
+        """Forget all pooled instances."""
+        self._condition = Condition()
+        self._idle: List[Any] = []
+        self._size = 0
+        self._in_use = 0
+
+    def reset_lock(self) -> None:
+        """Replace the condition guarding the pool."""
+        self._condition = Condition()
+
+    def fill(self) -> None:
+        """Construct idle instances until there are at least ``min_idle`` instances in the pool.
+
+        :rtype: None
+        """
+        while True:
+            with self._condition:
+                if self._size >= self.min_idle:
+                    return
+
+                self._size += 1
+
+            try:
+                instance = self.create()
+            except BaseException:
+                self.__discard()
+                raise
+
+            self.release(instance, checked_out=False)
+
+    def acquire(self) -> Any:
+        """Check an instance out of the pool, construct it if there is none idle and the pool is not full.
+
+        :raises ResolverError: If no instance is available before the timeout.
+
+        :return: The checked out dependency.
+        """
+        start = time.perf_counter()
+
+        if self._size < self.min_idle:
+            self.fill()
+
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._idle or self._size < self.max_size, self.timeout):
+                raise ResolverError(f"No pooled instance available within {self.timeout} seconds.")
+
+            self._in_use += 1
+            utilisation = self._in_use / self.max_size
+
+            if self._idle:
+                instance = self._idle.pop()
+            else:
+                self._size += 1
+                instance = _MISSING
+
+        if instance is _MISSING:
+            try:
+                instance = self.create()
+            except BaseException:
+                self.__discard(checked_out=True)
+                raise
+
+        if (metrics := self._metrics) is not None:
+            metrics.save_metric(f"{self._name}.wait", time.perf_counter() - start)
+            metrics.save_metric(f"{self._name}.utilisation", utilisation)
+
+        return instance
+
+    def release(self, instance: Any, checked_out: bool = True) -> None:
+        """Return the instance to the pool.
+
+        :param instance: Instance returned by `acquire`.
+
+        :param checked_out: ``False`` if the instance is newly constructed and wasn't checked out.
+        :type checked_out: bool
+
+        :rtype: None
+        """
+        with self._condition:
+            self._idle.append(instance)
+
+            if checked_out:
+                self._in_use -= 1
+
+            self._condition.notify()
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """Check an instance out of the pool for the duration of the ``with`` block.
+
+        :return: The checked out dependency.
+        """
+        instance = self.acquire()
+
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+    def get_instance(self) -> Any:
+        """Returns an instance checked out for the active scope or a new instance outside of any scope.
+
+        :return: The constructed dependency.
+        """
+        if (scope := get_current_scope()) is not None:
+            return scope.enter_context(self.checkout())
+
+        return self.create()
+
+    def __discard(self, checked_out: bool = False) -> None:
+        with self._condition:
+            self._size -= 1
+
+            if checked_out:
+                self._in_use -= 1
+
+            self._condition.notify()
+
+
+class _ThreadSlot:
+    __slots__ = ("instance", "__weakref__")
+
+    def __init__(self, instance: Any) -> None:
+        self.instance = instance
+
+
+class ThreadLocal(Provider):
+    """The dependency is constructed once per thread, on the first request in the thread, and released
+    when the thread exits. Teardown of generator and context-manager factories runs at that point.
+
+    Example::
+
+        container.register(Client, lifetime=ThreadLocal)
+
+        @container.inject
+        def handler(client: Client = Depends(Client)) -> None:
+            ...  # every thread uses its own Client
+    """
+
+    cacheable = False
+
+    def reset(self) -> None:
+        """Forget instances of all threads."""
+        self._local = threading.local()
+        # teardown of the instances, run when their threads exit
+        self._finalizers: List[weakref.finalize[[], _ThreadSlot]] = []
+        self._finalizers_lock = Lock()
+
+    def detach(self) -> None:
+        """Forget instances of all threads without running their teardown."""
+        for finalizer in self._finalizers:
+            finalizer.detach()
+
+        self.reset()
+
+    def reset_lock(self) -> None:
+        """Replace the lock guarding the teardown of the instances."""
+        self._finalizers_lock = Lock()
+
+    def get_instance(self) -> Any:
+        """Returns the instance of the current thread, construct it if needed.
+
+        :return: The constructed dependency.
+        """
+        try:
+            return self._local.slot.instance
+        except AttributeError:
+            pass
+
+        # context managers entered during the construction are exited when the thread exits
+        scope = Scope()
+        token = activate_scope(scope)
+
+        try:
+            instance = self.create()
+        except BaseException:
+            scope.close()
+            raise
+        finally:
+            deactivate_scope(token)
+
+        slot = self._local.slot = _ThreadSlot(instance)
+
+        with self._finalizers_lock:
+            self._finalizers = [finalizer for finalizer in self._finalizers if finalizer.alive]
+            self._finalizers.append(weakref.finalize(slot, scope.close))
+
+        return instance
+
+    def is_constructed(self) -> bool:
+        """Check whether the instance of the current thread is already constructed.
+
+        :rtype: bool
+        """
+        return hasattr(self._local, "slot")
+
+
+#: Lifetime selectable in `Container.register`, a provider class or a configured provider.
+Lifetime = Union[Type[Provider], Provider]
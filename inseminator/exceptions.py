@@ -16,7 +16,25 @@ class ContainerRegisterError(ContainerError):
     pass
 
 
+class ContainerFrozenError(ContainerRegisterError):
+    """Error when modifying a frozen container."""
+
+    pass
+
+
 class ResolverError(InseminatorError):
     """Error from the Resolver."""
 
     pass
+
+
+class CompilerError(InseminatorError):
+    """Error when compiling the container ahead of time."""
+
+    pass
+
+
+class StaleCompiledModuleError(CompilerError):
+    """Signatures of dependencies changed since the compiled module was generated."""
+
+    pass
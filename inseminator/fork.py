@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any, List, Tuple
+from weakref import WeakSet
+
+from .lazy import reset_locks
+
+if TYPE_CHECKING:
+    from .container import Container
+    from .dependency import Dependency
+
+#: Containers notified after ``fork`` in the child process.
+_containers: WeakSet[Container] = WeakSet()
+
+
+def track(container: Container) -> None:
+    """Rebuild dependencies of the container which are not fork-safe in child processes.
+
+    :param container: The container.
+    :type container: Container
+
+    :rtype: None
+    """
+    _containers.add(container)
+
+
+def after_fork_in_child() -> None:
+    """Called in the child process after ``fork``.
+
+    Dependencies registered with ``fork_safe=False`` and registered dependencies constructed using them are reset
+    in all containers first and constructed again on the first request. Afterwards, injected functions are reset
+    if any of their dependencies was reset.
+    Other dependencies stay shared with the parent process (copy-on-write). Locks of containers, providers,
+    injected functions and lazy proxies are replaced, threads of the parent process could hold them.
+
+    :rtype: None
+    """
+    # locks held by other threads of the parent process at the time of fork would never be released
+    reset_locks()
+    containers = list(_containers)
+    reset: List[Tuple[Any, Dependency, Dependency]] = []
+
+    for container in containers:
+        reset.extend(container._reset_after_fork())
+
+    for container in containers:
+        container._reset_injected_after_fork(reset)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=after_fork_in_child)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .exceptions import ResolverError
+from .plan import get_plan
+
+if TYPE_CHECKING:
+    from .resolver import Dependable, DependencyResolver
+
+
+class GraphNode:
+    """Dependency in a `DependencyGraph`."""
+
+    __slots__ = ("dependency", "arguments", "forced", "external")
+
+    def __init__(
+        self, dependency: Any, arguments: List[Tuple[str, Any]], forced: Dict[str, Any], external: bool
+    ) -> None:
+        """GraphNode constructor.
+
+        :param dependency: The dependency.
+        :type dependency: Any
+
+        :param arguments: Names of the constructor parameters and dependencies passed to them.
+        :type arguments: List[Tuple[str, Any]]
+
+        :param forced: Parameters forcefully used when constructing the dependency.
+        :type forced: Dict[str, Any]
+
+        :param external: ``True`` for registered dependencies, lazy dependencies and settings which are
+            taken from the resolver as they are, without constructing their dependencies first.
+        :type external: bool
+        """
+        self.dependency = dependency
+        self.arguments = arguments
+        self.forced = forced
+        self.external = external
+
+
+class DependencyGraph:
+    """Graph of dependencies computed from type hints without constructing anything.
+
+    Edges lead from a dependency to the dependencies of its constructor. Registered dependencies, lazy
+    dependencies and settings have no outgoing edges because they don't need their dependencies
+    to be constructed first.
+
+    Cycles don't prevent building the graph, they are collected in `cycles` instead.
+    """
+
+    def __init__(
+        self, resolver: DependencyResolver, roots: Sequence[Dependable], parameters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """DependencyGraph constructor.
+
+        :param resolver: Resolver used to look up registered dependencies.
+        :type resolver: DependencyResolver
+
+        :param roots: Dependencies whose graph is computed.
+        :type roots: Sequence[Dependable]
+
+        :param parameters: Parameters to be forcefully used when constructing the first root.
+        :type parameters: Dict[str, Any] | None
+
+        :raises ResolverError: If a protocol has no implementation or a type hint is missing.
+        """
+        self._resolver = resolver
+        self.roots = list(roots)
+        self.nodes: Dict[Any, GraphNode] = {}
+        #: Detected cycles, every cycle starts and ends with the same dependency.
+        self.cycles: List[Tuple[Any, ...]] = []
+        self._order: List[Any] = []
+        self._dependents: Dict[Any, List[Any]] = {}
+
+        for i, root in enumerate(self.roots):
+            self._visit(root, parameters if i == 0 else None)
+
+        for dependency in self._order:
+            self._dependents.setdefault(dependency, [])
+
+            for required in self.dependencies(dependency):
+                self._dependents.setdefault(required, []).append(dependency)
+
+    def __contains__(self, dependency: Any) -> bool:
+        return dependency in self.nodes
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def dependencies(self, dependency: Any) -> List[Any]:
+        """Return dependencies of the dependency's constructor.
+
+        :param dependency: Dependency in the graph.
+        :type dependency: Any
+
+        :rtype: List[Any]
+        """
+        return list(dict.fromkeys(hint for _, hint in self.nodes[dependency].arguments))
+
+    def dependents(self, dependency: Any) -> List[Any]:
+        """Return dependencies in the graph which require the dependency.
+
+        :param dependency: Dependency in the graph.
+        :type dependency: Any
+
+        :rtype: List[Any]
+        """
+        return list(self._dependents[dependency])
+
+    def fan_in(self, dependency: Any) -> int:
+        """Return the number of dependencies requiring the dependency.
+
+        :param dependency: Dependency in the graph.
+        :type dependency: Any
+
+        :rtype: int
+        """
+        return len(self._dependents[dependency])
+
+    def fan_out(self, dependency: Any) -> int:
+        """Return the number of dependencies required by the dependency.
+
+        :param dependency: Dependency in the graph.
+        :type dependency: Any
+
+        :rtype: int
+        """
+        return len(self.dependencies(dependency))
+
+    def check(self) -> None:
+        """Check that the graph doesn't contain any cycle.
+
+        :raises ResolverError: If the graph contains a cycle.
+
+        :rtype: None
+        """
+        if self.cycles:
+            cycle = self.cycles[0]
+            raise ResolverError(prefix(cycle[:-1]) + f"Cyclic dependency on {cycle[-1]} detected.")
+
+    def topological_order(self) -> List[Any]:
+        """Return all dependencies in the graph, every dependency comes after all its dependencies.
+
+        :raises ResolverError: If the graph contains a cycle.
+
+        :rtype: List[Any]
+        """
+        self.check()
+        return list(self._order)
+
+    def _visit(self, root: Any, parameters: Optional[Dict[str, Any]]) -> None:
+        if root in self.nodes:
+            return
+
+        # iterative depth-first search, dependencies on the current path are in progress
+        path: List[Any] = [root]
+        on_path: Dict[Any, int] = {root: 0}
+        stack = [(root, iter(self._add(root, parameters, path).arguments))]
+
+        while stack:
+            dependency, arguments = stack[-1]
+
+            for _, hint in arguments:
+                if hint in on_path:
+                    self.cycles.append(tuple(path[on_path[hint] :]) + (hint,))
+                elif hint not in self.nodes:
+                    path.append(hint)
+                    on_path[hint] = len(path) - 1
+                    stack.append((hint, iter(self._add(hint, None, path).arguments)))
+                    break
+            else:
+                stack.pop()
+                path.pop()
+                del on_path[dependency]
+                self._order.append(dependency)
+
+    def _add(self, dependency: Any, parameters: Optional[Dict[str, Any]], path: List[Any]) -> GraphNode:
+        forced = parameters or {}
+        external = False
+        arguments: List[Tuple[str, Any]] = []
+
+        if not forced and self._resolver.lookup(dependency) is not None:
+            external = True
+        elif (plan := get_plan(dependency)).lazy_target is not None or plan.is_settings:
+            external = True
+        elif plan.is_protocol:
+            raise ResolverError(
+                prefix(path[:-1]) + f"Implementation for {dependency.__name__} protocol is not defined."
+            )
+        else:
+            forced = self._resolver._forced_arguments(dependency, plan, forced)
+            arguments = [(p.name, p.hint) for p in plan.parameters if not p.has_default and p.name not in forced]
+
+            if plan.number_of_parameters > len(plan.parameters):
+                missing = plan.number_of_parameters - len(plan.parameters)
+                raise ResolverError(
+                    prefix(path[:-1]) + f"Can resolve dependencies for {dependency}. "
+                    f"All type annotations must be specified, {missing} missing."
+                )
+
+        node = self.nodes[dependency] = GraphNode(dependency, arguments, forced, external)
+        return node
+
+
+def prefix(path: Sequence[Any]) -> str:
+    """Format the path in the dependency graph the same way resolution errors do.
+
+    :param path: Dependencies from the root.
+    :type path: Sequence[Any]
+
+    :rtype: str
+    """
+    return "".join(f"{dependency} -> " for dependency in path)
@@ -1,3 +1,3 @@
-from .celery import celery_task
+from .celery import celery_task, connect_worker_signals
 
-__all__ = ["celery_task"]
+__all__ = ["celery_task", "connect_worker_signals"]
@@ -1,4 +1,6 @@
-from typing import Any, Callable, Generic, Protocol, TypeVar
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Generic, Optional, Protocol, TypeVar
 
 from ..container import Container
 
@@ -10,8 +12,67 @@ class Celery(Generic[T], Protocol):
         raise NotImplementedError
 
 
-def celery_task(celery: Celery[T], container: Container) -> Callable[[Callable[..., Any]], Callable[..., T]]:
+def celery_task(
+    celery: Celery[T], container: Container, scoped: bool = False
+) -> Callable[[Callable[..., Any]], Callable[..., T]]:
+    """Create a decorator registering Celery tasks with injected dependencies.
+
+    :param celery: The Celery application.
+    :type celery: Celery[T]
+
+    :param container: Container providing the dependencies.
+    :type container: Container
+
+    :param scoped: If set to ``True``, every task run is a new scope, see `Container.inject_scoped`.
+    :type scoped: bool
+
+    :return: The decorator.
+    :rtype: Callable[[Callable[..., Any]], Callable[..., T]]
+    """
+
     def decorator(fn: Callable[..., Any]) -> Callable[..., T]:
-        return celery.task(container.inject(fn))
+        injected = container.inject_scoped(fn) if scoped else container.inject(fn)
+        return celery.task(injected)
 
     return decorator
+
+
+def connect_worker_signals(container: Container, executor_factory: Optional[Callable[[], Executor]] = None) -> None:
+    """Preload injected functions when a worker process starts and close the container when it shuts down.
+
+    The first task of every worker process then doesn't have to construct the dependencies. Requires
+    ``celery`` to be installed.
+
+    :param container: The container.
+    :type container: Container
+
+    :param executor_factory: If specified, independent dependencies are constructed in parallel using an
+        executor created by the factory in the worker process and shut down once the functions are preloaded.
+        Executors can't be created before the worker process is forked because their threads or processes
+        don't exist in the child.
+    :type executor_factory: Callable[[], Executor] | None
+
+    :rtype: None
+    """
+    from celery.signals import worker_process_init, worker_process_shutdown
+
+    uid = f"inseminator-{id(container)}"
+    worker_process_init.connect(partial(_preload, container, executor_factory), weak=False, dispatch_uid=uid)
+    worker_process_shutdown.connect(partial(_dispose, container), weak=False, dispatch_uid=uid)
+
+
+def _preload(container: Container, executor_factory: Optional[Callable[[], Executor]], **kwargs: Any) -> None:
+    if executor_factory is None:
+        container.preload_injected()
+        return
+
+    executor = executor_factory()
+
+    try:
+        container.preload_injected(executor)
+    finally:
+        executor.shutdown()
+
+
+def _dispose(container: Container, **kwargs: Any) -> None:
+    container.close()
@@ -0,0 +1,133 @@
+import inspect
+from threading import Lock
+from typing import Any, Callable, Generic, Iterator, TypeVar, cast
+from weakref import WeakSet
+
+T = TypeVar("T")
+
+_MISSING: Any = object()
+
+#: Proxies whose locks are replaced after ``fork``, see `reset_locks`.
+_proxies: "WeakSet[Lazy[Any]]" = WeakSet()
+
+
+class Lazy(Generic[T]):
+    """Proxy constructing the dependency on the first attribute access.
+
+    Annotate a parameter with ``Lazy[T]`` (or use ``Depends(Lazy[T])``) and the resolver injects a proxy
+    instead of constructing ``T`` eagerly::
+
+        class Service:
+            def __init__(self, client: Lazy[HeavyClient]) -> None:
+                self._client = client
+
+            def handle(self) -> None:
+                self._client.do_stuff()  # HeavyClient is constructed here
+
+    Bound methods of the constructed object are stored on the proxy, so subsequent calls of a method
+    don't go through the proxy machinery at all.
+    """
+
+    __slots__ = ("__factory", "__instance", "__lock", "__dict__", "__weakref__")
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        """Lazy constructor.
+
+        :param factory: Function constructing the dependency.
+        :type factory: Callable[[], T]
+        """
+        object.__setattr__(self, "_Lazy__factory", factory)
+        object.__setattr__(self, "_Lazy__instance", _MISSING)
+        object.__setattr__(self, "_Lazy__lock", Lock())
+        _proxies.add(self)
+
+    def __force(self) -> T:
+        instance = self.__instance
+
+        if instance is _MISSING:
+            with self.__lock:
+                instance = self.__instance
+
+                if instance is _MISSING:
+                    instance = self.__factory()
+                    object.__setattr__(self, "_Lazy__instance", instance)
+
+        return cast(T, instance)
+
+    def __getattr__(self, name: str) -> Any:
+        instance = self.__force()
+        value = getattr(instance, name)
+
+        if inspect.ismethod(value) and value.__self__ is instance:
+            object.__setattr__(self, name, value)
+
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.__force(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.__force(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return cast(Any, self.__force())(*args, **kwargs)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(cast(Any, self.__force()))
+
+    def __len__(self) -> int:
+        return len(cast(Any, self.__force()))
+
+    def __getitem__(self, key: Any) -> Any:
+        return cast(Any, self.__force())[key]
+
+    def __contains__(self, item: Any) -> bool:
+        return item in cast(Any, self.__force())
+
+    def __bool__(self) -> bool:
+        return bool(self.__force())
+
+    def __enter__(self) -> Any:
+        return cast(Any, self.__force()).__enter__()
+
+    def __exit__(self, *args: Any) -> Any:
+        return cast(Any, self.__force()).__exit__(*args)
+
+    def __repr__(self) -> str:
+        if self.__instance is _MISSING:
+            return f"<Lazy {self.__factory!r} (not constructed)>"
+
+        return f"<Lazy {self.__instance!r}>"
+
+
+def force(lazy: Lazy[T]) -> T:
+    """Return the object behind the proxy, construct it if it was not constructed yet.
+
+    :param lazy: The proxy.
+    :type lazy: Lazy[T]
+
+    :return: The constructed object.
+    :rtype: T
+    """
+    return cast(T, lazy._Lazy__force())
+
+
+def is_constructed(lazy: Lazy[Any]) -> bool:
+    """Check whether the object behind the proxy was already constructed.
+
+    :param lazy: The proxy.
+    :type lazy: Lazy[Any]
+
+    :rtype: bool
+    """
+    return lazy._Lazy__instance is not _MISSING
+
+
+def reset_locks() -> None:
+    """Replace locks of all proxies which are not constructed yet, e.g. in a child process after ``fork``.
+
+    :rtype: None
+    """
+    for lazy in list(_proxies):
+        if not is_constructed(lazy):
+            object.__setattr__(lazy, "_Lazy__lock", Lock())
@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 
 class Metrics(ABC):
-    """Abstract class declaring interface for collecting metrics from decorator resolver."""
+    """Abstract class declaring interface for collecting metrics from decorator resolver.
+
+    Metrics are named by the injected function's name, set `qualified_names` to ``True`` to name them by
+    the module and qualified name instead, e.g. ``app.handlers.index``.
+    """
+
+    #: If set to ``True``, metrics are named by the injected function's module and qualified name.
+    qualified_names = False
 
     @abstractmethod
     def save_metric(self, name: str, time_spent: float) -> None:
@@ -17,3 +25,57 @@ class Metrics(ABC):
         :rtype: None
         """
         ...
+
+
+class ResolutionEvent:
+    """Information about a dependency requested from the container."""
+
+    __slots__ = ("dependency", "scope_depth", "duration", "cache_hit", "parent")
+
+    def __init__(self, dependency: Any, scope_depth: int, duration: float, cache_hit: bool, parent: Any) -> None:
+        """ResolutionEvent constructor.
+
+        :param dependency: The requested dependency.
+        :type dependency: Any
+
+        :param scope_depth: Number of parent containers of the container resolving the dependency.
+        :type scope_depth: int
+
+        :param duration: Time spent constructing the dependency including its own dependencies, in seconds.
+        :type duration: float
+
+        :param cache_hit: ``True`` if an already constructed instance was used.
+        :type cache_hit: bool
+
+        :param parent: The dependency which requested this one, ``None`` for dependencies requested directly.
+        :type parent: Any
+        """
+        self.dependency = dependency
+        self.scope_depth = scope_depth
+        self.duration = duration
+        self.cache_hit = cache_hit
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        return (
+            f"ResolutionEvent(dependency={self.dependency!r}, scope_depth={self.scope_depth}, "
+            f"duration={self.duration}, cache_hit={self.cache_hit}, parent={self.parent!r})"
+        )
+
+
+class ResolutionListener(ABC):
+    """Abstract class declaring interface for observing dependency resolution.
+
+    Listeners are opt-in, resolution without any listener doesn't create any events.
+    """
+
+    @abstractmethod
+    def on_resolution(self, event: ResolutionEvent) -> None:
+        """This method is triggered whenever a dependency is constructed or taken from the container.
+
+        :param event: The resolution event.
+        :type event: ResolutionEvent
+
+        :rtype: None
+        """
+        ...
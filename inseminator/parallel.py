@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+from .graph import DependencyGraph, GraphNode
+
+if TYPE_CHECKING:
+    from .resolver import Dependable, DependencyResolver
+
+
+class _Node:
+    __slots__ = ("graph_node", "parents", "remaining")
+
+    def __init__(self, graph_node: GraphNode) -> None:
+        self.graph_node = graph_node
+        self.parents: List[_Node] = []
+        self.remaining = 0
+
+
+class ParallelBuilder:
+    """Constructs dependencies using an executor.
+
+    The dependency graph (see `inseminator.graph.DependencyGraph`) is computed first, without constructing
+    anything. Afterwards, every dependency whose own dependencies are constructed is submitted to the executor,
+    so independent branches of the graph are constructed in parallel. Unlike `DependencyResolver.resolve`,
+    which constructs a dependency for every place it is requested from, a dependency is constructed only once
+    per build.
+
+    Registered dependencies, lazy dependencies and settings are taken from the resolver directly in the
+    calling thread. If the resolver has a listener, every constructed dependency is reported, its parent is
+    one of the dependencies requesting it.
+    """
+
+    def __init__(self, resolver: DependencyResolver, executor: Executor) -> None:
+        """ParallelBuilder constructor.
+
+        :param resolver: Resolver used to look up registered dependencies.
+        :type resolver: DependencyResolver
+
+        :param executor: Executor running the constructors.
+        :type executor: Executor
+        """
+        self._resolver = resolver
+        self._executor = executor
+
+    def build(
+        self,
+        roots: Sequence[Dependable],
+        parameters: Optional[Dict[str, Any]] = None,
+        built: Optional[Callable[[Any, Dict[Any, Any]], None]] = None,
+    ) -> Dict[Any, Any]:
+        """Construct the roots and all their dependencies.
+
+        :param roots: Dependencies to be constructed.
+        :type roots: Sequence[Dependable]
+
+        :param parameters: Parameters to be forcefully used when constructing the first root.
+        :type parameters: Dict[str, Any] | None
+
+        :param built: Called in the calling thread with every dependency and the instances constructed so far
+            as soon as the dependency is available, before the rest of the graph is constructed.
+        :type built: Callable[[Any, Dict[Any, Any]], None] | None
+
+        :return: Mapping from dependencies to constructed instances.
+        :rtype: Dict[Any, Any]
+        """
+        graph = DependencyGraph(self._resolver, roots, parameters)
+
+        instances: Dict[Any, Any] = {}
+        nodes: Dict[Any, _Node] = {}
+
+        for dependency in graph.topological_order():
+            graph_node = graph.nodes[dependency]
+
+            if graph_node.external:
+                instances[dependency] = self._resolver.resolve(dependency).get_instance()
+
+                if built is not None:
+                    built(dependency, instances)
+
+                continue
+
+            node = nodes[dependency] = _Node(graph_node)
+
+            for required in graph.dependencies(dependency):
+                # `invalidate` of the required dependency forgets the constructed one
+                self._resolver.record_dependent(required, dependency)
+
+                if (child := nodes.get(required)) is not None:
+                    child.parents.append(node)
+                    node.remaining += 1
+
+        ready = [node for node in nodes.values() if node.remaining == 0]
+        running: Dict[Future[Any], _Node] = {}
+        error: Optional[BaseException] = None
+
+        while ready or running:
+            if error is None:
+                for node in ready:
+                    running[self._executor.submit(self._construct, node, instances)] = node
+
+            ready = []
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                node = running.pop(future)
+
+                if error is not None:
+                    continue
+
+                if (exception := future.exception()) is not None:
+                    error = exception
+                    continue
+
+                instances[node.graph_node.dependency] = future.result()
+
+                if built is not None:
+                    built(node.graph_node.dependency, instances)
+
+                for parent in node.parents:
+                    parent.remaining -= 1
+
+                    if parent.remaining == 0:
+                        ready.append(parent)
+
+        if error is not None:
+            raise error
+
+        return instances
+
+    def _construct(self, node: _Node, instances: Dict[Any, Any]) -> Any:
+        graph_node = node.graph_node
+        args = {name: instances[hint] for name, hint in graph_node.arguments}
+        start = time.perf_counter()
+        instance = graph_node.dependency(**graph_node.forced, **args)
+        # dependencies are already constructed, the duration covers only the constructor
+        parent = node.parents[0].graph_node.dependency if node.parents else None
+        self._resolver._emit(graph_node.dependency, time.perf_counter() - start, False, parent)
+        return instance
@@ -0,0 +1,246 @@
+import inspect
+import weakref
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    MutableMapping,
+    Optional,
+    Protocol,
+    Tuple,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from .base_settings import BaseSettings
+from .exceptions import ResolverError
+from .lazy import Lazy
+
+
+class ParameterPlan:
+    """Resolution recipe for a single parameter of a dependency."""
+
+    __slots__ = ("name", "hint", "default", "has_default")
+
+    def __init__(self, name: str, hint: Any, default: Any) -> None:
+        """ParameterPlan constructor.
+
+        :param name: Name of the parameter.
+        :type name: str
+
+        :param hint: Resolved type hint of the parameter.
+        :type hint: Any
+
+        :param default: Default value of the parameter or ``inspect.Signature.empty``.
+        :type default: Any
+        """
+        self.name = name
+        self.hint = hint
+        self.default = default
+        self.has_default = default is not inspect.Signature.empty
+
+
+class ResolutionPlan:
+    """Everything `DependencyResolver` needs to know about a dependency to construct it.
+
+    The plan is computed using ``get_type_hints`` and ``inspect.signature`` only once per dependency
+    and it is shared by all containers.
+    """
+
+    __slots__ = (
+        "is_class",
+        "is_settings",
+        "is_protocol",
+        "lazy_target",
+        "parameter_names",
+        "parameters",
+        "number_of_parameters",
+    )
+
+    def __init__(
+        self,
+        *,
+        is_class: bool,
+        is_settings: bool = False,
+        is_protocol: bool = False,
+        lazy_target: Any = None,
+        parameter_names: FrozenSet[str] = frozenset(),
+        parameters: Tuple[ParameterPlan, ...] = (),
+        number_of_parameters: int = 0,
+    ) -> None:
+        """ResolutionPlan constructor.
+
+        :param is_class: Whether the dependency is a class.
+        :type is_class: bool
+
+        :param is_settings: Whether the dependency is a pydantic ``BaseSettings`` subclass.
+        :type is_settings: bool
+
+        :param is_protocol: Whether the dependency is a ``Protocol`` which can't be instantiated.
+        :type is_protocol: bool
+
+        :param lazy_target: Dependency wrapped in ``Lazy[...]``, ``None`` if the dependency is not lazy.
+        :type lazy_target: Any
+
+        :param parameter_names: Names of all type-hinted parameters (including ``return``).
+        :type parameter_names: FrozenSet[str]
+
+        :param parameters: Type-hinted parameters in the signature order.
+        :type parameters: Tuple[ParameterPlan, ...]
+
+        :param number_of_parameters: Number of parameters which must be provided to construct the dependency.
+        :type number_of_parameters: int
+        """
+        self.is_class = is_class
+        self.is_settings = is_settings
+        self.is_protocol = is_protocol
+        self.lazy_target = lazy_target
+        self.parameter_names = parameter_names
+        self.parameters = parameters
+        self.number_of_parameters = number_of_parameters
+
+
+def build_plan(dependency: Any) -> ResolutionPlan:
+    """Introspect the dependency and create its `ResolutionPlan`.
+
+    :param dependency: Class or function to be introspected.
+    :type dependency: Any
+
+    :return: The plan.
+    :rtype: ResolutionPlan
+    """
+    callable_dependency: Callable[..., Any]
+    is_class = False
+
+    if get_origin(dependency) is Lazy:
+        return ResolutionPlan(is_class=False, lazy_target=get_args(dependency)[0])
+
+    if inspect.isclass(dependency):
+        if issubclass(cast(type, dependency), BaseSettings):
+            return ResolutionPlan(is_class=True, is_settings=True)
+
+        if issubclass(cast(type, dependency), cast(type, Protocol)):
+            return ResolutionPlan(is_class=True, is_protocol=True)
+
+        callable_dependency = dependency.__init__
+        is_class = True
+    elif inspect.isfunction(dependency):
+        callable_dependency = dependency
+    else:
+        raise ResolverError(f"Dependency must be a function or a class, {dependency} found.")
+
+    type_hints = get_type_hints(callable_dependency)
+    signature_parameters = inspect.signature(callable_dependency).parameters
+
+    parameters = tuple(
+        ParameterPlan(name, hint, signature_parameters[name].default)
+        for name, hint in type_hints.items()
+        if name != "return"
+    )
+
+    skippable_params = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    number_of_parameters = len([p for p in signature_parameters.values() if p.kind not in skippable_params])
+
+    if is_class:
+        # because the callable is init and the self must be skipped
+        number_of_parameters -= 1
+
+    return ResolutionPlan(
+        is_class=is_class,
+        parameter_names=frozenset(type_hints.keys()),
+        parameters=parameters,
+        number_of_parameters=number_of_parameters,
+    )
+
+
+class PlanCache:
+    """Cache of `ResolutionPlan` objects keyed by weak references to the dependencies.
+
+    Dependencies which can't be weakly referenced are introspected every time.
+    """
+
+    def __init__(self) -> None:
+        """PlanCache constructor."""
+        self._plans: MutableMapping[Any, ResolutionPlan] = weakref.WeakKeyDictionary()
+        #: Incremented on every invalidation so that derived caches can detect stale entries.
+        self.generation = 0
+
+    def get(self, dependency: Any) -> ResolutionPlan:
+        """Return the plan for the dependency, introspect it if it is not cached yet.
+
+        :param dependency: Class or function.
+        :type dependency: Any
+
+        :return: The plan.
+        :rtype: ResolutionPlan
+        """
+        try:
+            return self._plans[dependency]
+        except (KeyError, TypeError):
+            pass
+
+        plan = build_plan(dependency)
+
+        try:
+            self._plans[dependency] = plan
+        except TypeError:
+            pass
+
+        return plan
+
+    def invalidate(self, dependency: Optional[Any] = None) -> None:
+        """Remove the plan of the dependency from the cache. If dependency is not specified, remove all plans.
+
+        :param dependency: Class or function.
+        :type dependency: Any | None
+
+        :rtype: None
+        """
+        self.generation += 1
+
+        if dependency is None:
+            self._plans.clear()
+        else:
+            try:
+                del self._plans[dependency]
+            except (KeyError, TypeError):
+                pass
+
+    def __contains__(self, dependency: object) -> bool:
+        try:
+            return dependency in self._plans
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+#: Process-wide plan cache shared by all containers.
+plan_cache = PlanCache()
+
+
+def get_plan(dependency: Any) -> ResolutionPlan:
+    """Return the plan for the dependency from the process-wide cache.
+
+    :param dependency: Class or function.
+    :type dependency: Any
+
+    :return: The plan.
+    :rtype: ResolutionPlan
+    """
+    return plan_cache.get(dependency)
+
+
+def invalidate_plans(dependency: Optional[Any] = None) -> None:
+    """Invalidate cached plans. Must be called when a signature of already resolved class or function changes
+    at runtime (e.g. after monkeypatching ``__init__`` or reloading a module).
+
+    :param dependency: Class or function. If not specified, the whole cache is invalidated.
+    :type dependency: Any | None
+
+    :rtype: None
+    """
+    plan_cache.invalidate(dependency)
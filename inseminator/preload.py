@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from threading import Condition, Thread
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Set
+
+from .decorator import DecoratorResolver, function_name
+from .parallel import ParallelBuilder
+
+if TYPE_CHECKING:
+    from .resolver import DependencyResolver
+
+
+class PreloadHandle:
+    """Progress of injected functions preloaded in the background, see `Container.preload_injected_background`.
+
+    Example marking a worker ready once the critical handlers are preloaded::
+
+        handle = container.preload_injected_background(executor)
+        start_listening()
+
+        if handle.wait(timeout=30, functions=[index, checkout]):
+            mark_ready()
+    """
+
+    def __init__(self, decorator_resolvers: Sequence[DecoratorResolver]) -> None:
+        """PreloadHandle constructor.
+
+        :param decorator_resolvers: Resolvers of the preloaded functions.
+        :type decorator_resolvers: Sequence[DecoratorResolver]
+        """
+        self._condition = Condition()
+        self._decorator_resolvers = list(decorator_resolvers)
+        self._pending = set(self._decorator_resolvers)
+        self._errors: Dict[str, BaseException] = {}
+
+    @property
+    def total(self) -> int:
+        """Number of preloaded functions."""
+        return len(self._decorator_resolvers)
+
+    @property
+    def completed(self) -> int:
+        """Number of functions whose preload finished, successfully or not."""
+        with self._condition:
+            return self.total - len(self._pending)
+
+    @property
+    def failed(self) -> int:
+        """Number of functions whose preload failed."""
+        with self._condition:
+            return len(self._errors)
+
+    @property
+    def errors(self) -> Dict[str, BaseException]:
+        """Errors raised while preloading functions by the module and qualified name of the function."""
+        with self._condition:
+            return dict(self._errors)
+
+    def done(self) -> bool:
+        """Check whether all functions are preloaded.
+
+        :rtype: bool
+        """
+        with self._condition:
+            return not self._pending
+
+    def wait(self, timeout: Optional[float] = None, functions: Optional[Sequence[Callable[..., Any]]] = None) -> bool:
+        """Wait until the functions are preloaded.
+
+        :param timeout: Maximal time to wait in seconds, ``None`` waits without any limit.
+        :type timeout: float | None
+
+        :param functions: Injected functions to wait for, all functions by default.
+        :type functions: Sequence[Callable[..., Any]] | None
+
+        :return: ``True`` if the preload of the functions finished, even if it failed, ``False`` on timeout.
+        :rtype: bool
+        """
+        if functions is None:
+            waited = set(self._decorator_resolvers)
+        else:
+            names = {function_name(fn) for fn in functions}
+            waited = {d for d in self._decorator_resolvers if d.name in names}
+
+        with self._condition:
+            return self._condition.wait_for(lambda: not (waited & self._pending), timeout)
+
+    def _is_pending(self, decorator_resolver: DecoratorResolver) -> bool:
+        with self._condition:
+            return decorator_resolver in self._pending
+
+    def _complete(self, decorator_resolver: DecoratorResolver, error: Optional[BaseException] = None) -> None:
+        with self._condition:
+            self._pending.discard(decorator_resolver)
+
+            if error is not None:
+                self._errors[decorator_resolver.name] = error
+
+            self._condition.notify_all()
+
+
+def start_preload(
+    resolver: DependencyResolver, decorator_resolvers: Sequence[DecoratorResolver], executor: Optional[Executor]
+) -> PreloadHandle:
+    """Preload the injected functions in a background thread.
+
+    With an executor, dependencies of all functions are constructed at once using `ParallelBuilder`. If
+    that fails, the functions are preloaded one by one to find out which of them fail.
+
+    :param resolver: Resolver used for the parallel construction.
+    :type resolver: DependencyResolver
+
+    :param decorator_resolvers: Resolvers of the injected functions.
+    :type decorator_resolvers: Sequence[DecoratorResolver]
+
+    :param executor: Executor constructing independent dependencies in parallel.
+    :type executor: Executor | None
+
+    :return: Handle reporting the progress.
+    :rtype: PreloadHandle
+    """
+    handle = PreloadHandle(decorator_resolvers)
+    thread = Thread(target=_preload, args=(handle, resolver, list(decorator_resolvers), executor), daemon=True)
+    thread.start()
+    return handle
+
+
+def _preload(
+    handle: PreloadHandle,
+    resolver: DependencyResolver,
+    decorator_resolvers: List[DecoratorResolver],
+    executor: Optional[Executor],
+) -> None:
+    if executor is not None:
+        try:
+            preload_parallel(resolver, decorator_resolvers, executor, handle._complete)
+        except Exception:
+            pass
+
+        # functions which were not preloaded because the construction failed are preloaded one by one
+        decorator_resolvers = [d for d in decorator_resolvers if handle._is_pending(d)]
+
+    for decorator_resolver in decorator_resolvers:
+        try:
+            decorator_resolver.preload()
+        except Exception as e:
+            handle._complete(decorator_resolver, e)
+        else:
+            handle._complete(decorator_resolver)
+
+
+def preload_parallel(
+    resolver: DependencyResolver,
+    decorator_resolvers: Sequence[DecoratorResolver],
+    executor: Executor,
+    preloaded: Optional[Callable[[DecoratorResolver], None]] = None,
+) -> None:
+    """Construct dependencies of all injected functions at once using `ParallelBuilder`. Every function is
+    preloaded as soon as its own dependencies are constructed. Until then, calls of the function wait instead
+    of constructing the dependencies again.
+
+    :param resolver: Resolver used for the parallel construction.
+    :type resolver: DependencyResolver
+
+    :param decorator_resolvers: Resolvers of the injected functions.
+    :type decorator_resolvers: Sequence[DecoratorResolver]
+
+    :param executor: Executor constructing independent dependencies in parallel.
+    :type executor: Executor
+
+    :param preloaded: Called with every preloaded function in the calling thread.
+    :type preloaded: Callable[[DecoratorResolver], None] | None
+
+    :rtype: None
+    """
+    # functions whose lock is held by this thread until they are preloaded
+    held: List[DecoratorResolver] = []
+    remaining: Dict[DecoratorResolver, Set[Any]] = {}
+    requested: Dict[Any, List[DecoratorResolver]] = {}
+
+    def release(decorator_resolver: DecoratorResolver) -> None:
+        held.remove(decorator_resolver)
+        decorator_resolver.lock.release()
+
+        if preloaded is not None:
+            preloaded(decorator_resolver)
+
+    def built(dependency: Any, instances: Dict[Any, Any]) -> None:
+        for decorator_resolver in requested.pop(dependency, ()):
+            remaining[decorator_resolver].discard(dependency)
+
+            if not remaining[decorator_resolver]:
+                decorator_resolver.preload_from(instances)
+                release(decorator_resolver)
+
+    try:
+        for decorator_resolver in decorator_resolvers:
+            decorator_resolver.lock.acquire()
+            held.append(decorator_resolver)
+
+        for decorator_resolver in list(held):
+            dependencies = set(decorator_resolver.get_cached_dependencies())
+
+            if decorator_resolver.preloaded or not dependencies:
+                decorator_resolver.preload_from({})
+                release(decorator_resolver)
+                continue
+
+            remaining[decorator_resolver] = dependencies
+
+            for dependency in dependencies:
+                requested.setdefault(dependency, []).append(decorator_resolver)
+
+        if requested:
+            ParallelBuilder(resolver, executor).build(list(requested), built=built)
+    finally:
+        for decorator_resolver in held:
+            decorator_resolver.lock.release()
@@ -1,23 +1,145 @@
+import asyncio
 import inspect
-from typing import Any, Callable, Dict, Optional, Protocol, Type, Union, cast, get_type_hints
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar, Token
+from functools import partial
+from threading import RLock
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type, Union, cast
 
-from .base_settings import BaseSettings
-from .dependency import Dependency, StaticDependency
+from .compiler import Factory, compile_factory
+from .dependency import AsyncDependency, Dependency, Provider, Recipe, Scoped, StaticDependency
 from .exceptions import ResolverError
+from .graph import DependencyGraph
+from .lazy import Lazy
+from .metrics import ResolutionEvent, ResolutionListener
+from .plan import ResolutionPlan, get_plan
 from .scoped_dict import ScopedDict
 
 Dependable = Union[Callable[..., Any], Type[Any]]
 
+_MISSING: Any = object()
+
+#: Dependency whose dependencies are being resolved, used only if a listener is set.
+_parent: ContextVar[Any] = ContextVar("inseminator_parent", default=None)
+
+
+class _Frame:
+    __slots__ = ("dependency", "plan", "args", "name", "index", "parent", "token", "start")
+
+    def __init__(self, dependency: Any, plan: ResolutionPlan, args: Dict[str, Any], name: str) -> None:
+        self.dependency = dependency
+        self.plan = plan
+        self.args = args
+        # name of the parameter of the previous frame the instance is passed to
+        self.name = name
+        self.index = 0
+        self.parent: Any = None
+        self.token: Optional[Token[Any]] = None
+        self.start = 0.0
+
 
 class DependencyResolver:
-    def __init__(self, container: ScopedDict[Dependable, Dependency]) -> None:
+    def __init__(
+        self,
+        container: ScopedDict[Dependable, Dependency],
+        compiled: bool = False,
+        factories: Optional[Dict[Dependable, Factory]] = None,
+        listener: Optional[ResolutionListener] = None,
+        recipes: Optional[Dict[Dependable, Recipe]] = None,
+    ) -> None:
         """DependencyResolver constructor.
 
+        Introspection results (see `inseminator.plan.ResolutionPlan`) are stored in the process-wide plan cache
+        so they are shared between all resolvers, i.e. all containers and their sub-containers.
+
         :param container: The container with registered and resolved dependencies.
         :type container: ScopedDict[Dependable, Dependency]
+
+        :param compiled: If set to ``True``, dependencies are constructed using generated factories.
+        :type compiled: bool
+
+        :param factories: Ahead-of-time compiled factories, see `inseminator.aot`.
+        :type factories: Dict[Dependable, Factory] | None
+
+        :param listener: Listener notified about every resolved dependency.
+        :type listener: ResolutionListener | None
+
+        :param recipes: Recipes of registered dependencies which are not constructed by providers, see
+            `construct_registered`.
+        :type recipes: Dict[Dependable, Recipe] | None
         """
 
         self._container = container
+        self._compiled = compiled
+        self._factories = factories if factories is not None else {}
+        self._listener = listener
+        self._recipes = recipes if recipes is not None else {}
+        #: Teardown of dependencies created by context-manager factories, see `Container.close`.
+        self.exit_stack = ExitStack()
+        self._scoped: Dict[Dependable, bool] = {}
+        self._scoped_version = -1
+        self._overridden: Dict[FrozenSet[Dependable], Dict[Dependable, bool]] = {}
+        self._overridden_version = -1
+        # reverse-dependency index, dependencies are recorded when they are constructed for the first time
+        self._dependents: Dict[Dependable, Set[Dependable]] = {}
+        self._recorded: Set[Dependable] = set()
+        # guards caches of dependencies shared between scopes, see `resolve_scoped`
+        self._shared_lock = RLock()
+        # classes or factories constructing registered providers and async dependencies they require
+        self._targets: Dict[Dependable, Tuple[Dependable, Optional[Dict[str, Any]]]] = {}
+        self._async: Dict[Dependable, Tuple[AsyncDependency, ...]] = {}
+        self._async_version = -1
+
+    def lookup(self, dependency: Dependable) -> Optional[Dependency]:
+        """Return the dependency registered in the container.
+
+        :param dependency: Class to be found.
+        :type dependency: Dependable
+
+        :return: Registered dependency or ``None`` if it is not registered.
+        :rtype: Dependency | None
+        """
+        registered = self._container.lookup(dependency)
+
+        if isinstance(registered, Scoped) and registered.resolver is not self:
+            # the dependency was registered in a parent scope, this scope needs its own instance
+            if (parent := registered.resolver) is not None and (target := parent._targets.get(dependency)) is not None:
+                self._targets[dependency] = target
+
+            registered = registered.for_scope(self)
+            self._container[dependency] = registered
+
+        return registered
+
+    def reset_lock(self) -> None:
+        """Replace the lock guarding caches of dependencies shared between scopes, e.g. in a child process after
+        ``fork``.
+
+        :rtype: None
+        """
+        self._shared_lock = RLock()
+
+    def _get_instance(self, dependency: Dependable) -> Any:
+        return self.resolve(dependency).get_instance()
+
+    def compile(self, dependency: Dependable) -> Optional[Callable[[], Any]]:
+        """Generate a factory constructing the dependency without any introspection.
+
+        Dependencies registered in the container are still looked up when the factory is called.
+
+        :param dependency: Class or function to be compiled.
+        :type dependency: Dependable
+
+        :return: Function returning a new instance or ``None`` if the dependency can't be compiled.
+        :rtype: Callable[[], Any] | None
+        """
+        factory = compile_factory(dependency)
+
+        if factory is None:
+            return None
+
+        return partial(factory, self)
 
     def resolve(self, dependency: Dependable, parameters: Optional[Dict[str, Any]] = None) -> Dependency:
         """Resolve the dependency based on input parameters.
@@ -32,61 +154,827 @@ class DependencyResolver:
         :type: Dependency
         """
 
-        if dependency in self._container:
-            return self._container[dependency]
+        if self._listener is not None:
+            return self._observed_resolve(dependency, parameters)
 
-        callable_dependency: Callable[..., Any]
-        is_class = False
-        if inspect.isclass(dependency):
-            if issubclass(cast(type, dependency), BaseSettings):
-                return StaticDependency(dependency())
+        if (registered := self.lookup(dependency)) is not None:
+            return registered
 
-            if issubclass(cast(type, dependency), cast(type, Protocol)):
-                raise ResolverError(f"Implementation for {dependency.__name__} protocol is not defined.")
+        return self.construct(dependency, parameters)
 
-            callable_dependency = dependency.__init__  # type: ignore
-            is_class = True
-        elif inspect.isfunction(dependency):
-            callable_dependency = dependency
-        else:
-            raise ResolverError(f"Dependency must be a function or a class, {dependency} found.")
+    def construct(self, dependency: Dependable, parameters: Optional[Dict[str, Any]] = None) -> Dependency:
+        """Construct the dependency even if it is registered, its own dependencies are resolved.
 
-        type_hints = get_type_hints(callable_dependency)
-        args: Dict[str, Any] = {}
+        :param dependency: Dependable
+        :type dependency: Class to be constructed.
 
-        if parameters:
-            parameter_names = type_hints.keys()
+        :param parameters: Provided parameters to construct the object.
+        :type parameters: Optional[Dict[str, Any]]
 
-            for parameter_name, parameter_value in parameters.items():
-                if parameter_name not in parameter_names:
-                    raise ResolverError(f"Parameter {parameter_name} it not part of {dependency.__name__}'s signature.")
+        :return: Constructed dependency.
+        :type: Dependency
+        """
 
-                args[parameter_name] = parameter_value
+        if dependency not in self._recorded:
+            self._record(dependency)
 
-        signature_parameters = inspect.signature(callable_dependency).parameters
-        for parameter_name, parameter_dependency in type_hints.items():
-            if parameter_name == "return" or parameter_name in args:
-                continue
+        if self._listener is not None:
+            # generated factories don't report their dependencies, the plan is interpreted instead
+            return cast(Dependency, self._observed(self._construct_plan, dependency, parameters))
+
+        if not parameters:
+            if (factory := self._factories.get(dependency)) is not None:
+                return StaticDependency(instance=factory(self))
+
+            if self._compiled and (factory := compile_factory(dependency)) is not None:
+                return StaticDependency(instance=factory(self))
+
+        return self._construct_plan(dependency, parameters)
+
+    def construct_registered(self, dependency: Dependable) -> Any:
+        """Construct a new instance of the dependency the same way as its registration, e.g. using the registered
+        factory. Registered values are returned as they are and dependencies which are not registered are
+        constructed using `construct`.
+
+        :param dependency: Class to be constructed.
+        :type dependency: Dependable
+
+        :return: Constructed instance.
+        :rtype: Any
+        """
+        if isinstance(registered := self.lookup(dependency), Provider):
+            return registered.create()
+
+        if (recipe := self._recipes.get(dependency)) is not None:
+            return recipe(self)
+
+        if registered is not None:
+            return registered.get_instance()
+
+        return self.construct(dependency).get_instance()
+
+    def construct_interpreted(self, dependency: Dependable) -> Any:
+        """Construct the dependency even if it is registered, without calling any generated factory. Generated
+        factories use it for dependencies nested deeper than `inseminator.compiler.MAX_COMPILED_DEPTH`, the
+        whole graph of the dependency is then constructed using an explicit stack.
+
+        :param dependency: Class to be constructed.
+        :type dependency: Dependable
+
+        :return: Constructed instance.
+        :rtype: Any
+        """
+        return self._construct_plan(dependency, None, False).get_instance()
+
+    def _construct_plan(
+        self, dependency: Dependable, parameters: Optional[Dict[str, Any]], factories: bool = True
+    ) -> Dependency:
+        plan = get_plan(dependency)
+
+        if plan.lazy_target is not None:
+            return StaticDependency(Lazy(partial(self._get_instance, plan.lazy_target)))
+
+        if plan.is_settings:
+            return StaticDependency(dependency())
+
+        if plan.is_protocol:
+            raise ResolverError(f"Implementation for {dependency.__name__} protocol is not defined.")
+
+        # dependencies constructed from their plans are kept on an explicit stack instead of recursion,
+        # so the depth of the graph is not limited by the recursion limit
+        stack = [_Frame(dependency, plan, self._forced_arguments(dependency, plan, parameters), "")]
+        constructing = {dependency}
+        # number of frames on the path to the dependency which caused an error
+        failing = 0
+
+        try:
+            while True:
+                frame = stack[-1]
+                frame_parameters = frame.plan.parameters
+                child: Optional[_Frame] = None
+                failing = len(stack)
+
+                while frame.index < len(frame_parameters):
+                    parameter = frame_parameters[frame.index]
+                    frame.index += 1
+
+                    if parameter.name in frame.args:
+                        continue
+
+                    if parameter.has_default:
+                        frame.args[parameter.name] = parameter.default
+                        continue
+
+                    instance, child_plan = self._resolve_leaf(parameter.hint, factories)
+
+                    if child_plan is None:
+                        frame.args[parameter.name] = instance
+                        continue
+
+                    if parameter.hint in constructing:
+                        raise ResolverError(f"Cyclic dependency on {parameter.hint} detected.")
+
+                    child = _Frame(parameter.hint, child_plan, {}, parameter.name)
+                    break
+
+                if child is not None:
+                    if self._listener is not None:
+                        child.parent = frame.dependency
+                        child.token = _parent.set(child.dependency)
+                        child.start = time.perf_counter()
 
-            if (default_value := signature_parameters[parameter_name].default) != inspect.Signature.empty:
-                args[parameter_name] = default_value
+                    stack.append(child)
+                    constructing.add(child.dependency)
+                    continue
+
+                failing = len(stack) - 1
+                self._check_missing(frame.dependency, frame.plan, frame.args)
+                instance = frame.dependency(**frame.args)
+                stack.pop()
+                constructing.discard(frame.dependency)
+
+                if frame.token is not None:
+                    _parent.reset(frame.token)
+                    frame.token = None
+                    self._emit(frame.dependency, time.perf_counter() - frame.start, False, frame.parent)
+
+                if not stack:
+                    return StaticDependency(instance=instance)
+
+                stack[-1].args[frame.name] = instance
+        except ResolverError as e:
+            if failing == 0:
+                raise
+
+            raise ResolverError("".join(f"{f.dependency} -> " for f in stack[:failing]) + str(e))
+        finally:
+            for frame in reversed(stack):
+                if frame.token is not None:
+                    _parent.reset(frame.token)
+
+    def _resolve_leaf(self, dependency: Dependable, factories: bool = True) -> Tuple[Any, Optional[ResolutionPlan]]:
+        # resolve the dependency unless it must be constructed from its plan, the plan is returned instead
+        start = time.perf_counter() if self._listener is not None else 0.0
+
+        if (registered := self.lookup(dependency)) is not None:
+            if self._listener is not None:
+                self._observe_registered(dependency, registered, start)
+
+            return registered.get_instance(), None
+
+        if self._listener is None and factories:
+            if (factory := self._factories.get(dependency)) is None and self._compiled:
+                factory = compile_factory(dependency)
+
+            if factory is not None:
+                return factory(self), None
+
+        plan = get_plan(dependency)
+
+        if plan.lazy_target is not None or plan.is_settings or plan.is_protocol:
+            return self.construct(dependency).get_instance(), None
+
+        return None, plan
+
+    def _observed_resolve(self, dependency: Dependable, parameters: Optional[Dict[str, Any]]) -> Dependency:
+        start = time.perf_counter()
+
+        if (registered := self.lookup(dependency)) is not None:
+            self._observe_registered(dependency, registered, start)
+            return registered
+
+        return self.construct(dependency, parameters)
+
+    def _observe_registered(self, dependency: Dependable, registered: Dependency, start: float) -> None:
+        # providers constructing the instance now report the construction instead
+        if not isinstance(registered, Provider) or registered.is_constructed():
+            self._emit(dependency, time.perf_counter() - start, True, _parent.get())
+
+    def _observed(self, method: Callable[..., Any], dependency: Dependable, *args: Any) -> Any:
+        parent = _parent.get()
+        token = _parent.set(dependency)
+        start = time.perf_counter()
+
+        try:
+            result = method(dependency, *args)
+        finally:
+            _parent.reset(token)
+
+        self._emit(dependency, time.perf_counter() - start, False, parent)
+        return result
+
+    def _emit(self, dependency: Dependable, duration: float, cache_hit: bool, parent: Any) -> None:
+        if self._listener is not None:
+            self._listener.on_resolution(
+                ResolutionEvent(dependency, self._container.depth, duration, cache_hit, parent)
+            )
+
+    def is_scoped(self, dependency: Dependable) -> bool:
+        """Check whether the dependency must be constructed once per scope, i.e. whether it is registered
+        as `Scoped` or `Transient` or whether it is not registered and any of its dependencies is scoped.
+
+        :param dependency: Class to be checked.
+        :type dependency: Dependable
+
+        :rtype: bool
+        """
+        if self._scoped_version != self._container.version:
+            self._scoped.clear()
+            self._scoped_version = self._container.version
+
+        if (scoped := self._scoped.get(dependency)) is not None:
+            return scoped
+
+        # the graph can be deeper than the recursion limit, dependencies on the stack are checked when all their
+        # dependencies are known; results are published when they are final, see `depends_on`
+        computing: Dict[Any, bool] = {}
+        stack: List[Tuple[Dependable, List[Dependable], List[int]]] = []
+        self._push_scoped(dependency, computing, stack)
+
+        while stack:
+            current, hints, index = stack[-1]
+
+            while index[0] < len(hints):
+                hint = hints[index[0]]
+
+                if (known := self._scoped.get(hint)) is None and (known := computing.get(hint)) is None:
+                    break
+
+                index[0] += 1
+
+                if known:
+                    computing[current] = True
+                    index[0] = len(hints)
+
+            if index[0] < len(hints):
+                self._push_scoped(hints[index[0]], computing, stack)
             else:
+                stack.pop()
+
+        self._scoped.update(computing)
+        return computing[dependency]
+
+    def _push_scoped(
+        self,
+        dependency: Dependable,
+        computing: Dict[Any, bool],
+        stack: List[Tuple[Dependable, List[Dependable], List[int]]],
+    ) -> None:
+        # cycles are reported during the construction
+        computing[dependency] = False
+
+        if (registered := self._container.lookup(dependency)) is not None:
+            scoped = isinstance(registered, Scoped) or (isinstance(registered, Provider) and not registered.cacheable)
+            computing[dependency] = scoped
+        elif (hints := self._compiled_dependencies(dependency)) is not None:
+            stack.append((dependency, list(hints), [0]))
+        elif (plan := get_plan(dependency)).lazy_target is None:
+            stack.append((dependency, [p.hint for p in plan.parameters if not p.has_default], [0]))
+
+    def record_dependent(self, dependency: Dependable, dependent: Dependable) -> None:
+        """Record that the dependent is constructed using the dependency, e.g. a registration using a factory.
+
+        :param dependency: The dependency.
+        :type dependency: Dependable
+
+        :param dependent: Dependency constructed using the dependency.
+        :type dependent: Dependable
+
+        :rtype: None
+        """
+        self._dependents.setdefault(dependency, set()).add(dependent)
+
+    def record_target(
+        self, dependency: Dependable, target: Dependable, parameters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record the class or factory which the registered provider of the dependency uses to construct it.
+        `aresolve` awaits async dependencies required by the target before the provider constructs it.
+
+        :param dependency: The registered dependency.
+        :type dependency: Dependable
+
+        :param target: Class or factory constructing the dependency.
+        :type target: Dependable
+
+        :param parameters: Parameters forcefully used when calling the target.
+        :type parameters: Optional[Dict[str, Any]]
+
+        :rtype: None
+        """
+        self._targets[dependency] = (target, parameters)
+
+    def dependents(self, dependency: Dependable) -> Set[Dependable]:
+        """Return all dependencies constructed using the dependency, directly or transitively. Only dependencies
+        which were already constructed by the resolver are known.
+
+        :param dependency: The dependency.
+        :type dependency: Dependable
+
+        :rtype: Set[Dependable]
+        """
+        found: Set[Dependable] = set()
+        stack = [dependency]
+
+        while stack:
+            for dependent in self._dependents.get(stack.pop(), ()):
+                if dependent not in found:
+                    found.add(dependent)
+                    stack.append(dependent)
+
+        found.discard(dependency)
+        return found
+
+    def clear_dependents(self) -> None:
+        """Forget the reverse-dependency index.
+
+        :rtype: None
+        """
+        self._dependents.clear()
+        self._recorded.clear()
+
+    def _record(self, dependency: Dependable) -> None:
+        # the graph can be deeper than the recursion limit
+        self._recorded.add(dependency)
+        stack = [dependency]
+
+        while stack:
+            current = stack.pop()
+
+            if (hints := self._compiled_dependencies(current)) is None:
                 try:
-                    args[parameter_name] = self.resolve(parameter_dependency).get_instance()
-                except ResolverError as e:
-                    raise ResolverError(f"{dependency} -> " + str(e))
+                    plan = get_plan(current)
+                except ResolverError:
+                    # reported by the construction
+                    continue
+
+                if plan.lazy_target is not None:
+                    hints = (plan.lazy_target,)
+                else:
+                    hints = tuple(p.hint for p in plan.parameters if not p.has_default)
+
+            for hint in hints:
+                self._dependents.setdefault(hint, set()).add(current)
+
+                # registered dependencies are recorded when their recipes construct them
+                if hint not in self._recorded and self._container.lookup(hint) is None:
+                    self._recorded.add(hint)
+                    stack.append(hint)
+
+    def _compiled_dependencies(self, dependency: Dependable) -> Optional[Tuple[Dependable, ...]]:
+        # generated factories list the dependencies they request, so recording them needs no introspection
+        if (factory := self._factories.get(dependency)) is None and self._compiled and self._listener is None:
+            factory = compile_factory(dependency)
+
+        return getattr(factory, "__dependencies__", None)
+
+    def depends_on(self, dependency: Dependable, overridden: FrozenSet[Dependable]) -> bool:
+        """Check whether constructing the dependency requires any of the overridden dependencies. Registered
+        dependencies are never constructed again, so they don't depend on anything.
 
-        skippable_params = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
-        injectable_arguments = [p for n, p in signature_parameters.items() if p.kind not in skippable_params]
-        number_of_parameters = len(injectable_arguments)
+        :param dependency: Class to be checked.
+        :type dependency: Dependable
 
-        if is_class:
-            # because the callable is init and the self must be skipped
-            number_of_parameters -= 1
+        :param overridden: Dependencies overridden by an overlay, see `inseminator.container.OverlayContainer`.
+        :type overridden: FrozenSet[Dependable]
 
-        if (missing := number_of_parameters - len(args)) > 0:
+        :rtype: bool
+        """
+        if self._overridden_version != self._container.version:
+            self._overridden.clear()
+            self._overridden_version = self._container.version
+
+        if (known := self._overridden.get(overridden)) is None:
+            known = self._overridden[overridden] = {}
+
+        if dependency in overridden:
+            return True
+
+        if (result := known.get(dependency)) is not None:
+            return result
+
+        # the graph can be deeper than the recursion limit, see `is_scoped`; results are computed locally and
+        # published when they are final, other threads never see the placeholders of unfinished dependencies
+        computing: Dict[Any, bool] = {}
+        stack: List[Tuple[Dependable, List[Dependable], List[int]]] = []
+        self._push_depends_on(dependency, computing, stack)
+
+        while stack:
+            current, hints, index = stack[-1]
+
+            while index[0] < len(hints):
+                hint = hints[index[0]]
+
+                if hint in overridden:
+                    result = True
+                elif (result := known.get(hint)) is None and (result := computing.get(hint)) is None:
+                    break
+
+                index[0] += 1
+
+                if result:
+                    computing[current] = True
+                    index[0] = len(hints)
+
+            if index[0] < len(hints):
+                self._push_depends_on(hints[index[0]], computing, stack)
+            else:
+                stack.pop()
+
+        known.update(computing)
+        return computing[dependency]
+
+    def _push_depends_on(
+        self,
+        dependency: Dependable,
+        computing: Dict[Any, bool],
+        stack: List[Tuple[Dependable, List[Dependable], List[int]]],
+    ) -> None:
+        # cycles are reported during the construction
+        computing[dependency] = False
+
+        if self._container.lookup(dependency) is None:
+            if (plan := get_plan(dependency)).lazy_target is not None:
+                stack.append((dependency, [plan.lazy_target], [0]))
+            else:
+                stack.append((dependency, [p.hint for p in plan.parameters if not p.has_default], [0]))
+
+    def resolve_scoped(self, dependency: Dependable, shared: Dict[Any, Any]) -> Any:
+        """Construct the dependency for a new scope. Its dependencies which are not scoped (see `is_scoped`)
+        are constructed only once and stored in the ``shared`` cache, even if several threads use the cache.
+
+        :param dependency: Class to be constructed.
+        :type dependency: Dependable
+
+        :param shared: Dependencies shared between scopes.
+        :type shared: Dict[Any, Any]
+
+        :return: Constructed dependency.
+        :rtype: Any
+        """
+        if (registered := self.lookup(dependency)) is not None:
+            if self._listener is not None:
+                self._observe_registered(dependency, registered, time.perf_counter())
+
+            return registered.get_instance()
+
+        return self.construct_scoped(dependency, shared)
+
+    def resolve_shared(self, dependency: Dependable, shared: Dict[Any, Any]) -> Any:
+        """Return the dependency shared between scopes, it is resolved and stored in the ``shared`` cache on
+        the first request. Even if several threads use the cache, the dependency is constructed only once.
+
+        :param dependency: Class to be resolved.
+        :type dependency: Dependable
+
+        :param shared: Dependencies shared between scopes.
+        :type shared: Dict[Any, Any]
+
+        :return: Shared dependency.
+        :rtype: Any
+        """
+        if (instance := shared.get(dependency, _MISSING)) is not _MISSING:
+            return instance
+
+        with self._shared_lock:
+            # another thread may have constructed it meanwhile
+            if (instance := shared.get(dependency, _MISSING)) is _MISSING:
+                instance = shared[dependency] = self.resolve(dependency).get_instance()
+
+        return instance
+
+    def construct_scoped(self, dependency: Dependable, shared: Dict[Any, Any]) -> Any:
+        """Construct the dependency for a new scope even if it is registered, see `resolve_scoped`.
+
+        :param dependency: Class to be constructed.
+        :type dependency: Dependable
+
+        :param shared: Dependencies shared between scopes.
+        :type shared: Dict[Any, Any]
+
+        :return: Constructed dependency.
+        :rtype: Any
+        """
+        if dependency not in self._recorded:
+            self._record(dependency)
+
+        if self._listener is not None:
+            return self._observed(self._construct_scoped, dependency, shared)
+
+        return self._construct_scoped(dependency, shared)
+
+    def _construct_scoped(self, dependency: Dependable, shared: Dict[Any, Any]) -> Any:
+        plan = get_plan(dependency)
+
+        if plan.lazy_target is not None or plan.is_settings or plan.is_protocol:
+            return self.construct(dependency).get_instance()
+
+        # scoped dependencies are constructed on an explicit stack, see `_construct_plan`
+        stack = [_Frame(dependency, plan, {}, "")]
+        constructing = {dependency}
+        # number of frames on the path to the dependency which caused an error
+        failing = 0
+
+        try:
+            while True:
+                frame = stack[-1]
+                frame_parameters = frame.plan.parameters
+                child: Optional[_Frame] = None
+                failing = len(stack)
+
+                while frame.index < len(frame_parameters):
+                    parameter = frame_parameters[frame.index]
+                    frame.index += 1
+
+                    if parameter.has_default:
+                        frame.args[parameter.name] = parameter.default
+                        continue
+
+                    hint = parameter.hint
+
+                    if self.is_scoped(hint):
+                        if (registered := self.lookup(hint)) is not None:
+                            if self._listener is not None:
+                                self._observe_registered(hint, registered, time.perf_counter())
+
+                            frame.args[parameter.name] = registered.get_instance()
+                            continue
+
+                        if hint in constructing:
+                            raise ResolverError(f"Cyclic dependency on {hint} detected.")
+
+                        if (child_plan := get_plan(hint)).is_settings or child_plan.is_protocol:
+                            frame.args[parameter.name] = self.construct(hint).get_instance()
+                            continue
+
+                        child = _Frame(hint, child_plan, {}, parameter.name)
+                        break
+                    elif (instance := shared.get(hint, _MISSING)) is not _MISSING:
+                        if self._listener is not None:
+                            self._emit(hint, 0.0, True, frame.dependency)
+                    else:
+                        instance = self.resolve_shared(hint, shared)
+
+                    frame.args[parameter.name] = instance
+
+                if child is not None:
+                    if self._listener is not None:
+                        child.parent = frame.dependency
+                        child.token = _parent.set(child.dependency)
+                        child.start = time.perf_counter()
+
+                    stack.append(child)
+                    constructing.add(child.dependency)
+                    continue
+
+                failing = len(stack) - 1
+                self._check_missing(frame.dependency, frame.plan, frame.args)
+                instance = frame.dependency(**frame.args)
+                stack.pop()
+                constructing.discard(frame.dependency)
+
+                if frame.token is not None:
+                    _parent.reset(frame.token)
+                    frame.token = None
+                    self._emit(frame.dependency, time.perf_counter() - frame.start, False, frame.parent)
+
+                if not stack:
+                    return instance
+
+                stack[-1].args[frame.name] = instance
+        except ResolverError as e:
+            if failing == 0:
+                raise
+
+            raise ResolverError("".join(f"{f.dependency} -> " for f in stack[:failing]) + str(e))
+        finally:
+            for frame in reversed(stack):
+                if frame.token is not None:
+                    _parent.reset(frame.token)
+
+    async def aresolve(self, dependency: Dependable, parameters: Optional[Dict[str, Any]] = None) -> Dependency:
+        """Resolve the dependency, ``async def`` factories are awaited. Independent dependencies
+        are resolved concurrently.
+
+        :param dependency: Dependable
+        :type dependency: Class to be resolved.
+
+        :param parameters: Provided parameters to construct the object.
+        :type parameters: Optional[Dict[str, Any]]
+
+        :return: Constructed dependency.
+        :type: Dependency
+        """
+
+        if self._listener is not None:
+            return await self._observed_aresolve(dependency, parameters)
+
+        if (registered := self.lookup(dependency)) is not None:
+            if isinstance(registered, AsyncDependency):
+                await registered.aget_instance()
+            elif isinstance(registered, Provider) and not registered.is_constructed():
+                await self._await_required(dependency)
+
+            return registered
+
+        return await self._aconstruct(dependency, parameters)
+
+    async def _await_required(self, dependency: Dependable) -> None:
+        # providers construct dependencies synchronously, async dependencies they require are awaited first
+        pending = [d for d in self._required_async(dependency) if not d.is_constructed()]
+
+        if pending:
+            await asyncio.gather(*(d.aget_instance() for d in pending))
+
+    def _required_async(self, dependency: Dependable) -> Tuple[AsyncDependency, ...]:
+        if self._async_version != self._container.version:
+            self._async.clear()
+            self._async_version = self._container.version
+
+        if (found := self._async.get(dependency)) is not None:
+            return found
+
+        required: List[AsyncDependency] = []
+        visited = {dependency}
+        stack = [dependency]
+
+        while stack:
+            registered = self.lookup(current := stack.pop())
+            resolver = registered.resolver if isinstance(registered, Provider) else None
+
+            if resolver is None or (target := resolver._targets.get(current)) is None:
+                continue
+
+            factory, parameters = target
+
+            try:
+                plan = get_plan(factory)
+                forced = self._forced_arguments(factory, plan, parameters)
+                hints = [p.hint for p in plan.parameters if not p.has_default and p.name not in forced]
+                graph = DependencyGraph(resolver, hints)
+            except ResolverError:
+                # reported by the construction
+                continue
+
+            for node in graph:
+                if node in visited or not graph.nodes[node].external:
+                    continue
+
+                visited.add(node)
+
+                if isinstance(required_dependency := resolver.lookup(node), AsyncDependency):
+                    required.append(required_dependency)
+                elif isinstance(required_dependency, Provider):
+                    stack.append(node)
+
+        found = self._async[dependency] = tuple(required)
+        return found
+
+    async def _observed_aresolve(self, dependency: Dependable, parameters: Optional[Dict[str, Any]]) -> Dependency:
+        parent = _parent.get()
+        start = time.perf_counter()
+        registered = self.lookup(dependency)
+
+        if isinstance(registered, Provider) and not registered.is_constructed():
+            await self._await_required(dependency)
+
+        if registered is not None and (not isinstance(registered, AsyncDependency) or registered.is_constructed()):
+            self._observe_registered(dependency, registered, start)
+            return registered
+
+        token = _parent.set(dependency)
+
+        try:
+            if registered is not None:
+                await registered.aget_instance()
+            else:
+                registered = await self._aconstruct(dependency, parameters)
+        finally:
+            _parent.reset(token)
+
+        self._emit(dependency, time.perf_counter() - start, False, parent)
+        return registered
+
+    async def _aconstruct(self, dependency: Dependable, parameters: Optional[Dict[str, Any]]) -> Dependency:
+        if dependency not in self._recorded:
+            self._record(dependency)
+
+        plan = get_plan(dependency)
+
+        if plan.lazy_target is not None:
+            return StaticDependency(Lazy(partial(self._get_instance, plan.lazy_target)))
+
+        if plan.is_settings:
+            return StaticDependency(dependency())
+
+        if plan.is_protocol:
+            raise ResolverError(f"Implementation for {dependency.__name__} protocol is not defined.")
+
+        args = self._forced_arguments(dependency, plan, parameters)
+        pending: List[str] = []
+
+        for parameter in plan.parameters:
+            if parameter.name in args:
+                continue
+
+            if parameter.has_default:
+                args[parameter.name] = parameter.default
+            else:
+                args[parameter.name] = self._aresolve_parameter(dependency, parameter.hint)
+                pending.append(parameter.name)
+
+        if pending:
+            for parameter_name, value in zip(pending, await asyncio.gather(*(args[n] for n in pending))):
+                args[parameter_name] = value
+
+        self._check_missing(dependency, plan, args)
+
+        instance = dependency(**args)
+
+        if not plan.is_class and inspect.isawaitable(instance):
+            instance = await instance
+
+        return StaticDependency(instance=instance)
+
+    async def _aresolve_parameter(self, dependency: Dependable, parameter_dependency: Dependable) -> Any:
+        try:
+            return (await self.aresolve(parameter_dependency)).get_instance()
+        except ResolverError as e:
+            raise ResolverError(f"{dependency} -> " + str(e))
+
+    @staticmethod
+    def _forced_arguments(
+        dependency: Dependable, plan: ResolutionPlan, parameters: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {}
+
+        if parameters:
+            for parameter_name, parameter_value in parameters.items():
+                if parameter_name not in plan.parameter_names:
+                    raise ResolverError(f"Parameter {parameter_name} it not part of {dependency.__name__}'s signature.")
+
+                args[parameter_name] = parameter_value
+
+        return args
+
+    @staticmethod
+    def _check_missing(dependency: Dependable, plan: ResolutionPlan, args: Dict[str, Any]) -> None:
+        if (missing := plan.number_of_parameters - len(args)) > 0:
             raise ResolverError(
                 f"Can resolve dependencies for {dependency}. All type annotations must be specified, {missing} missing."
             )
 
-        return StaticDependency(instance=dependency(**args))
+
+class OverlayResolver(DependencyResolver):
+    """Resolver of `inseminator.container.OverlayContainer`, overridden dependencies take precedence over
+    the dependencies registered in the parent resolver. Dependencies which don't depend on any of the overrides
+    are taken from the parent container."""
+
+    def __init__(
+        self,
+        parent: DependencyResolver,
+        overrides: Dict[Dependable, Dependency],
+        shared: Callable[..., Any],
+    ) -> None:
+        """OverlayResolver constructor.
+
+        :param parent: Resolver of the parent container.
+        :type parent: DependencyResolver
+
+        :param overrides: Overridden dependencies.
+        :type overrides: Dict[Dependable, Dependency]
+
+        :param shared: Function resolving dependencies which don't depend on any of the overrides.
+        :type shared: Callable[..., Any]
+        """
+        super().__init__(
+            parent._container,
+            compiled=parent._compiled,
+            factories=parent._factories,
+            listener=parent._listener,
+            recipes=parent._recipes,
+        )
+        self._parent = parent
+        self._overrides = overrides
+        #: Keys of the overridden dependencies.
+        self.overridden = frozenset(overrides)
+        self._shared = shared
+
+    def lookup(self, dependency: Dependable) -> Optional[Dependency]:
+        """Return the overridden dependency or the dependency registered in the parent container.
+
+        :param dependency: Class to be found.
+        :type dependency: Dependable
+
+        :return: Registered dependency or ``None`` if it is not registered.
+        :rtype: Dependency | None
+        """
+        if (overridden := self._overrides.get(dependency)) is not None:
+            return overridden
+
+        if (registered := self._parent.lookup(dependency)) is not None:
+            return registered
+
+        if not self._parent.depends_on(dependency, self.overridden):
+            return StaticDependency(self._shared(dependency))
+
+        return None
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from contextlib import ExitStack
+from contextvars import ContextVar, Token
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from .dependency import Provider
+
+T = TypeVar("T")
+
+
+class Scope:
+    """Holds instances of `Scoped` dependencies constructed while the scope is active.
+
+    Functions injected using `Container.inject_scoped` activate a new scope for every call.
+    """
+
+    def __init__(self, shared: Optional[Dict[Any, Any]] = None) -> None:
+        """Scope constructor.
+
+        :param shared: Cache of dependencies which are not scoped, shared between scopes.
+        :type shared: Dict[Any, Any] | None
+        """
+        self.shared: Dict[Any, Any] = shared if shared is not None else {}
+        self._instances: Dict[Provider, Any] = {}
+        self._lock = Lock()
+        self._exit_stack: Optional[ExitStack] = None
+
+    def __contains__(self, provider: Provider) -> bool:
+        """Check whether the provider already constructed its instance in this scope.
+
+        :param provider: The provider.
+        :type provider: Provider
+
+        :rtype: bool
+        """
+        return provider in self._instances
+
+    def enter_context(self, manager: ContextManager[T]) -> T:
+        """Enter the context manager, it is exited when the scope is closed.
+
+        :param manager: The context manager.
+        :type manager: ContextManager[T]
+
+        :return: Result of the manager's ``__enter__``.
+        :rtype: T
+        """
+        if self._exit_stack is None:
+            self._exit_stack = ExitStack()
+
+        return self._exit_stack.enter_context(manager)
+
+    def close(self) -> None:
+        """Exit all context managers entered in the scope in reverse order.
+
+        :rtype: None
+        """
+        if self._exit_stack is not None:
+            self._exit_stack.close()
+
+    def get_instance(self, provider: Provider) -> Any:
+        """Return the instance constructed by the provider in this scope, construct it if needed.
+
+        :param provider: The provider.
+        :type provider: Provider
+
+        :return: The constructed dependency.
+        :rtype: Any
+        """
+        try:
+            return self._instances[provider]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if provider not in self._instances:
+                self._instances[provider] = provider.create()
+
+            return self._instances[provider]
+
+
+_current_scope: ContextVar[Optional[Scope]] = ContextVar("inseminator_scope", default=None)
+
+
+def get_current_scope() -> Optional[Scope]:
+    """Return the active scope.
+
+    :rtype: Scope | None
+    """
+    return _current_scope.get()
+
+
+def activate_scope(scope: Optional[Scope]) -> Token[Optional[Scope]]:
+    """Activate the scope in the current context.
+
+    :param scope: Scope to be activated.
+    :type scope: Scope | None
+
+    :return: Token to be passed to `deactivate_scope`.
+    :rtype: Token[Scope | None]
+    """
+    return _current_scope.set(scope)
+
+
+def deactivate_scope(token: Token[Optional[Scope]]) -> None:
+    """Restore the scope which was active before `activate_scope`.
+
+    :param token: Token returned by `activate_scope`.
+    :type token: Token[Scope | None]
+
+    :rtype: None
+    """
+    _current_scope.reset(token)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import Dict, Generic, Optional, TypeVar
+import weakref
+from typing import Any, Dict, Generic, Iterable, Optional, Tuple, TypeVar, Union, cast, overload
 
 K = TypeVar("K")
 V = TypeVar("V")
+D = TypeVar("D")
+
+_MISSING: Any = object()
+_UNCACHED: Any = object()
 
 
 class ScopedDict(Generic[K, V], Dict[K, V]):
@@ -11,6 +16,10 @@ class ScopedDict(Generic[K, V], Dict[K, V]):
 
     It tries to resolved `__getitem__` call using the underlying dictionary and
     if it can't find the key and tries to search in its parent dictionaries.
+
+    Results of lookups in the parent dictionaries (including misses) are stored in a flattened cache, so
+    a repeated lookup costs two dictionary probes regardless of the depth of the chain. Every mutation
+    increments ``version`` of the dictionary and of all its descendants and invalidates their caches.
     """
 
     def __init__(self, parent_dict: Optional[ScopedDict[K, V]] = None) -> None:
@@ -23,6 +32,108 @@ class ScopedDict(Generic[K, V], Dict[K, V]):
         """
 
         self.__parent_dict = parent_dict
+        self.__cache: Dict[K, V] = {}
+        # dictionaries are not hashable so children are tracked by their ids
+        self.__children: Dict[int, weakref.ReferenceType[ScopedDict[K, V]]] = {}
+
+        #: Incremented whenever a lookup in the dictionary or its parents can return a different result.
+        self.version = 0
+        #: Number of parent dictionaries.
+        self.depth: int = parent_dict.depth + 1 if parent_dict is not None else 0
+
+        if parent_dict is not None:
+            siblings, key = parent_dict.__children, id(self)
+            siblings[key] = weakref.ref(self, lambda _: siblings.pop(key, None))
+
+    def __lookup(self, key: Any) -> Any:
+        value = dict.get(self, key, _MISSING)
+
+        if value is not _MISSING or self.__parent_dict is None:
+            return value
+
+        if (value := self.__cache.get(key, _UNCACHED)) is not _UNCACHED:
+            return value
+
+        # chains of parents can be deeper than the recursion limit, dictionaries without the key cached are
+        # visited iteratively and the value is cached in all of them
+        visited = [(self, self.version)]
+        current = self.__parent_dict
+
+        while True:
+            value = dict.get(current, key, _MISSING)
+
+            if value is not _MISSING or current.__parent_dict is None:
+                break
+
+            if (value := current.__cache.get(key, _UNCACHED)) is not _UNCACHED:
+                break
+
+            visited.append((current, current.version))
+            current = current.__parent_dict
+
+        for scoped_dict, version in visited:
+            scoped_dict.__cache[key] = value
+
+            if scoped_dict.version != version:
+                # an ancestor was mutated during the lookup, the value might be stale
+                scoped_dict.__cache.pop(key, None)
+
+        return value
+
+    def __invalidate(self) -> None:
+        # chains of descendants can be deeper than the recursion limit
+        stack = [self]
+
+        while stack:
+            current = stack.pop()
+            current.version += 1
+            current.__cache.clear()
+
+            for reference in list(current.__children.values()):
+                if (child := reference()) is not None:
+                    stack.append(child)
+
+    @overload
+    def lookup(self, key: K) -> Optional[V]:
+        ...
+
+    @overload
+    def lookup(self, key: K, default: D) -> Union[V, D]:
+        ...
+
+    def lookup(self, key: K, default: Any = None) -> Any:
+        """Find the value in the dictionary or its parents using a single lookup.
+
+        :parameter key: Incomming key.
+        :type key: K
+
+        :parameter default: Value returned if the key is not found.
+        :type default: Any
+
+        :return: Stored value or the default.
+        :rtype: V | D
+        """
+        value = self.__lookup(key)
+        return default if value is _MISSING else value
+
+    def flatten(self) -> Dict[K, V]:
+        """Return items of the dictionary and all its parents in a new dictionary. Items of the dictionary
+        take precedence over items of its parents.
+
+        :return: The flattened dictionary.
+        :rtype: Dict[K, V]
+        """
+        chain = [self]
+
+        while (parent := chain[-1].__parent_dict) is not None:
+            chain.append(parent)
+
+        items: Dict[K, V] = {}
+
+        for scoped_dict in reversed(chain):
+            items.update(dict.items(scoped_dict))
+
+        return items
 
     def __getitem__(self, key: K) -> V:
         """``__getitem__`` implementation.
@@ -34,10 +145,12 @@ class ScopedDict(Generic[K, V], Dict[K, V]):
         :rtype: V.
         """
 
-        if not super().__contains__(key) and self.__parent_dict is not None:
-            return self.__parent_dict[key]
+        value = self.__lookup(key)
+
+        if value is _MISSING:
+            raise KeyError(key)
 
-        return super().__getitem__(key)
+        return cast(V, value)
 
     def __contains__(self, key: object) -> bool:
         """``__contains__`` implementation.
@@ -49,10 +162,42 @@ class ScopedDict(Generic[K, V], Dict[K, V]):
         :rtype: bool.
         """
 
-        if not super().__contains__(key):
-            if self.__parent_dict is not None:
-                return key in self.__parent_dict
-
-            return False
-
-        return True
+        return self.__lookup(key) is not _MISSING
+
+    def __setitem__(self, key: K, value: V) -> None:
+        super().__setitem__(key, value)
+        self.__invalidate()
+
+    def __delitem__(self, key: K) -> None:
+        super().__delitem__(key)
+        self.__invalidate()
+
+    def clear(self) -> None:
+        super().clear()
+        self.__invalidate()
+
+    def pop(self, key: K, *args: Any) -> Any:
+        try:
+            return super().pop(key, *args)
+        finally:
+            self.__invalidate()
+
+    def popitem(self) -> Tuple[K, V]:
+        try:
+            return super().popitem()
+        finally:
+            self.__invalidate()
+
+    def setdefault(self, key: K, default: Any = None) -> V:
+        try:
+            return super().setdefault(key, default)
+        finally:
+            self.__invalidate()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.__invalidate()
+
+    def __ior__(self, other: Iterable[Tuple[K, V]]) -> ScopedDict[K, V]:  # type: ignore[override,misc]
+        self.update(other)
+        return self
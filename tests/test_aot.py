@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from typing import NewType, Protocol
+
+import pytest
+
+from inseminator import Depends
+from inseminator.__main__ import main
+from inseminator.aot import compile_container
+from inseminator.container import Container
+from inseminator.exceptions import StaleCompiledModuleError
+from inseminator.plan import invalidate_plans, plan_cache
+
+MyType = NewType("MyType", int)
+
+
+class Storage(Protocol):
+    def get(self) -> int:
+        ...
+
+
+class MemoryStorage:
+    def get(self) -> int:
+        return 1
+
+
+class Client:
+    def __init__(self, storage: Storage, my_type: MyType, retries: int = 3) -> None:
+        self.storage = storage
+        self.my_type = my_type
+        self.retries = retries
+
+
+class Service:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+container = Container()
+container.register(Storage, value=MemoryStorage())
+container.register(MyType, value=MyType(2))
+
+
+@container.inject
+def handler(service: Service = Depends(Service)) -> int:
+    return service.client.storage.get() + service.client.my_type
+
+
+def load_module(tmp_path, source):
+    path = tmp_path / "wiring_compiled.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("wiring_compiled", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compile_container(tmp_path):
+    module = load_module(tmp_path, compile_container(container))
+
+    assert set(module.FACTORIES) == {Service, Client}
+
+    compiled_container = Container()
+    compiled_container.register(Storage, value=MemoryStorage())
+    compiled_container.register(MyType, value=MyType(2))
+    compiled_container.load_compiled(module)
+
+    service = compiled_container.sub_container().resolve(Service)
+
+    assert service.client.storage.get() == 1
+    assert service.client.my_type == 2
+    assert service.client.retries == 3
+
+
+def test_compiled_module_without_introspection(tmp_path):
+    module = load_module(tmp_path, compile_container(container))
+    storage = MemoryStorage()
+
+    compiled_container = Container()
+    compiled_container.register(Storage, value=storage)
+    compiled_container.register(MyType, value=MyType(2))
+    compiled_container.load_compiled(module)
+
+    @compiled_container.inject
+    def compiled_handler(service: Service = Depends(Service)) -> Service:
+        return service
+
+    invalidate_plans()
+    service = compiled_handler()
+
+    assert len(plan_cache) == 0
+
+    compiled_container.register(Storage, value=MemoryStorage())
+    compiled_container.invalidate(Storage)
+
+    assert compiled_handler() is not service
+    assert service.client.storage is storage
+
+
+def test_stale_compiled_module(tmp_path, monkeypatch):
+    module = load_module(tmp_path, compile_container(container))
+
+    def __init__(self, client: Client, another_client: Client) -> None:
+        ...
+
+    monkeypatch.setattr(Service, "__init__", __init__)
+
+    with pytest.raises(StaleCompiledModuleError, match="Service"):
+        Container().load_compiled(module)
+
+
+def test_compile_cli(tmp_path, capsys):
+    output = tmp_path / "out.py"
+
+    assert main(["compile", f"{__name__}:container", "-o", str(output)]) == 0
+    assert "def _build_0(_r):" in output.read_text()
+
+    assert main(["compile", f"{__name__}:handler"]) == 1
+    assert "is not a Container" in capsys.readouterr().err
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from typing import NewType
+
+import pytest
+
+from inseminator import Container
+from inseminator.exceptions import ResolverError
+
+FirstClient = NewType("FirstClient", str)
+SecondClient = NewType("SecondClient", str)
+
+
+class Settings:
+    url = "http://localhost"
+
+
+class Service:
+    def __init__(self, first: FirstClient, second: SecondClient) -> None:
+        self.first = first
+        self.second = second
+
+
+async def create_first_client(settings: Settings) -> FirstClient:
+    await asyncio.sleep(0.1)
+    return FirstClient(f"first {settings.url}")
+
+
+async def create_second_client(settings: Settings) -> SecondClient:
+    await asyncio.sleep(0.1)
+    return SecondClient(f"second {settings.url}")
+
+
+def test_aresolve_async_factories_concurrently():
+    container = Container()
+    container.register(FirstClient, factory=create_first_client)
+    container.register(SecondClient, factory=create_second_client)
+
+    t1 = time.perf_counter()
+    service = asyncio.run(container.aresolve(Service))
+    dt = time.perf_counter() - t1
+
+    assert service.first == "first http://localhost"
+    assert service.second == "second http://localhost"
+    assert dt < 0.19
+    assert container.resolve(Service) is service
+    assert container.resolve(FirstClient) == "first http://localhost"
+
+
+def test_async_factory_constructed_once():
+    calls = []
+
+    async def create_client() -> FirstClient:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return FirstClient("client")
+
+    class Another:
+        def __init__(self, first: FirstClient) -> None:
+            self.first = first
+
+    class Root:
+        def __init__(self, a: Another, b: Another, first: FirstClient) -> None:
+            ...
+
+    container = Container()
+    container.register(FirstClient, factory=create_client)
+
+    asyncio.run(container.aresolve(Root))
+
+    assert calls == [1]
+
+
+def test_resolve_async_factory_synchronously():
+    container = Container()
+    container.register(FirstClient, factory=create_first_client)
+
+    with pytest.raises(ResolverError, match="aresolve"):
+        container.resolve(Service)
+
+
+def test_aresolve_error_path():
+    class Dependency:
+        def __init__(self, unknown) -> None:
+            ...
+
+    class Client:
+        def __init__(self, dependency: Dependency) -> None:
+            ...
+
+    with pytest.raises(ResolverError, match="Client.*-> Can resolve dependencies for"):
+        asyncio.run(Container().aresolve(Client))
+
+
+class Application:
+    def __init__(self, service: Service) -> None:
+        self.service = service
+
+
+def test_aresolve_registered_providers():
+    container = Container()
+    container.register(FirstClient, factory=create_first_client)
+    container.register(SecondClient, factory=create_second_client)
+    container.register(Service)
+    sub_container = container.sub_container()
+    sub_container.register(Application, factory=Application)
+
+    t1 = time.perf_counter()
+    application = asyncio.run(sub_container.aresolve(Application))
+    dt = time.perf_counter() - t1
+
+    assert application.service.first == "first http://localhost"
+    assert application.service is container.resolve(Service)
+    assert dt < 0.19
+    assert asyncio.run(sub_container.freeze().aresolve(Application)) is application
@@ -1,6 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
 from inseminator.container import Container
 from inseminator.decorator import Depends
-from inseminator.integrations.celery import celery_task
+from inseminator.integrations.celery import celery_task, connect_worker_signals
 
 
 def test_dummy_celery_injector():
@@ -21,3 +26,62 @@ def test_dummy_celery_injector():
         return dependency.x
 
     assert my_function() == 1
+
+
+def test_dummy_celery_injector_scoped():
+    container = Container()
+
+    class Dependency:
+        pass
+
+    class Celery:
+        def task(self, fn):
+            return fn
+
+    @celery_task(Celery(), container, scoped=True)
+    def my_function(dependency: Dependency = Depends(Dependency)):
+        return dependency
+
+    assert my_function() is not my_function()
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_celery_worker_signals(parallel):
+    celery = pytest.importorskip("celery")
+    from celery.signals import worker_process_init, worker_process_shutdown
+
+    test_fn = MagicMock()
+
+    class Dependency:
+        def __init__(self):
+            test_fn()
+
+    container = Container()
+    app = celery.Celery("test", set_as_current=False)
+    app.conf.task_always_eager = True
+    executors = []
+
+    def executor_factory():
+        executors.append(ThreadPoolExecutor(2))
+        return executors[-1]
+
+    connect_worker_signals(container, executor_factory if parallel else None)
+
+    @celery_task(app, container)
+    def my_function(dependency: Dependency = Depends(Dependency)):
+        return 1
+
+    worker_process_init.send(sender=None)
+    test_fn.assert_called_once()
+    assert len(executors) == int(parallel)
+
+    for executor in executors:
+        with pytest.raises(RuntimeError):
+            executor.submit(test_fn)
+
+    assert my_function.delay().get() == 1
+    test_fn.assert_called_once()
+
+    worker_process_shutdown.send(sender=None, pid=0, exitcode=0)
+    assert my_function.delay().get() == 1
+    assert test_fn.call_count == 2
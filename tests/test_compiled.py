@@ -0,0 +1,118 @@
+from typing import NewType, Protocol
+from unittest.mock import MagicMock
+
+import pytest
+
+from inseminator import Depends
+from inseminator.compiler import compile_factory
+from inseminator.container import Container
+from inseminator.exceptions import ResolverError
+
+
+def test_compiled_resolve():
+    class Dependency:
+        def __init__(self) -> None:
+            self.x = 1
+
+    class Client:
+        def __init__(self, dependency: Dependency, y: int = 2) -> None:
+            self.x = dependency.x
+            self.y = y
+
+    container = Container(compiled=True)
+    client = container.resolve(Client)
+
+    assert client.x == 1
+    assert client.y == 2
+    assert container.resolve(Client) is client
+    assert "_target(dependency=_a0)" in compile_factory(Client).__source__
+
+
+def test_compiled_uses_registered_dependencies():
+    class Dependency(Protocol):
+        x: int
+
+    class ConcreteDependency:
+        x = 1
+
+    MyType = NewType("MyType", int)
+
+    class Client:
+        def __init__(self, dependency: Dependency, my_type: MyType) -> None:
+            self.x = dependency.x
+            self.my_type = my_type
+
+    container = Container(compiled=True)
+    container.register(Dependency, value=ConcreteDependency())
+    container.register(MyType, value=MyType(2))
+
+    client = container.sub_container().resolve(Client)
+
+    assert client.x == 1
+    assert client.my_type == 2
+
+
+def test_compiled_error_messages_match_resolver():
+    class Dependency(Protocol):
+        x: int
+
+    class Service:
+        def __init__(self, dependency: Dependency) -> None:
+            ...
+
+    class Client:
+        def __init__(self, service: Service) -> None:
+            ...
+
+    with pytest.raises(ResolverError) as compiled_error:
+        Container(compiled=True).resolve(Client)
+
+    with pytest.raises(ResolverError) as error:
+        Container().resolve(Client)
+
+    assert str(compiled_error.value) == str(error.value)
+
+
+def test_compiled_falls_back_for_parameters_and_missing_hints():
+    class Dependency:
+        x = 1
+
+    class Client:
+        def __init__(self, dependency: Dependency, y: int) -> None:
+            self.x = dependency.x
+            self.y = y
+
+    class BrokenClient:
+        def __init__(self, dependency: Dependency, unknown) -> None:
+            ...
+
+    container = Container(compiled=True)
+
+    assert compile_factory(BrokenClient) is None
+    assert container.resolve(Client, y=2).y == 2
+
+    with pytest.raises(ResolverError, match="Can resolve dependencies for"):
+        container.resolve(BrokenClient)
+
+
+def test_compiled_inject_scoped():
+    test_fn = MagicMock()
+
+    class Dependency:
+        def __init__(self) -> None:
+            test_fn()
+
+    class Client:
+        def __init__(self, dependency: Dependency) -> None:
+            self.dependency = dependency
+
+    container = Container(compiled=True)
+
+    @container.inject_scoped
+    def function(client: Client = Depends(Client)) -> Client:
+        return client
+
+    first, second = function(), function()
+    assert first is not second
+    assert first.dependency is second.dependency
+    assert test_fn.call_count == 1
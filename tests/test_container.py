@@ -3,9 +3,9 @@ from unittest.mock import MagicMock, call
 
 import pytest
 
-from inseminator import Depends
+from inseminator import Depends, Transient
 from inseminator.container import Container
-from inseminator.exceptions import ResolverError
+from inseminator.exceptions import ContainerRegisterError, ResolverError
 
 
 def test_sub_container():
@@ -226,3 +226,46 @@ def test_preload():
     m1.assert_has_calls([call(), call()])
     m2.assert_has_calls([call(), call()])
     m3.assert_has_calls([call()])
+
+
+def test_register_is_deferred() -> None:
+    class Service:
+        pass
+
+    services = []
+
+    def create_service() -> Service:
+        services.append(Service())
+        return services[-1]
+
+    container = Container()
+    container.register(Service, factory=create_service)
+
+    assert services == []
+    assert container.resolve(Service) is container.resolve(Service)
+    assert services == [container.resolve(Service)]
+
+
+def test_register_eager() -> None:
+    class Service:
+        pass
+
+    services = []
+
+    def create_service() -> Service:
+        services.append(Service())
+        return services[-1]
+
+    container = Container()
+    container.register(Service, factory=create_service, eager=True)
+
+    assert len(services) == 1
+    assert container.resolve(Service) is services[0]
+
+
+def test_register_eager_with_lifetime() -> None:
+    class Service:
+        pass
+
+    with pytest.raises(ContainerRegisterError):
+        Container().register(Service, lifetime=Transient, eager=True)
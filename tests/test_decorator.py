@@ -120,3 +120,75 @@ def test_cache_thread_safety():
         thread.join()
 
     test_fn.assert_called_once()
+
+
+def test_inject_keyword_argument_overrides_dependency():
+    class Dependency:
+        pass
+
+    container = Container()
+
+    @container.inject
+    def function(d: Dependency = Depends(Dependency)) -> Dependency:
+        return d
+
+    cached = function()
+    override = Dependency()
+
+    assert function(d=override) is override
+    assert function() is cached
+
+
+def test_inject_metrics():
+    class Dependency:
+        pass
+
+    metrics = MagicMock()
+    container = Container(metrics=metrics)
+
+    @container.inject
+    def function(d: Dependency = Depends(Dependency)) -> None:
+        ...
+
+    function()
+    function()
+
+    assert [c.args[0] for c in metrics.save_metric.call_args_list] == ["function", "function"]
+
+
+def test_inject_metrics_qualified_names():
+    class Dependency:
+        pass
+
+    metrics = MagicMock(qualified_names=True)
+    container = Container(metrics=metrics)
+
+    @container.inject
+    def function(d: Dependency = Depends(Dependency)) -> None:
+        ...
+
+    function()
+
+    name = f"{__name__}.test_inject_metrics_qualified_names.<locals>.function"
+    assert [c.args[0] for c in metrics.save_metric.call_args_list] == [name]
+
+
+def test_inject_clear_rebuilds_cache():
+    test_fn = MagicMock()
+
+    class Dependency:
+        def __init__(self):
+            test_fn()
+
+    container = Container()
+
+    @container.inject
+    def function(d: Dependency = Depends(Dependency)) -> None:
+        ...
+
+    function()
+    function()
+    container.clear()
+    function()
+
+    assert test_fn.call_count == 2
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from inseminator import Container, Depends, Scoped
+from inseminator.exceptions import ResolverError
+
+
+def make_chain(length: int, leaf: type = object) -> list:
+    chain = []
+
+    for i in range(length):
+        namespace = {"Previous": chain[-1] if chain else leaf}
+        exec("def __init__(self, previous: Previous) -> None:\n    pass\n", namespace)
+        chain.append(type(f"Chain{i}", (), {"__init__": namespace["__init__"]}))
+
+    return chain
+
+
+class Missing:
+    def __init__(self, value) -> None:
+        ...
+
+
+class Session:
+    pass
+
+
+class ScopedMissing:
+    def __init__(self, session: Session, missing: Missing) -> None:
+        ...
+
+
+class Left:
+    def __init__(self, right: Right) -> None:
+        ...
+
+
+class Right:
+    def __init__(self, left: Left) -> None:
+        ...
+
+
+def test_resolve_chain_deeper_than_recursion_limit():
+    chain = make_chain(sys.getrecursionlimit() * 2)
+
+    root = Container().resolve(chain[-1])
+
+    assert isinstance(root, chain[-1])
+
+
+@pytest.mark.parametrize("bottom_up", [False, True])
+def test_resolve_compiled_chain_deeper_than_recursion_limit(bottom_up):
+    chain = make_chain(sys.getrecursionlimit() * 2)
+    container = Container(compiled=True)
+
+    # factories of the dependencies are generated and cached first
+    for dependency in chain if bottom_up else ():
+        container.resolve(dependency)
+
+    root = Container(compiled=True).resolve(chain[-1])
+
+    assert isinstance(root, chain[-1])
+
+
+def test_resolve_scoped_chain_deeper_than_recursion_limit():
+    chain = make_chain(sys.getrecursionlimit() * 2, leaf=Session)
+    container = Container()
+    container.register(Session, lifetime=Scoped)
+
+    @container.inject_scoped
+    def handler(root: chain[-1] = Depends(chain[-1])) -> chain[-1]:
+        return root
+
+    with container.scope():
+        root = container.resolve(chain[-1])
+
+    assert isinstance(root, chain[-1])
+    assert handler() is not handler()
+
+
+def test_overlay_chain_deeper_than_recursion_limit():
+    chain = make_chain(sys.getrecursionlimit() * 2, leaf=Session)
+    container = Container()
+    session = Session()
+
+    root = container.overlay({Session: session}).resolve(chain[-1])
+    shared = container.overlay({Missing: Missing(1)}).resolve(chain[-1])
+
+    assert isinstance(root, chain[-1])
+    assert shared is container.resolve(chain[-1])
+
+
+def test_resolve_scoped_chain_error_path():
+    chain = make_chain(2, leaf=ScopedMissing)
+    container = Container()
+    container.register(Session, lifetime=Scoped)
+
+    with pytest.raises(ResolverError) as e, container.scope():
+        container.resolve(chain[-1])
+
+    assert str(e.value) == (
+        f"{chain[1]} -> {chain[0]} -> {ScopedMissing} -> Can resolve dependencies for {Missing}. "
+        "All type annotations must be specified, 1 missing."
+    )
+
+
+def test_resolve_chain_error_path():
+    chain = make_chain(3, leaf=Missing)
+
+    with pytest.raises(ResolverError) as e:
+        Container().resolve(chain[-1])
+
+    assert str(e.value) == (
+        f"{chain[2]} -> {chain[1]} -> {chain[0]} -> Can resolve dependencies for {Missing}. "
+        "All type annotations must be specified, 1 missing."
+    )
+
+
+def test_resolve_cycle():
+    with pytest.raises(ResolverError) as e:
+        Container().resolve(Left)
+
+    assert str(e.value) == f"{Left} -> {Right} -> Cyclic dependency on {Left} detected."
+
+
+def test_sub_container_chain_deeper_than_recursion_limit():
+    root = container = Container()
+
+    for _ in range(sys.getrecursionlimit() * 2):
+        container = container.sub_container()
+
+    session = Session()
+    root.register(Session, value=session)
+
+    assert container.resolve(Session) is session
@@ -0,0 +1,192 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Event
+
+import pytest
+
+from inseminator import Container, Depends, Lazy, Singleton, ThreadLocal
+from inseminator.exceptions import ContainerRegisterError
+from inseminator.fork import after_fork_in_child
+from inseminator.lazy import force
+
+
+class Connection:
+    pass
+
+
+class Config:
+    pass
+
+
+class Repository:
+    def __init__(self, connection: Connection) -> None:
+        self.connection = connection
+
+
+class Service:
+    def __init__(self, repository: Repository) -> None:
+        self.repository = repository
+
+
+def test_fork_unsafe_dependency_is_rebuilt():
+    container = Container()
+    container.register(Connection, fork_safe=False)
+    container.register(Config)
+    connection, config = container.resolve(Connection), container.resolve(Config)
+
+    after_fork_in_child()
+
+    assert container.resolve(Connection) is not connection
+    assert container.resolve(Connection) is container.resolve(Connection)
+    assert container.resolve(Config) is config
+
+
+def test_fork_unsafe_provider_is_reset():
+    container = Container()
+    container.register(Connection, lifetime=Singleton, fork_safe=False)
+    connection = container.resolve(Connection)
+
+    after_fork_in_child()
+
+    assert container.resolve(Connection) is not connection
+
+
+def test_fork_unsafe_thread_local_is_not_closed():
+    closed = []
+
+    def create_connection():
+        connection = Connection()
+        yield connection
+        closed.append(connection)
+
+    container = Container()
+    container.register(Connection, factory=create_connection, lifetime=ThreadLocal, fork_safe=False)
+    connection = container.resolve(Connection)
+
+    after_fork_in_child()
+
+    assert container.resolve(Connection) is not connection
+    assert closed == []
+
+    container.invalidate(Connection)
+
+    assert len(closed) == 1 and closed[0] is not connection
+
+
+def test_fork_resets_registered_dependents():
+    container = Container()
+    container.register(Connection, fork_safe=False)
+    container.register(Repository)
+    sub_container = container.sub_container()
+    sub_container.register(Service)
+    repository, service = container.resolve(Repository), sub_container.resolve(Service)
+
+    after_fork_in_child()
+
+    assert container.resolve(Repository) is not repository
+    assert container.resolve(Repository).connection is container.resolve(Connection)
+    assert sub_container.resolve(Service) is not service
+    assert sub_container.resolve(Service).repository is container.resolve(Repository)
+
+
+def test_fork_resets_affected_injected_functions():
+    container = Container()
+    container.register(Connection, fork_safe=False)
+
+    @container.inject
+    def repository(repository: Repository = Depends(Repository)) -> Repository:
+        return repository
+
+    @container.inject
+    def config(config: Config = Depends(Config)) -> Config:
+        return config
+
+    container.preload_injected()
+    preloaded_repository, preloaded_config = repository(), config()
+
+    after_fork_in_child()
+
+    assert repository() is not preloaded_repository
+    assert repository().connection is container.resolve(Connection)
+    assert config() is preloaded_config
+
+
+def test_fork_frozen_container():
+    container = Container()
+    container.register(Connection, fork_safe=False)
+    frozen = container.freeze()
+    connection = frozen.resolve(Connection)
+
+    after_fork_in_child()
+
+    assert frozen.resolve(Connection) is not connection
+    assert frozen.resolve(Connection) is container.resolve(Connection)
+
+
+def test_fork_replaces_locks():
+    started, release = Event(), Event()
+    constructed = []
+
+    class Blocking:
+        def __init__(self) -> None:
+            constructed.append(self)
+
+            # only the constructions running at the time of fork block
+            if len(constructed) <= 2:
+                started.set()
+                release.wait(5)
+
+    class LazyBlocking(Blocking):
+        pass
+
+    class Holder:
+        def __init__(self, blocking: Lazy[LazyBlocking]) -> None:
+            self.blocking = blocking
+
+    container = Container()
+    container.register(Blocking)
+    holder = container.resolve(Holder)
+
+    with ThreadPoolExecutor(4) as executor:
+        # the threads hold the locks at the time of fork, they don't exist in the child
+        for request in [partial(container.resolve, Blocking), partial(force, holder.blocking)]:
+            executor.submit(request)
+            assert started.wait(5)
+            started.clear()
+
+        after_fork_in_child()
+
+        try:
+            assert isinstance(executor.submit(container.resolve, Blocking).result(1), Blocking)
+            assert isinstance(executor.submit(force, holder.blocking).result(1), LazyBlocking)
+        finally:
+            release.set()
+
+
+def test_fork_unsafe_value():
+    with pytest.raises(ContainerRegisterError):
+        Container().register(Connection, value=Connection(), fork_safe=False)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+def test_fork():
+    container = Container()
+    container.register(Connection, fork_safe=False)
+    container.register(Config)
+    connection, config = container.resolve(Connection), container.resolve(Config)
+
+    read, write = os.pipe()
+
+    if (pid := os.fork()) == 0:
+        rebuilt = container.resolve(Connection) is not connection
+        shared = container.resolve(Config) is config
+        os.write(write, bytes([rebuilt, shared]))
+        os._exit(0)
+
+    os.close(write)
+    result = os.read(read, 2)
+    os.close(read)
+    os.waitpid(pid, 0)
+
+    assert result == bytes([True, True])
@@ -0,0 +1,128 @@
+from typing import Iterator
+
+import pytest
+
+from inseminator import Container, Depends, Scoped, Singleton
+from inseminator.exceptions import ContainerFrozenError, ResolverError
+
+
+class Config:
+    pass
+
+
+class Client:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Service:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+def test_freeze_resolves_registered_dependencies():
+    config = Config()
+    container = Container()
+    container.register(Config, value=config)
+    sub_container = container.sub_container()
+    sub_container.register(Client, lifetime=Singleton)
+    client = sub_container.resolve(Client)
+
+    frozen = sub_container.freeze()
+
+    assert frozen.resolve(Config) is config
+    assert frozen.resolve(Client) is client
+    assert frozen.resolve(Client).config is config
+    assert frozen._instances[Client] is client
+
+
+def test_freeze_doesnt_auto_register():
+    frozen = Container().freeze()
+
+    with pytest.raises(ResolverError, match="not registered"):
+        frozen.resolve(Config)
+
+    with pytest.raises(ResolverError, match="not registered"):
+        frozen.resolve(Config)
+
+
+def test_frozen_register_raises():
+    frozen = Container().freeze()
+
+    with pytest.raises(ContainerFrozenError):
+        frozen.register(Config, value=Config())
+
+
+def test_frozen_is_snapshot():
+    container = Container()
+    frozen = container.freeze()
+    container.register(Config, value=Config())
+
+    with pytest.raises(ResolverError):
+        frozen.resolve(Config)
+
+
+def test_frozen_is_independent_of_invalidate():
+    container = Container()
+    container.register(Config)
+    container.register(Client)
+    config = container.resolve(Config)
+    frozen = container.freeze()
+    client = frozen.resolve(Client)
+
+    container.invalidate(Config)
+
+    assert frozen.resolve(Config) is config
+    assert frozen.resolve(Client) is client
+    assert frozen.resolve(Client) is not container.resolve(Client)
+
+
+def test_frozen_scoped_has_own_instance():
+    container = Container()
+    container.register(Config, lifetime=Scoped)
+    frozen = container.freeze()
+
+    assert frozen.resolve(Config) is frozen.resolve(Config)
+    assert frozen.resolve(Config) is not container.resolve(Config)
+
+
+def test_frozen_inject():
+    container = Container()
+    container.register(Config, value=Config())
+    frozen = container.freeze()
+
+    @frozen.inject
+    def function(service: Service = Depends(Service)) -> Service:
+        return service
+
+    assert function() is function()
+    assert function().client.config is frozen.resolve(Config)
+
+
+def test_frozen_sub_container():
+    container = Container()
+    container.register(Config, value=Config())
+    sub_container = container.freeze().sub_container()
+    sub_container.register(Client)
+
+    assert sub_container.resolve(Client).config is container.resolve(Config)
+
+
+def test_frozen_teardown():
+    events = []
+
+    def create_client(config: Config) -> Iterator[Client]:
+        events.append("open")
+        yield Client(config)
+        events.append("close")
+
+    container = Container()
+    container.register(Client, factory=create_client)
+    frozen = container.freeze()
+    frozen.resolve(Client)
+
+    container.invalidate(Config)
+    assert events == ["open"]
+
+    frozen.close()
+    assert events == ["open", "close"]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from inseminator import Container, Lazy
+from inseminator.exceptions import ResolverError
+
+constructed = MagicMock()
+
+
+class Config:
+    def __init__(self) -> None:
+        constructed(Config)
+
+
+class Client:
+    def __init__(self, config: Config) -> None:
+        constructed(Client)
+
+
+class Repository:
+    def __init__(self, client: Client, config: Config) -> None:
+        constructed(Repository)
+
+
+class Service:
+    def __init__(self, repository: Repository, client: Client, retries: int = 3) -> None:
+        constructed(Service)
+
+
+class Left:
+    def __init__(self, right: Right) -> None:
+        ...
+
+
+class Right:
+    def __init__(self, left: Left) -> None:
+        ...
+
+
+class LazyLeft:
+    def __init__(self, right: LazyRight) -> None:
+        ...
+
+
+class LazyRight:
+    def __init__(self, left: Lazy[LazyLeft]) -> None:
+        ...
+
+
+def setup_function():
+    constructed.reset_mock()
+
+
+def test_graph():
+    graph = Container().graph(Service)
+
+    assert set(graph) == {Service, Repository, Client, Config}
+    assert graph.topological_order() == [Config, Client, Repository, Service]
+    assert graph.dependencies(Service) == [Repository, Client]
+    assert graph.dependents(Client) == [Repository, Service]
+    assert graph.fan_in(Config) == 2
+    assert graph.fan_out(Repository) == 2
+    assert graph.fan_in(Service) == 0
+    assert graph.cycles == []
+    constructed.assert_not_called()
+
+
+def test_graph_registered_dependency_is_leaf():
+    container = Container()
+    container.register(Client, value=object())
+
+    graph = container.graph(Repository)
+
+    assert graph.nodes[Client].external
+    assert graph.dependencies(Client) == []
+    assert graph.topological_order() == [Client, Config, Repository]
+
+
+def test_graph_forced_parameters():
+    graph = Container().graph(Repository, client=object())
+
+    assert graph.dependencies(Repository) == [Config]
+
+
+def test_graph_cycle():
+    graph = Container().graph(Left)
+
+    assert graph.cycles == [(Left, Right, Left)]
+
+    with pytest.raises(ResolverError, match="Cyclic dependency on .*Left"):
+        graph.topological_order()
+
+
+def test_graph_lazy_breaks_cycle():
+    graph = Container().graph(LazyLeft)
+
+    assert graph.cycles == []
+    assert graph.nodes[Lazy[LazyLeft]].external
+
+
+def test_resolve_cycle():
+    with pytest.raises(ResolverError, match="Left'> -> .*Right'> -> Cyclic dependency on .*Left"):
+        Container().resolve(Left)
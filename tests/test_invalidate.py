@@ -0,0 +1,166 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+from inseminator import Container, Depends, Singleton
+from inseminator.exceptions import ContainerFrozenError
+
+
+class Credentials:
+    def __init__(self, token: str = "first") -> None:
+        self.token = token
+
+
+class Client:
+    def __init__(self, credentials: Credentials) -> None:
+        self.credentials = credentials
+
+
+class Service:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+class Cache:
+    pass
+
+
+class Application:
+    def __init__(self, service: Service, cache: Cache) -> None:
+        self.service = service
+        self.cache = cache
+
+
+def test_invalidate_dependents():
+    container = Container()
+    container.register(Credentials, value=Credentials())
+    cache = container.resolve(Cache)
+    application = container.resolve(Application)
+
+    container.register(Credentials, value=Credentials("second"))
+    container.invalidate(Credentials)
+    rebuilt = container.resolve(Application)
+
+    assert rebuilt is not application
+    assert rebuilt.service.client.credentials.token == "second"
+    assert rebuilt.cache is application.cache is cache
+
+
+def test_invalidate_resolved_in_parallel():
+    container = Container()
+    container.register(Credentials, value=Credentials())
+
+    with ThreadPoolExecutor(2) as executor:
+        application = container.resolve_parallel(Application, executor)
+
+    container.register(Credentials, value=Credentials("second"))
+    container.invalidate(Credentials)
+    rebuilt = container.resolve(Application)
+
+    assert rebuilt is not application
+    assert rebuilt.service.client.credentials.token == "second"
+    assert container.resolve(Application) is rebuilt
+
+
+def test_invalidate_resolved_asynchronously():
+    async def create_credentials() -> Credentials:
+        return Credentials("second")
+
+    container = Container()
+    container.register(Credentials, value=Credentials())
+    application = asyncio.run(container.aresolve(Application))
+
+    container.register(Credentials, factory=create_credentials)
+    container.invalidate(Credentials)
+    rebuilt = asyncio.run(container.aresolve(Application))
+
+    assert rebuilt is not application
+    assert rebuilt.service.client.credentials.token == "second"
+    assert asyncio.run(container.aresolve(Application)) is rebuilt
+
+
+def test_invalidate_keeps_values():
+    credentials = Credentials()
+    container = Container()
+    container.register(Credentials, value=credentials)
+    client = container.resolve(Client)
+
+    container.invalidate(Credentials)
+
+    assert container.resolve(Credentials) is credentials
+    assert container.resolve(Client) is not client
+
+
+def test_invalidate_providers_and_factories():
+    container = Container()
+    container.register(Client, lifetime=Singleton)
+    container.register(Service, factory=Service, eager=True)
+    client, service = container.resolve(Client), container.resolve(Service)
+
+    container.invalidate(Credentials)
+
+    assert container.resolve(Client) is not client
+    assert container.resolve(Service) is not service
+    assert container.resolve(Service).client is container.resolve(Client)
+
+
+def test_invalidate_injected_functions():
+    container = Container()
+
+    @container.inject
+    def with_client(client: Client = Depends(Client)) -> Client:
+        return client
+
+    @container.inject
+    def with_cache(cache: Cache = Depends(Cache)) -> Cache:
+        return cache
+
+    client, cache = with_client(), with_cache()
+    container.invalidate(Credentials)
+
+    assert with_client() is not client
+    assert with_cache() is cache
+
+
+def test_invalidate_teardown():
+    opened = []
+
+    def create_client(credentials: Credentials) -> Iterator[Client]:
+        client = Client(credentials)
+        opened.append(client)
+        yield client
+        opened.remove(client)
+
+    container = Container()
+    container.register(Client, factory=create_client)
+
+    for _ in range(5):
+        container.resolve(Service)
+        container.invalidate(Credentials)
+
+    assert opened == []
+
+    client = container.resolve(Client)
+    container.close()
+
+    assert client not in opened
+
+
+def test_invalidate_sub_containers():
+    container = Container()
+    container.register(Credentials, value=Credentials())
+    sub_container = container.sub_container()
+    service = sub_container.resolve(Service)
+
+    container.register(Credentials, value=Credentials("second"))
+    container.invalidate(Credentials)
+
+    assert sub_container.resolve(Service) is not service
+    assert sub_container.resolve(Service).client.credentials.token == "second"
+
+
+def test_invalidate_frozen():
+    with pytest.raises(ContainerFrozenError):
+        Container().freeze().invalidate(Credentials)
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from inseminator import Container, Depends, Lazy
+from inseminator.lazy import force, is_constructed
+
+
+def test_lazy_constructor_parameter():
+    test_fn = MagicMock()
+
+    class HeavyClient:
+        def __init__(self) -> None:
+            test_fn()
+            self.x = 1
+
+        def get(self) -> int:
+            return self.x
+
+    class Service:
+        def __init__(self, client: Lazy[HeavyClient]) -> None:
+            self.client = client
+
+    for container in (Container(), Container(compiled=True)):
+        test_fn.reset_mock()
+        service = container.resolve(Service)
+
+        test_fn.assert_not_called()
+        assert not is_constructed(service.client)
+
+        assert service.client.get() == 1
+        assert service.client.x == 1
+        assert "get" in vars(service.client)
+        assert isinstance(force(service.client), HeavyClient)
+        test_fn.assert_called_once()
+
+
+def test_lazy_uses_registered_dependency():
+    class Client:
+        ...
+
+    class Service:
+        def __init__(self, client: Lazy[Client]) -> None:
+            self.client = client
+
+    client = Client()
+    container = Container()
+    service = container.resolve(Service)
+    container.register(Client, value=client)
+
+    assert force(service.client) is client
+
+
+def test_lazy_depends():
+    test_fn = MagicMock()
+
+    class Client:
+        def __init__(self) -> None:
+            test_fn()
+            self.x = 1
+
+    container = Container()
+
+    @container.inject
+    def handler(use_client: bool, client: Client = Depends(Lazy[Client])) -> int:
+        return client.x if use_client else 0
+
+    assert handler(False) == 0
+    test_fn.assert_not_called()
+
+    assert handler(True) == 1
+    assert handler(True) == 1
+    test_fn.assert_called_once()
+
+
+def test_lazy_proxy_protocols():
+    proxy = Lazy(lambda: [1, 2, 3])
+
+    assert len(proxy) == 3
+    assert list(proxy) == [1, 2, 3]
+    assert proxy[0] == 1
+    assert 2 in proxy
+    assert proxy
+
+    counter = Lazy(lambda: MagicMock(return_value=5))
+    assert counter() == 5
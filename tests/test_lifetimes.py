@@ -0,0 +1,107 @@
+from threading import Thread
+from time import sleep
+from typing import Protocol
+from unittest.mock import MagicMock
+
+import pytest
+
+from inseminator import Container, Depends, Scoped, Singleton, Transient
+from inseminator.exceptions import ContainerRegisterError
+
+
+def test_singleton_is_constructed_lazily_once():
+    test_fn = MagicMock()
+
+    class Dependency:
+        def __init__(self) -> None:
+            sleep(0.05)
+            test_fn()
+
+    container = Container()
+    container.register(Dependency, lifetime=Singleton)
+
+    test_fn.assert_not_called()
+
+    threads = [Thread(target=container.resolve, args=(Dependency,)) for _ in range(5)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    test_fn.assert_called_once()
+    assert container.resolve(Dependency) is container.sub_container().resolve(Dependency)
+
+
+def test_transient_is_never_cached():
+    class Dependency:
+        ...
+
+    class Client:
+        def __init__(self, dependency: Dependency) -> None:
+            self.dependency = dependency
+
+    container = Container()
+    container.register(Dependency, lifetime=Transient)
+
+    assert container.resolve(Dependency) is not container.resolve(Dependency)
+    assert container.resolve(Client).dependency is not container.sub_container().resolve(Dependency)
+
+    @container.inject
+    def handler(dependency: Dependency = Depends(Dependency)) -> Dependency:
+        return dependency
+
+    assert handler() is not handler()
+
+
+def test_scoped_per_sub_container():
+    class Dependency(Protocol):
+        x: int
+
+    class Dependency1:
+        x = 1
+
+    class Dependency2:
+        x = 2
+
+    class Client:
+        def __init__(self, dependency: Dependency) -> None:
+            self.x = dependency.x
+
+    container = Container()
+    container.register(Dependency, value=Dependency1())
+    container.register(Client, lifetime=Scoped)
+
+    sub_container_1 = container.sub_container()
+    sub_container_2 = container.sub_container()
+    sub_container_2.register(Dependency, value=Dependency2())
+
+    assert container.resolve(Client) is container.resolve(Client)
+    assert sub_container_1.resolve(Client) is sub_container_1.resolve(Client)
+    assert sub_container_1.resolve(Client) is not container.resolve(Client)
+    assert sub_container_1.resolve(Client).x == 1
+    assert sub_container_2.resolve(Client).x == 2
+
+
+def test_lifetime_with_factory_and_configured_provider():
+    def create_value() -> int:
+        return 1
+
+    container = Container()
+    container.register(int, factory=create_value, lifetime=Singleton())
+
+    assert container.resolve(int) == 1
+
+
+def test_invalid_lifetime_registrations():
+    async def create_value() -> int:
+        return 1
+
+    container = Container()
+
+    with pytest.raises(ContainerRegisterError):
+        container.register(int, value=1, lifetime=Singleton)
+
+    with pytest.raises(ContainerRegisterError):
+        container.register(int, factory=create_value, lifetime=Singleton)
@@ -0,0 +1,137 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from inseminator import Container, Depends, Singleton
+from inseminator.metrics import ResolutionEvent, ResolutionListener
+
+
+class Client:
+    pass
+
+
+class Service:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+class Handler:
+    def __init__(self, service: Service, client: Client) -> None:
+        self.service = service
+        self.client = client
+
+
+class Collector(ResolutionListener):
+    def __init__(self) -> None:
+        self.events: List[ResolutionEvent] = []
+
+    def on_resolution(self, event: ResolutionEvent) -> None:
+        self.events.append(event)
+
+
+def summary(collector: Collector):
+    return [(e.dependency, e.cache_hit, e.parent) for e in collector.events]
+
+
+def test_listener_reports_constructed_dependencies():
+    collector = Collector()
+    container = Container(listener=collector)
+
+    container.resolve(Service)
+
+    assert summary(collector) == [(Client, False, Service), (Service, False, None)]
+    assert all(e.duration >= 0 and e.scope_depth == 0 for e in collector.events)
+    assert collector.events[1].duration >= collector.events[0].duration
+
+
+def test_listener_reports_cache_hits():
+    collector = Collector()
+    container = Container(listener=collector)
+    container.register(Client, value=Client())
+
+    container.resolve(Handler)
+
+    assert summary(collector) == [
+        (Client, True, Service),
+        (Service, False, Handler),
+        (Client, True, Handler),
+        (Handler, False, None),
+    ]
+
+
+def test_listener_singleton_reports_construction_once():
+    collector = Collector()
+    container = Container(listener=collector)
+    container.register(Client, lifetime=Singleton)
+
+    container.resolve(Service)
+    container.resolve(Client)
+
+    assert summary(collector) == [(Client, False, Service), (Service, False, None), (Client, True, None)]
+
+
+def test_listener_scope_depth():
+    collector = Collector()
+    container = Container(listener=collector).sub_container().sub_container()
+
+    container.resolve(Client)
+
+    assert [e.scope_depth for e in collector.events] == [2]
+
+
+def test_listener_inject_scoped():
+    collector = Collector()
+    container = Container(compiled=True, listener=collector)
+
+    @container.inject_scoped
+    def function(service: Service = Depends(Service)) -> None:
+        ...
+
+    function()
+    collector.events.clear()
+    function()
+
+    assert summary(collector) == [(Client, True, Service), (Service, False, None)]
+
+
+def test_set_listener():
+    collector = Collector()
+    container = Container()
+    container.resolve(Client)
+    container.set_listener(collector)
+    container.resolve(Service)
+    container.set_listener(None)
+    container.resolve(Handler)
+
+    assert summary(collector) == [(Client, True, Service), (Service, False, None)]
+
+
+def test_listener_aresolve():
+    collector = Collector()
+    container = Container(listener=collector)
+
+    async def create_client() -> Client:
+        return Client()
+
+    container.register(Client, factory=create_client)
+    asyncio.run(container.aresolve(Service))
+    asyncio.run(container.aresolve(Client))
+
+    assert summary(collector) == [
+        (create_client, False, Client),
+        (Client, False, Service),
+        (Service, False, None),
+        (Client, True, None),
+    ]
+
+
+def test_listener_resolve_parallel():
+    collector = Collector()
+    container = Container(listener=collector)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        container.resolve_parallel(Handler, executor)
+
+    events = {(e.dependency, e.cache_hit) for e in collector.events}
+    assert events == {(Client, False), (Service, False), (Handler, False)}
+    assert [e.parent for e in collector.events if e.dependency is Handler] == [None]
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import patch
+
+from inseminator import Container, Singleton
+from inseminator.plan import get_plan
+
+
+class Config:
+    pass
+
+
+class Engine:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Request:
+    pass
+
+
+class View:
+    def __init__(self, request: Request, engine: Engine) -> None:
+        self.request = request
+        self.engine = engine
+
+
+def test_overlay_overrides_value():
+    container = Container()
+    request = Request()
+    overlay = container.overlay({Request: request})
+
+    view = overlay.resolve(View)
+
+    assert view.request is request
+    assert overlay.resolve(View) is view
+    assert overlay.resolve(Request) is request
+
+
+def test_overlay_shares_unaffected_dependencies():
+    container = Container()
+
+    first = container.overlay({Request: Request()}).resolve(View)
+    second = container.overlay({Request: Request()}).resolve(View)
+
+    assert first is not second
+    assert first.request is not second.request
+    assert first.engine is second.engine
+    assert container.resolve(Engine) is first.engine
+
+
+def test_overlay_doesnt_modify_parent():
+    container = Container()
+    container.register(Request, value=Request())
+    overlay = container.overlay()
+    request = Request()
+    overlay.register(Request, request)
+
+    assert overlay.resolve(View).request is request
+    assert container.resolve(View).request is not request
+
+
+def test_overlay_registered_dependencies_are_not_constructed_again():
+    container = Container()
+    container.register(Engine, lifetime=Singleton)
+    config = Config()
+
+    engine = container.overlay({Config: config}).resolve(Engine)
+
+    assert engine is container.resolve(Engine)
+    assert engine.config is not config
+
+
+def test_overlay_forced_parameters():
+    container = Container()
+    request = Request()
+
+    view = container.overlay().resolve(View, request=request)
+
+    assert view.request is request
+
+
+def test_overlay_concurrent_requests():
+    container = Container()
+    entered, release = Event(), Event()
+
+    def slow_get_plan(dependency):
+        if dependency is View and not entered.is_set():
+            entered.set()
+            release.wait(5)
+
+        return get_plan(dependency)
+
+    def request(request: Request) -> View:
+        return container.overlay({Request: request}).resolve(View)
+
+    first_request, second_request = Request(), Request()
+
+    with patch("inseminator.resolver.get_plan", slow_get_plan), ThreadPoolExecutor(2) as executor:
+        first = executor.submit(request, first_request)
+        assert entered.wait(5)
+        second = request(second_request)
+        release.set()
+
+        assert first.result().request is first_request
+        assert second.request is second_request
+
+    assert container._resolver.lookup(View) is None
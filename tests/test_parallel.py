@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Protocol
+from unittest.mock import MagicMock
+
+import pytest
+
+from inseminator import Container, Depends
+from inseminator.exceptions import ResolverError
+
+
+def slow_class(name):
+    def __init__(self) -> None:
+        time.sleep(0.1)
+
+    return type(name, (), {"__init__": __init__})
+
+
+ClientOne, ClientTwo, ClientThree, ClientFour, ClientFive = (slow_class(f"Client{i}") for i in range(5))
+
+
+class Service:
+    def __init__(
+        self, c1: ClientOne, c2: ClientTwo, c3: ClientThree, c4: ClientFour, c5: ClientFive, retries: int = 3
+    ) -> None:
+        self.clients = [c1, c2, c3, c4, c5]
+        self.retries = retries
+
+
+def test_resolve_parallel():
+    container = Container()
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        t1 = time.perf_counter()
+        service = container.resolve_parallel(Service, executor, retries=1)
+        dt = time.perf_counter() - t1
+
+    assert dt < 0.3
+    assert service.retries == 1
+    assert [type(c) for c in service.clients] == [ClientOne, ClientTwo, ClientThree, ClientFour, ClientFive]
+    assert container.resolve(Service) is service
+
+
+def test_resolve_parallel_shares_dependencies():
+    test_fn = MagicMock()
+
+    class Shared:
+        def __init__(self) -> None:
+            test_fn()
+
+    class A:
+        def __init__(self, shared: Shared) -> None:
+            self.shared = shared
+
+    class B:
+        def __init__(self, shared: Shared, a: A) -> None:
+            self.shared = shared
+            self.a = a
+
+    with ThreadPoolExecutor() as executor:
+        b = Container().resolve_parallel(B, executor)
+
+    test_fn.assert_called_once()
+    assert b.shared is b.a.shared
+
+
+def test_resolve_parallel_errors():
+    class Dependency(Protocol):
+        ...
+
+    class Client:
+        def __init__(self, dependency: Dependency) -> None:
+            ...
+
+    class Failing:
+        def __init__(self) -> None:
+            raise ValueError("failed")
+
+    class Service:
+        def __init__(self, client: Client, failing: Failing) -> None:
+            ...
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(ResolverError, match="Client.*-> Implementation for Dependency protocol"):
+            Container().resolve_parallel(Client, executor)
+
+        with pytest.raises(ValueError, match="failed"):
+            Container().resolve_parallel(Service, executor, client=None)
+
+
+def test_preload_injected_parallel():
+    container = Container()
+
+    @container.inject
+    def handler_one(c1: ClientOne = Depends(ClientOne), c2: ClientTwo = Depends(ClientTwo)) -> object:
+        return c1
+
+    @container.inject
+    def handler_two(service: Service = Depends(Service), c1: ClientOne = Depends(ClientOne)) -> object:
+        return c1
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        t1 = time.perf_counter()
+        container.preload_injected(executor)
+        dt = time.perf_counter() - t1
+
+    assert dt < 0.3
+    assert handler_one() is handler_two()
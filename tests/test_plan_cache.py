@@ -0,0 +1,88 @@
+import gc
+from unittest.mock import patch
+
+import pytest
+
+from inseminator.container import Container
+from inseminator.exceptions import ResolverError
+from inseminator.plan import PlanCache, get_plan, invalidate_plans, plan_cache
+
+
+def test_plan_is_shared_between_containers():
+    class Dependency:
+        ...
+
+    class Client:
+        def __init__(self, dependency: Dependency, x: int = 1) -> None:
+            self.x = x
+
+    container = Container()
+    container.resolve(Client)
+
+    assert Client in plan_cache
+    assert Dependency in plan_cache
+
+    with patch("inseminator.plan.build_plan") as build_plan:
+        Container().resolve(Client)
+        container.sub_container().resolve(Client)
+
+    build_plan.assert_not_called()
+
+
+def test_plan_content():
+    class Dependency:
+        ...
+
+    class Client:
+        def __init__(self, dependency: Dependency, x: int = 1) -> None:
+            ...
+
+    plan = get_plan(Client)
+
+    assert plan.is_class
+    assert plan.parameter_names == {"dependency", "x", "return"}
+    assert [(p.name, p.hint, p.has_default) for p in plan.parameters] == [
+        ("dependency", Dependency, False),
+        ("x", int, True),
+    ]
+    assert plan.number_of_parameters == 2
+
+
+def test_invalidate_plans():
+    class Client:
+        def __init__(self) -> None:
+            ...
+
+    get_plan(Client)
+    invalidate_plans(Client)
+
+    assert Client not in plan_cache
+
+    get_plan(Client)
+    invalidate_plans()
+
+    assert len(plan_cache) == 0
+
+
+def test_plans_are_weakly_referenced():
+    cache = PlanCache()
+
+    class Client:
+        ...
+
+    cache.get(Client)
+    assert len(cache) == 1
+
+    del Client
+    gc.collect()
+
+    assert len(cache) == 0
+
+
+def test_invalid_dependency_is_not_cached():
+    cache = PlanCache()
+
+    with pytest.raises(ResolverError):
+        cache.get(1)
+
+    assert len(cache) == 0
@@ -0,0 +1,162 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Lock
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from inseminator import Container, Depends, Pooled
+from inseminator.exceptions import ResolverError
+
+
+class Parser:
+    created = 0
+
+    def __init__(self) -> None:
+        Parser.created += 1
+
+
+@pytest.fixture(autouse=True)
+def reset_created() -> None:
+    Parser.created = 0
+
+
+def test_pooled_instance_is_returned_after_call():
+    container = Container()
+    container.register(Parser, lifetime=Pooled(max_size=2))
+
+    @container.inject
+    def handler(parser: Parser = Depends(Parser)) -> Parser:
+        return parser
+
+    assert handler() is handler()
+    assert Parser.created == 1
+
+
+def test_pooled_instances_are_not_shared_between_threads():
+    container = Container()
+    container.register(Parser, lifetime=Pooled(max_size=4))
+    barrier = Barrier(4)
+    lock = Lock()
+    in_use: List[Parser] = []
+
+    @container.inject
+    def handler(parser: Parser = Depends(Parser)) -> None:
+        with lock:
+            assert parser not in in_use
+            in_use.append(parser)
+
+        barrier.wait(timeout=5)
+
+        with lock:
+            in_use.remove(parser)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(handler) for _ in range(8)]:
+            future.result()
+
+    assert Parser.created == 4
+
+
+class Document:
+    def __init__(self, parser: Parser) -> None:
+        self.parser = parser
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_pooled_indirect_dependency_is_checked_out(parallel):
+    container = Container()
+    container.register(Parser, lifetime=Pooled(max_size=1))
+
+    @container.inject
+    def handler(document: Document = Depends(Document)) -> Document:
+        return document
+
+    if parallel:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            container.preload_injected(executor)
+    else:
+        container.preload_injected()
+
+    first, second = handler(), handler()
+
+    assert first is not second
+    assert first.parser is second.parser
+    assert Parser.created == 1
+
+
+def test_pool_is_bounded():
+    container = Container()
+    container.register(Parser, lifetime=Pooled(max_size=1, timeout=0.01))
+
+    @container.inject
+    def outer(parser: Parser = Depends(Parser)) -> None:
+        inner()
+
+    @container.inject
+    def inner(parser: Parser = Depends(Parser)) -> None:
+        pass
+
+    with pytest.raises(ResolverError, match="No pooled instance"):
+        outer()
+
+    inner()
+    assert Parser.created == 1
+
+
+def test_pooled_min_idle_on_preload():
+    container = Container()
+    container.register(Parser, lifetime=Pooled(max_size=4, min_idle=2))
+
+    @container.inject
+    def handler(parser: Parser = Depends(Parser)) -> None:
+        pass
+
+    container.preload_injected()
+    assert Parser.created == 2
+
+
+def test_pooled_passed_argument_is_not_checked_out():
+    container = Container()
+    container.register(Parser, lifetime=Pooled(max_size=1, timeout=0.01))
+    parser = Parser()
+
+    @container.inject
+    def handler(parser: Parser = Depends(Parser)) -> Parser:
+        return parser
+
+    assert handler(parser=parser) is parser
+    assert Parser.created == 1
+
+
+def test_pooled_in_scope():
+    container = Container()
+    container.register(Parser, lifetime=Pooled(max_size=1))
+
+    @container.inject_scoped
+    def handler(parser: Parser = Depends(Parser)) -> Parser:
+        return parser
+
+    assert handler() is handler()
+    assert Parser.created == 1
+
+
+def test_pooled_metrics():
+    metrics = MagicMock()
+    container = Container(metrics=metrics)
+    container.register(Parser, lifetime=Pooled(max_size=2))
+
+    @container.inject_scoped
+    def handler(parser: Parser = Depends(Parser)) -> None:
+        pass
+
+    handler()
+
+    values = {c.args[0]: c.args[1] for c in metrics.save_metric.call_args_list}
+    assert values[f"{__name__}.Parser.utilisation"] == 0.5
+    assert values[f"{__name__}.Parser.wait"] >= 0
+
+
+def test_pooled_invalid_size():
+    with pytest.raises(ValueError):
+        Pooled(max_size=1, min_idle=2)
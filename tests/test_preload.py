@@ -0,0 +1,142 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from inseminator import Container, Depends
+
+release = Event()
+
+
+class Fast:
+    pass
+
+
+class Slow:
+    def __init__(self) -> None:
+        release.wait(5)
+
+
+class Broken:
+    def __init__(self) -> None:
+        raise ValueError("broken")
+
+
+@pytest.fixture(autouse=True)
+def reset_release():
+    release.clear()
+    yield
+    release.set()
+
+
+def make_container():
+    container = Container()
+
+    @container.inject
+    def fast(dependency: Fast = Depends(Fast)) -> Fast:
+        return dependency
+
+    @container.inject
+    def slow(dependency: Slow = Depends(Slow)) -> Slow:
+        return dependency
+
+    return container, fast, slow
+
+
+def test_preload_background():
+    container, fast, slow = make_container()
+
+    handle = container.preload_injected_background()
+
+    assert handle.wait(timeout=5, functions=[fast])
+    assert not handle.wait(timeout=0.05, functions=[slow])
+    assert not handle.done()
+    assert handle.total == 2
+    assert handle.completed == 1
+
+    release.set()
+
+    assert handle.wait(timeout=5)
+    assert handle.done()
+    assert handle.completed == 2
+    assert handle.errors == {}
+    assert slow() is slow()
+
+
+def test_preload_background_parallel():
+    container, fast, slow = make_container()
+    release.set()
+
+    with ThreadPoolExecutor(4) as executor:
+        handle = container.preload_injected_background(executor)
+        assert handle.wait(timeout=5)
+
+    assert handle.completed == 2
+    assert handle.failed == 0
+
+
+def test_preload_background_parallel_partial():
+    container, fast, slow = make_container()
+
+    with ThreadPoolExecutor(4) as executor:
+        handle = container.preload_injected_background(executor)
+
+        assert handle.wait(timeout=5, functions=[fast])
+        assert handle.completed == 1
+        assert isinstance(fast(), Fast)
+        assert not handle.done()
+
+        release.set()
+        assert handle.wait(timeout=5)
+
+    assert handle.completed == 2
+    assert handle.failed == 0
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_preload_background_errors(parallel):
+    container, fast, slow = make_container()
+    release.set()
+
+    @container.inject
+    def broken(dependency: Broken = Depends(Broken)) -> None:
+        ...
+
+    with ThreadPoolExecutor(4) as executor:
+        handle = container.preload_injected_background(executor if parallel else None)
+        assert handle.wait(timeout=5)
+
+    assert handle.completed == 3
+    assert handle.failed == 1
+    assert list(handle.errors) == [f"{__name__}.test_preload_background_errors.<locals>.broken"]
+    assert isinstance(handle.errors[f"{__name__}.test_preload_background_errors.<locals>.broken"], ValueError)
+    assert isinstance(fast(), Fast)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_preload_background_concurrent_call(parallel):
+    constructed = []
+
+    class Counted:
+        def __init__(self) -> None:
+            constructed.append(self)
+            release.wait(5)
+
+    container = Container()
+
+    @container.inject
+    def counted(dependency: Counted = Depends(Counted)) -> Counted:
+        return dependency
+
+    with ThreadPoolExecutor(4) as executor:
+        handle = container.preload_injected_background(executor if parallel else None)
+        while not constructed:
+            release.wait(0.01)
+
+        result = executor.submit(counted)
+        release.set()
+
+        assert handle.wait(timeout=5)
+        assert result.result(timeout=5) is constructed[0]
+
+    assert len(constructed) == 1
@@ -0,0 +1,226 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import Iterator, List
+
+from inseminator import Container, Depends, Scoped, Transient
+
+
+class Engine:
+    pass
+
+
+class Session:
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+
+class Repository:
+    def __init__(self, session: Session, engine: Engine) -> None:
+        self.session = session
+        self.engine = engine
+
+
+class Handler:
+    def __init__(self, repository: Repository, session: Session) -> None:
+        self.repository = repository
+        self.session = session
+
+
+def test_inject_scoped_reuses_shared_dependencies():
+    container = Container()
+
+    @container.inject_scoped
+    def function(repository: Repository = Depends(Repository)) -> Repository:
+        return repository
+
+    first, second = function(), function()
+
+    assert first is not second
+    assert first.session is second.session
+    assert first.engine is second.engine
+
+
+def test_inject_scoped_shares_dependencies_with_container():
+    container = Container()
+
+    @container.inject_scoped
+    def function(repository: Repository = Depends(Repository)) -> Repository:
+        return repository
+
+    @container.inject
+    def cached(engine: Engine = Depends(Engine)) -> Engine:
+        return engine
+
+    engine = function().engine
+
+    assert container.resolve(Engine) is engine
+    assert cached() is engine
+
+    other = Container()
+    other_engine = other.resolve(Engine)
+
+    @other.inject_scoped
+    def other_function(repository: Repository = Depends(Repository)) -> Repository:
+        return repository
+
+    @other.inject
+    def other_cached(engine: Engine = Depends(Engine)) -> Engine:
+        return engine
+
+    assert other_function().engine is other_engine
+    assert other_cached() is other_engine
+
+
+def test_inject_scoped_scoped_dependency_per_call():
+    container = Container()
+    container.register(Session, lifetime=Scoped)
+
+    @container.inject_scoped
+    def function(handler: Handler = Depends(Handler)) -> Handler:
+        return handler
+
+    first, second = function(), function()
+
+    assert first.session is first.repository.session
+    assert first.session is not second.session
+    assert first.repository is not second.repository
+    assert first.session.engine is second.session.engine
+    assert first.repository.engine is second.repository.engine
+
+
+def test_inject_scoped_transient_dependency():
+    container = Container()
+    container.register(Session, lifetime=Transient)
+
+    @container.inject_scoped
+    def function(handler: Handler = Depends(Handler)) -> Handler:
+        return handler
+
+    handler = function()
+
+    assert handler.session is not handler.repository.session
+    assert handler.session.engine is handler.repository.session.engine
+
+
+def test_scoped_outside_of_inject_scoped():
+    container = Container()
+    container.register(Session, lifetime=Scoped)
+
+    @container.inject_scoped
+    def function(session: Session = Depends(Session)) -> Session:
+        return session
+
+    assert container.resolve(Session) is container.resolve(Session)
+    assert function() is not container.resolve(Session)
+
+
+def test_shared_dependencies_constructed_once_per_container():
+    constructed: List[Engine] = []
+    release = Event()
+
+    class SlowEngine(Engine):
+        def __init__(self) -> None:
+            constructed.append(self)
+            release.wait(0.1)
+
+    container = Container()
+    container.register(Session, lifetime=Scoped)
+
+    class Unit:
+        def __init__(self, engine: SlowEngine, session: Session) -> None:
+            self.engine = engine
+
+    @container.inject_scoped
+    def first(unit: Unit = Depends(Unit)) -> Unit:
+        return unit
+
+    @container.inject_scoped
+    def second(unit: Unit = Depends(Unit)) -> Unit:
+        return unit
+
+    with ThreadPoolExecutor(4) as executor:
+        units = [executor.submit(function).result for function in [first, second, first, second]]
+        release.set()
+        units = [unit() for unit in units]
+
+    with container.scope():
+        units.append(container.resolve(Unit))
+
+    assert len(constructed) == 1
+    assert all(unit.engine is constructed[0] for unit in units)
+
+
+def test_clear_drops_shared_dependencies():
+    container = Container()
+
+    @container.inject_scoped
+    def function(repository: Repository = Depends(Repository)) -> Repository:
+        return repository
+
+    first = function()
+    container.clear()
+
+    assert function().engine is not first.engine
+
+
+def test_container_scope():
+    container = Container()
+    container.register(Session, lifetime=Scoped)
+
+    with container.scope():
+        session = container.resolve(Session)
+        assert container.resolve(Session) is session
+
+        handler = container.resolve(Handler)
+        assert handler.session is session
+        assert handler.repository.session is session
+
+    with container.scope():
+        assert container.resolve(Session) is not session
+        assert container.resolve(Handler).session is not session
+        # dependencies which are not scoped are shared between scopes
+        assert container.resolve(Session).engine is session.engine
+
+
+def test_container_scope_teardown():
+    events: List[str] = []
+
+    def create_session(engine: Engine) -> Iterator[Session]:
+        events.append("open")
+        yield Session(engine)
+        events.append("close")
+
+    container = Container()
+    container.register(Session, factory=create_session, lifetime=Scoped)
+
+    with container.scope():
+        container.resolve(Session)
+        container.resolve(Session)
+        assert events == ["open"]
+
+    assert events == ["open", "close"]
+
+
+def test_container_ascope_shared_with_tasks():
+    container = Container()
+    container.register(Session, lifetime=Scoped)
+
+    async def request() -> List[Session]:
+        async with container.ascope():
+            session = await container.aresolve(Session)
+
+            async def task() -> Session:
+                await asyncio.sleep(0)
+                return await container.aresolve(Session)
+
+            return [session, *await asyncio.gather(task(), task())]
+
+    async def main() -> List[List[Session]]:
+        return list(await asyncio.gather(request(), request()))
+
+    first, second = asyncio.run(main())
+
+    assert first[0] is first[1] is first[2]
+    assert second[0] is second[1] is second[2]
+    assert first[0] is not second[0]
@@ -0,0 +1,97 @@
+import gc
+import sys
+
+import pytest
+
+from inseminator.scoped_dict import ScopedDict
+
+
+def make_chain(depth):
+    chain = [ScopedDict()]
+
+    for _ in range(depth):
+        chain.append(ScopedDict(chain[-1]))
+
+    return chain
+
+
+def test_lookup_in_parents():
+    root, middle, leaf = make_chain(2)
+    root["a"] = 1
+    middle["b"] = 2
+
+    assert leaf["a"] == 1
+    assert leaf["b"] == 2
+    assert "a" in leaf
+    assert "c" not in leaf
+    assert leaf.lookup("c") is None
+    assert leaf.lookup("c", 3) == 3
+
+    with pytest.raises(KeyError):
+        leaf["c"]
+
+
+def test_chain_deeper_than_recursion_limit():
+    chain = make_chain(sys.getrecursionlimit() * 2)
+    root, leaf = chain[0], chain[-1]
+    root["a"] = 1
+
+    assert leaf["a"] == 1
+
+    root["a"] = 2
+
+    assert leaf["a"] == 2
+    assert chain[len(chain) // 2]["a"] == 2
+    assert leaf.flatten() == {"a": 2}
+
+
+def test_cache_is_invalidated_by_ancestor_mutation():
+    root, middle, leaf = make_chain(2)
+    root["a"] = 1
+
+    assert leaf["a"] == 1
+    assert "b" not in leaf
+
+    version = leaf.version
+    middle["a"] = 2
+    root["b"] = 3
+
+    assert leaf.version > version
+    assert leaf["a"] == 2
+    assert leaf["b"] == 3
+
+    del middle["a"]
+    root.pop("b")
+
+    assert leaf["a"] == 1
+    assert "b" not in leaf
+
+    root.clear()
+
+    assert "a" not in leaf
+
+    root.update(a=4)
+    root.setdefault("b", 5)
+
+    assert leaf["a"] == 4
+    assert leaf["b"] == 5
+
+
+def test_own_keys_shadow_parent():
+    root, leaf = make_chain(1)
+    root["a"] = 1
+
+    assert leaf["a"] == 1
+
+    leaf["a"] = 2
+
+    assert leaf["a"] == 2
+    assert root["a"] == 1
+
+
+def test_children_are_not_kept_alive():
+    root = ScopedDict()
+    ScopedDict(root)
+    gc.collect()
+
+    root["a"] = 1
@@ -0,0 +1,130 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+
+from inseminator import Container, Depends, Scoped, Singleton, Transient
+
+events: List[str] = []
+
+
+@pytest.fixture(autouse=True)
+def clear_events() -> None:
+    events.clear()
+
+
+class Engine:
+    pass
+
+
+class Session:
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+
+def create_engine() -> Iterator[Engine]:
+    events.append("engine")
+    yield Engine()
+    events.append("engine closed")
+
+
+@contextmanager
+def create_session(engine: Engine) -> Iterator[Session]:
+    events.append("session")
+    yield Session(engine)
+    events.append("session closed")
+
+
+def test_generator_factory():
+    container = Container()
+    container.register(Engine, factory=create_engine)
+
+    assert isinstance(container.resolve(Engine), Engine)
+    assert events == ["engine"]
+
+    container.close()
+
+    assert events == ["engine", "engine closed"]
+
+
+def test_close_in_reverse_construction_order():
+    container = Container()
+    container.register(Engine, factory=create_engine, lifetime=Singleton)
+    container.register(Session, factory=create_session, lifetime=Singleton)
+
+    session = container.resolve(Session)
+    assert session.engine is container.resolve(Engine)
+
+    container.close()
+
+    assert events == ["engine", "session", "session closed", "engine closed"]
+
+
+def test_teardown_runs_once():
+    container = Container()
+    container.register(Engine, factory=create_engine, lifetime=Singleton)
+
+    container.resolve(Engine)
+    container.close()
+    container.close()
+
+    assert events == ["engine", "engine closed"]
+
+
+def test_transient_teardown_on_close():
+    container = Container()
+    container.register(Engine, factory=create_engine, lifetime=Transient)
+
+    assert container.resolve(Engine) is not container.resolve(Engine)
+    container.close()
+
+    assert events == ["engine", "engine", "engine closed", "engine closed"]
+
+
+def test_transient_teardown_after_injected_call():
+    container = Container()
+    container.register(Engine, factory=create_engine, lifetime=Transient)
+
+    @container.inject
+    def handler(engine: Engine = Depends(Engine)) -> Engine:
+        events.append("handler")
+        return engine
+
+    handler()
+    handler()
+
+    assert events == ["engine", "handler", "engine closed"] * 2
+
+
+def test_scoped_teardown_at_scope_exit():
+    container = Container()
+    container.register(Engine, factory=create_engine, lifetime=Singleton)
+    container.register(Session, factory=create_session, lifetime=Scoped)
+
+    @container.inject_scoped
+    def handler(session: Session = Depends(Session)) -> Session:
+        events.append("handler")
+        return session
+
+    first = handler()
+    assert events == ["engine", "session", "handler", "session closed"]
+
+    assert handler() is not first
+    assert events[-3:] == ["session", "handler", "session closed"]
+
+    container.close()
+    assert events[-1] == "engine closed"
+
+
+def test_scoped_teardown_when_handler_raises():
+    container = Container()
+    container.register(Session, factory=create_session, lifetime=Scoped)
+
+    @container.inject_scoped
+    def handler(session: Session = Depends(Session)) -> None:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        handler()
+
+    assert events == ["session", "session closed"]
@@ -0,0 +1,130 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from typing import Iterator, List
+
+from inseminator import Container, Depends, ThreadLocal
+
+
+class Client:
+    pass
+
+
+def test_thread_local_instance_per_thread():
+    container = Container()
+    container.register(Client, lifetime=ThreadLocal)
+
+    @container.inject
+    def handler(client: Client = Depends(Client)) -> Client:
+        return client
+
+    assert handler() is handler()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(handler).result()
+        assert executor.submit(handler).result() is other
+
+    assert other is not handler()
+
+
+def test_thread_local_in_depends():
+    container = Container()
+
+    @container.inject
+    def handler(client: Client = Depends(Client, lifetime=ThreadLocal)) -> Client:
+        return client
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        clients = {id(executor.submit(handler).result()) for _ in range(4)}
+
+    assert handler() is handler()
+    assert 1 <= len(clients) <= 2
+
+
+class NamedClient(Client):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def test_thread_local_in_depends_uses_registration():
+    container = Container()
+    container.register(Client, factory=lambda: NamedClient("registered"), eager=True)
+
+    @container.inject
+    def handler(client: Client = Depends(Client, lifetime=ThreadLocal)) -> Client:
+        return client
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(handler).result()
+
+    assert isinstance(other, NamedClient) and other.name == "registered"
+    assert handler() is handler() is not other
+    assert handler() is not container.resolve(Client)
+
+
+def test_thread_local_in_depends_uses_registered_provider():
+    container = Container()
+    container.register(Client, factory=NamedClient, parameters={"name": "registered"})
+
+    @container.inject
+    def handler(client: Client = Depends(Client, lifetime=ThreadLocal)) -> Client:
+        return client
+
+    assert handler().name == "registered"
+    assert handler() is not container.resolve(Client)
+
+
+class Repository:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+
+def test_thread_local_indirect_dependency():
+    container = Container()
+    container.register(Client, lifetime=ThreadLocal)
+
+    @container.inject
+    def handler(repository: Repository = Depends(Repository)) -> Client:
+        return repository.client
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(handler).result()
+
+    assert handler() is handler() is container.resolve(Client)
+    assert other is not handler()
+
+
+def test_thread_local_teardown_on_thread_exit():
+    events: List[str] = []
+
+    def create_client() -> Iterator[Client]:
+        events.append("created")
+        yield Client()
+        events.append("released")
+
+    container = Container()
+    container.register(Client, factory=create_client, lifetime=ThreadLocal)
+
+    @container.inject
+    def handler(client: Client = Depends(Client)) -> None:
+        pass
+
+    thread = Thread(target=handler)
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert events == ["created", "released"]
+
+
+def test_thread_local_cleared_with_cache():
+    container = Container()
+
+    @container.inject
+    def handler(client: Client = Depends(Client, lifetime=ThreadLocal)) -> Client:
+        return client
+
+    client = handler()
+    container.clear()
+
+    assert handler() is not client